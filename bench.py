@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for H4CK3R App Manager.
+
+Builds a synthetic macOS-like fixture (Applications with Info.plists, a
+Cellar and Caskroom, pip dist-info dirs, a receipts DB) in a temp directory,
+puts stub brew / pip3 / pkgutil / ps / mdls executables first on PATH, then times
+every scanner, the search filter and the packages table at each size.
+Runs anywhere PyQt6 is installed; the GUI parts use the offscreen platform.
+
+    python3 bench.py run                          # 1k, 10k and 100k items
+    python3 bench.py run --sizes 1000 --latency-ms 5 --skip table
+    python3 bench.py compare bench_results/a.json bench_results/b.json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import struct
+import plistlib
+import argparse
+import platform
+import tempfile
+import subprocess
+import statistics
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+HERE = Path(__file__).resolve().parent
+BENCH_SCHEMA = "h4ck3r.bench"
+BENCH_SCHEMA_VERSION = 1
+DEFAULT_SIZES = (1000, 10000, 100000)
+# share of the total item count per source
+DEFAULT_MIX = {"app": 0.10, "formula": 0.25, "cask": 0.10, "pip": 0.45, "pkg": 0.10}
+BENCHMARKS = ("applications", "brew-formulae", "brew-casks", "pip", "pkgutil",
+              "processes", "search", "outdated", "slim", "table", "memory")
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  FIXTURES
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+WORDS = ("lib", "core", "kit", "py", "open", "net", "data", "ssl", "xml", "gnu",
+         "qt", "node", "rust", "go", "img", "zip", "video", "audio", "font", "db")
+
+STUBS = {
+    "brew": """\
+case "$*" in
+  "list --formula --versions") cat "$FX/out/brew_formula.txt" ;;
+  "list --cask --versions") cat "$FX/out/brew_cask.txt" ;;
+  "--cellar") echo "$FX/Cellar" ;;
+  "--caskroom") echo "$FX/Caskroom" ;;
+  "--cache") echo "$FX/cache/Homebrew" ;;
+  "--prefix") echo "$FX" ;;
+  *) exit 1 ;;
+esac
+""",
+    "pip3": """\
+case "$1" in
+  list) cat "$FX/out/pip_list.json" ;;
+  --version) echo "pip 24.0 from $FX/site-packages/pip (python 3.12)" ;;
+  *) exit 1 ;;
+esac
+""",
+    "pkgutil": """\
+case "$1" in
+  --pkgs) cat "$FX/out/pkgs.txt" ;;
+  --pkg-info) cat "$FX/receipts/$2.info" 2>/dev/null || exit 1 ;;
+  --files) cat "$FX/receipts/$2.files" 2>/dev/null || exit 1 ;;
+  *) exit 1 ;;
+esac
+""",
+    "ps": """\
+cat "$FX/out/ps.txt"
+""",
+    "mdls": """\
+shift 5
+for p in "$@"; do printf '2026-01-01 09:00:00 +0000\\0'; done
+""",
+}
+
+
+def _name(rng, i):
+    return f"{rng.choice(WORDS)}{rng.choice(WORDS)}-{i}"
+
+
+def _version(rng):
+    return f"{rng.randint(0, 20)}.{rng.randint(0, 30)}.{rng.randint(0, 9)}"
+
+
+def _write_files(folder, count, size):
+    folder.mkdir(parents=True, exist_ok=True)
+    blob = bytes(size)
+    for j in range(count):
+        (folder / f"f{j}.bin").write_bytes(blob)
+
+
+def _fat_macho(arm64):
+    """Universal Mach-O: a fat table, then an x86_64 and an arm64 slice at 4 KiB offsets."""
+    x86 = b"\xcf\xfa\xed\xfe" + (0x01000007).to_bytes(4, "little") + bytes(len(arm64) - 8)
+    second = 4096 * (1 + (len(x86) + 4095) // 4096)
+    head = struct.pack(">II", 0xCAFEBABE, 2)
+    head += struct.pack(">iiIII", 0x01000007, 3, 4096, len(x86), 12)
+    head += struct.pack(">iiIII", 0x0100000C, 0, second, len(arm64), 14)
+    return head.ljust(4096, b"\0") + x86.ljust(second - 4096, b"\0") + arm64
+
+
+def build_fixture(root, total, mix=None, files_per_item=4, file_size=512, seed=1):
+    """Create a fixture for ``total`` items under ``root``; returns per-source counts."""
+    rng = random.Random(seed)
+    mix = mix or DEFAULT_MIX
+    counts = {k: max(1, int(total * share)) for k, share in mix.items()}
+    root = Path(root)
+    out = root / "out"
+    out.mkdir(parents=True, exist_ok=True)
+
+    # /Applications: alternate XML and binary Info.plists
+    for i in range(counts["app"]):
+        name = _name(rng, i)
+        contents = root / "Applications" / f"{name}.app" / "Contents"
+        (contents / "MacOS").mkdir(parents=True, exist_ok=True)
+        info = {"CFBundleShortVersionString": _version(rng), "CFBundleExecutable": name,
+                "CFBundleIdentifier": f"com.bench.{name}", "LSMinimumSystemVersion": "12.0"}
+        fmt = plistlib.FMT_BINARY if i % 2 else plistlib.FMT_XML
+        with open(contents / "Info.plist", "wb") as f:
+            plistlib.dump(info, f, fmt=fmt)
+        # thin arm64 Mach-O header, so the architecture read has something to find;
+        # every third app is universal (x86_64 + arm64) for the slimming report
+        thin = b"\xcf\xfa\xed\xfe" + (0x0100000C).to_bytes(4, "little") + bytes(file_size)
+        exe = contents / "MacOS" / name
+        exe.write_bytes(_fat_macho(thin) if i % 3 == 0 else thin)
+        exe.chmod(0o755)
+        _write_files(contents / "Resources", files_per_item, file_size)
+
+    # Cellar kegs + `brew list --formula --versions`
+    lines = []
+    for i in range(counts["formula"]):
+        name, ver = _name(rng, i), _version(rng)
+        _write_files(root / "Cellar" / name / ver / "lib", files_per_item, file_size)
+        lines.append(f"{name} {ver}")
+    (out / "brew_formula.txt").write_text("\n".join(lines) + "\n")
+
+    lines = []
+    for i in range(counts["cask"]):
+        name, ver = _name(rng, i), _version(rng)
+        (root / "Caskroom" / name / ver).mkdir(parents=True, exist_ok=True)
+        lines.append(f"{name} {ver}")
+    (out / "brew_cask.txt").write_text("\n".join(lines) + "\n")
+
+    # site-packages dist-info dirs + `pip3 list --format=json`
+    pkgs = []
+    site = root / "site-packages"
+    for i in range(counts["pip"]):
+        name, ver = _name(rng, i), _version(rng)
+        info = site / f"{name.replace('-', '_')}-{ver}.dist-info"
+        info.mkdir(parents=True, exist_ok=True)
+        (info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: {ver}\n")
+        (info / "RECORD").write_text(f"{name.replace('-', '_')}/__init__.py,,{file_size}\n")
+        _write_files(site / name.replace("-", "_"), max(1, files_per_item // 2), file_size)
+        pkgs.append({"name": name, "version": ver})
+    (site / "pip").mkdir(parents=True, exist_ok=True)
+    (out / "pip_list.json").write_text(json.dumps(pkgs))
+
+    # receipts DB: <id>.plist as on macOS, plus the text pkgutil would print
+    receipts = root / "receipts"
+    receipts.mkdir(parents=True, exist_ok=True)
+    ids = []
+    for i in range(counts["pkg"]):
+        pkg_id, ver = f"com.bench.pkg.{_name(rng, i)}", _version(rng)
+        with open(receipts / f"{pkg_id}.plist", "wb") as f:
+            plistlib.dump({"PackageIdentifier": pkg_id, "PackageVersion": ver,
+                           "InstallPrefixPath": "/", "InstallDate": datetime(2024, 1, 1)}, f)
+        (receipts / f"{pkg_id}.info").write_text(
+            f"package-id: {pkg_id}\nversion: {ver}\nvolume: /\nlocation: /\n")
+        (receipts / f"{pkg_id}.files").write_text(
+            "\n".join(f"usr/local/share/{pkg_id}/f{j}" for j in range(files_per_item)) + "\n")
+        ids.append(pkg_id)
+    (out / "pkgs.txt").write_text("\n".join(ids) + "\n")
+
+    # `ps aux`
+    ps = ["USER PID %CPU %MEM VSZ RSS TT STAT STARTED TIME COMMAND"]
+    for i in range(max(200, total // 50)):
+        ps.append(f"bench {1000 + i} {rng.random() * 20:.1f} {rng.random() * 5:.1f} 1 1 ?? S "
+                  f"9:00AM 0:00.01 /Applications/{_name(rng, i)}.app/Contents/MacOS/x")
+    (out / "ps.txt").write_text("\n".join(ps) + "\n")
+    return counts
+
+
+def install_stubs(root):
+    """Write the stub executables into ``root/bin``; returns the directory."""
+    bindir = Path(root) / "bin"
+    bindir.mkdir(parents=True, exist_ok=True)
+    for tool, body in STUBS.items():
+        path = bindir / tool
+        path.write_text(
+            "#!/bin/sh\n"
+            f'FX="{Path(root).resolve()}"\n'
+            '[ -n "$BENCH_LATENCY" ] && sleep "$BENCH_LATENCY"\n' + body
+        )
+        path.chmod(0o755)
+    return bindir
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  RUNNER
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+def measure(fn, repeat):
+    """Run ``fn`` ``repeat`` times; returns (timings, last result)."""
+    walls, cpus, result = [], [], None
+    for _ in range(repeat):
+        c0, t0 = time.process_time(), time.perf_counter()
+        result = fn()
+        walls.append(time.perf_counter() - t0)
+        cpus.append(time.process_time() - c0)
+    return {
+        "repeat": repeat,
+        "wall_min_s": round(min(walls), 6),
+        "wall_median_s": round(statistics.median(walls), 6),
+        "cpu_median_s": round(statistics.median(cpus), 6),
+    }, result
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                                       text=True, stderr=subprocess.DEVNULL).strip()
+    except Exception:
+        return "unknown"
+
+
+def _report(results, name, size, timing, note="", **extra):
+    results.append({"name": name, "size": size, **extra, **timing})
+    print(f"  {size:>7}  {name:<20} {timing['wall_median_s'] * 1000:>10.1f} ms  {note}")
+
+
+def run_size(xp, fx, size, repeat, skip, window):
+    scanner = xp.ScanWorker()
+    bench = {
+        "applications": lambda: scanner._scan_applications(str(fx / "Applications"), "Application"),
+        "brew-formulae": scanner._scan_brew_formulae,
+        "brew-casks": scanner._scan_brew_casks,
+        "pip": scanner._scan_pip,
+        "pkgutil": scanner._scan_pkgutil,
+    }
+    results, items = [], []
+    for name, fn in bench.items():
+        if name in skip:
+            continue
+        timing, found = measure(fn, repeat)
+        items += found
+        _report(results, f"scan:{name}", size, timing, f"({len(found)} items)", items=len(found))
+
+    if "processes" not in skip:
+        worker = xp.ProcessWorker()
+        procs = []
+        worker.finished.connect(procs.append)
+        timing, _ = measure(worker.run, repeat)
+        _report(results, "scan:processes", size, timing, f"({len(procs[-1])} processes)",
+                items=len(procs[-1]))
+
+    if len(items) < size:
+        # pad with synthetic rows so search/table see the requested size
+        rng = random.Random(size)
+        items += [xp.InventoryItem("pip Package", _name(rng, i), _version(rng), 1.0)
+                  for i in range(size - len(items))]
+    items = items[:size]
+
+    if "search" not in skip:
+        queries = [("All", ""), ("All", "lib"), ("All", "zz-no-match"),
+                   ("pip Package", ""), ("Brew Formula", "ssl")]
+        timing, _ = measure(lambda: [xp.filter_indices(items, k, q) for k, q in queries], repeat)
+        _report(results, "search", size, timing, f"({len(queries)} queries)",
+                items=len(items), queries=len(queries))
+
+    if "outdated" not in skip:
+        # every other package has a newer release in the index
+        sources = {"Brew Formula": "brew-formula", "Brew Cask": "brew-cask", "pip Package": "pypi"}
+        index = xp.PackageIndex(Path(os.environ["H4CK3R_HOME"]) / "bench-index.json.gz")
+        index.merge({src: {} for src in sources.values()})
+        for i, it in enumerate(items):
+            if it["kind"] in sources and i % 2 == 0:
+                index.sources[sources[it["kind"]]][xp.pypi_name(it["name"]) if it["kind"] == "pip Package"
+                                                  else it["name"].lower()] = it["version"] + ".1"
+
+        def flag():
+            xp.pep440_key.cache_clear()
+            xp.brew_key.cache_clear()
+            index._keys.clear()
+            return index.outdated(items)
+
+        timing, flagged = measure(flag, repeat)
+        _report(results, "outdated", size, timing, f"({len(flagged)} flagged)",
+                items=len(items), flagged=len(flagged))
+
+    if "slim" not in skip:
+        roots = xp.slim_roots(items)
+        cache = Path(os.environ["H4CK3R_HOME"]) / "bench-macho.json.gz"
+        timing, rows = measure(lambda: xp.SlimAnalyzer(cache).run(roots, keep="arm64"), repeat)
+        fat = sum(r["fat_files"] for r in rows)
+        _report(results, "slim", size, timing, f"({len(roots)} bundles, {fat} fat)",
+                bundles=len(roots), fat=fat)
+        warm = xp.SlimAnalyzer(cache)
+        warm.run(roots, keep="arm64")
+        timing, _ = measure(lambda: warm.run(roots, keep="arm64"), repeat)
+        _report(results, "slim:cached", size, timing, f"({warm.parsed} files re-read)",
+                bundles=len(roots))
+
+    if "table" not in skip and window is not None:
+        window.all_items = items
+        window.filtered_rows = xp.filter_indices(items, "All", "")
+
+        def populate():
+            window.table.setRowCount(0)
+            window._populate_table()
+        timing, _ = measure(populate, repeat)
+        _report(results, "table", size, timing, items=len(items))
+        window.table.setRowCount(0)
+
+    if "memory" not in skip:
+        results += measure_memory(xp, items)
+    return results
+
+
+def _allocated(build):
+    """Bytes still allocated by what ``build()`` returns."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def _fresh(text):
+    """An equal string that is a new object (str() and "%s" return the same one)."""
+    return text.encode().decode()
+
+
+def measure_memory(xp, items):
+    """Bytes per item: the old dict layout vs InventoryItem, list vs index-array filters.
+
+    Strings are rebuilt from scratch for both layouts, as a fresh scan
+    would produce them, so interning shows up in the numbers.
+    """
+    rows = [(it["kind"], it["name"], it["version"], it["size_mb"], it["path"]) for it in items]
+    n = len(rows) or 1
+
+    def dicts():
+        out = []
+        for kind, name, version, size_mb, path in rows:
+            item = {"name": _fresh(name), "version": _fresh(version), "size_mb": size_mb,
+                    "kind": _fresh(kind), "path": _fresh(path)}
+            item["uninstall_cmd"] = xp.uninstall_command(item)
+            out.append(item)
+        return out
+
+    def records():
+        return [xp.InventoryItem(_fresh(kind), _fresh(name), _fresh(version), size_mb, _fresh(path))
+                for kind, name, version, size_mb, path in rows]
+
+    results = []
+    for name, build in (("memory:dict-items", dicts), ("memory:slot-items", records),
+                        ("memory:filter-list", lambda: list(items)),
+                        ("memory:filter-array", lambda: xp.filter_indices(items, "All", ""))):
+        per_item = _allocated(build) / n
+        results.append({"name": name, "size": len(rows), "bytes_per_item": round(per_item, 1)})
+        print(f"  {len(rows):>7}  {name:<20} {per_item:>10.1f} B/item")
+    return results
+
+
+def cmd_run(args):
+    sizes = [int(s) for s in args.sizes.split(",")]
+    skip = set(filter(None, args.skip.split(",")))
+    mix = dict(DEFAULT_MIX)
+    for part in filter(None, args.mix.split(",")):
+        key, val = part.split("=")
+        mix[key] = float(val)
+
+    work = Path(args.workdir or tempfile.mkdtemp(prefix="h4ck3r-bench-"))
+    os.environ["H4CK3R_HOME"] = str(work / "home")
+    os.environ["BENCH_LATENCY"] = str(args.latency_ms / 1000) if args.latency_ms else ""
+    sys.path.insert(0, str(HERE))
+    import xp_app_manager as xp
+
+    window = None
+    if "table" not in skip:
+        from PyQt6.QtWidgets import QApplication
+        app = QApplication.instance() or QApplication([])
+        app.setStyleSheet(xp.HACKER_CSS)
+        window = xp.HackerAppManager()
+        window._ensure_tab(0)
+
+    report = {
+        "schema": BENCH_SCHEMA,
+        "schema_version": BENCH_SCHEMA_VERSION,
+        "commit": _git_commit(),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {"sizes": sizes, "repeat": args.repeat, "latency_ms": args.latency_ms,
+                   "files_per_item": args.files_per_item, "mix": mix, "skip": sorted(skip)},
+        "results": [],
+    }
+    old_path = os.environ.get("PATH", "")
+    try:
+        for size in sizes:
+            fx = work / f"fixture-{size}"
+            if not (fx / "out").is_dir():
+                t0 = time.perf_counter()
+                build_fixture(fx, size, mix, args.files_per_item)
+                print(f"  [FIXTURE] {size} items in {time.perf_counter() - t0:.1f}s -> {fx}")
+            os.environ["PATH"] = f"{install_stubs(fx)}{os.pathsep}{old_path}"
+            report["results"] += run_size(xp, fx, size, args.repeat, skip, window)
+    finally:
+        os.environ["PATH"] = old_path
+        if not args.keep and not args.workdir:
+            shutil.rmtree(work, ignore_errors=True)
+
+    out = Path(args.out)
+    if out.suffix != ".json":
+        out.mkdir(parents=True, exist_ok=True)
+        out = out / f"{report['commit']}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    out.write_text(json.dumps(report, indent=1))
+    print(f"  [OK] results -> {out}")
+    return 0
+
+
+def cmd_compare(args):
+    old = json.loads(Path(args.old).read_text())
+    new = json.loads(Path(args.new).read_text())
+    old_rows = {(r["name"], r["size"]): r for r in old["results"]}
+    print(f"  {'benchmark':<20} {'size':>7} {old['commit']:>12} {new['commit']:>12}   ratio")
+    worse = 0
+    for r in new["results"]:
+        o = old_rows.get((r["name"], r["size"]))
+        if o is None:
+            continue
+        if "bytes_per_item" in r:
+            a, b = o["bytes_per_item"], r["bytes_per_item"]
+            ratio = b / a if a else float("inf")
+            flag = "  << bigger" if ratio > 1 + args.threshold else ""
+            cells = f"{a:>11.0f}B {b:>11.0f}B"
+        else:
+            a, b = o["wall_median_s"], r["wall_median_s"]
+            ratio = b / a if a else float("inf")
+            flag = "  << slower" if ratio > 1 + args.threshold else ""
+            cells = f"{a * 1000:>10.1f}ms {b * 1000:>10.1f}ms"
+        worse += bool(flag)
+        print(f"  {r['name']:<20} {r['size']:>7} {cells}   {ratio:5.2f}x{flag}")
+    return 1 if worse and args.fail_on_regression else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="bench.py", description=__doc__.split("\n\n")[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("run", help="build fixtures and time everything")
+    p.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--latency-ms", type=float, default=0,
+                   help="sleep added to every stub brew/pip3/pkgutil/ps call")
+    p.add_argument("--files-per-item", type=int, default=4)
+    p.add_argument("--mix", default="", help="e.g. app=0.2,pkg=0.05 (share of size per source)")
+    p.add_argument("--skip", default="", help=f"comma list of: {', '.join(BENCHMARKS)}")
+    p.add_argument("--workdir", help="reuse fixtures from this directory (kept)")
+    p.add_argument("--keep", action="store_true", help="keep the temp fixture directory")
+    p.add_argument("--out", default=str(HERE / "bench_results"),
+                   help="results directory or .json file")
+    p.set_defaults(func=cmd_run)
+    p = sub.add_parser("compare", help="compare two result files")
+    p.add_argument("old")
+    p.add_argument("new")
+    p.add_argument("--threshold", type=float, default=0.10, help="slowdown to flag (0.10 = 10%%)")
+    p.add_argument("--fail-on-regression", action="store_true")
+    p.set_defaults(func=cmd_compare)
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
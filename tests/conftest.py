@@ -0,0 +1,9 @@
+"""Shared setup: import xp_app_manager from the repo root with its state in a temp dir."""
+
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["H4CK3R_HOME"] = tempfile.mkdtemp(prefix="h4ck3r-test-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
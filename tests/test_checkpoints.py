@@ -0,0 +1,38 @@
+import os
+
+import xp_app_manager as xp
+
+
+def _items():
+    return [xp.InventoryItem("Application", "Foo", "1.0", 12.5, "/Applications/Foo.app", True,
+                             {"bundle_id": "com.acme.foo"})]
+
+
+def test_round_trip_keeps_partial_and_meta(tmp_path):
+    cps = xp.ScanCheckpoints(tmp_path)
+    cps.save("applications", _items(), [1, 2], complete=True)
+    [item] = cps.load("applications", [1, 2])
+    assert item.as_dict() == _items()[0].as_dict()
+
+
+def test_stale_or_unstamped_checkpoints_are_not_reused(tmp_path):
+    cps = xp.ScanCheckpoints(tmp_path)
+    cps.save("applications", _items(), [1, 2], complete=True)
+    assert cps.load("applications", [1, 3]) is None
+    cps.save("applications", _items(), [1, 2], complete=False)
+    assert cps.load("applications", [1, 2]) is None
+    # no directory tells whether the source changed: always rescan
+    cps.save("dev-caches", _items(), None, complete=True)
+    assert cps.load("dev-caches", None) is None
+
+
+def test_pip_is_stamped_by_its_site_packages(tmp_path, monkeypatch):
+    site = tmp_path / "site-packages"
+    site.mkdir()
+    monkeypatch.setattr(xp, "pip_site_packages", lambda: str(site))
+    before = xp.source_stamp("pip")
+    assert before == [os.stat(site).st_mtime_ns]
+    (site / "requests-2.31.0.dist-info").mkdir()
+    os.utime(site, ns=(0, before[0] + 1_000_000_000))
+    assert xp.source_stamp("pip") != before
+    assert xp.source_stamp("dev-caches") is None
@@ -0,0 +1,57 @@
+import gzip
+import json
+import os
+import sqlite3
+import stat
+
+import pytest
+
+import xp_app_manager as xp
+
+ITEMS = [xp.InventoryItem("Brew Formula", "openssl@3", "3.3.0", 50.0, "/x"),
+         xp.InventoryItem("pip Package", "requests", "2.31.0", 1.5, "/y")]
+
+
+@pytest.mark.parametrize("fmt", sorted(xp.EXPORT_WRITERS))
+@pytest.mark.parametrize("compress", [False, True])
+def test_export_is_world_readable(tmp_path, fmt, compress):
+    out = tmp_path / f"inv.{fmt}"
+    assert xp.export_inventory(ITEMS, str(out), fmt, compress) == 2
+    assert stat.S_IMODE(os.stat(out).st_mode) == 0o644
+    assert os.listdir(tmp_path) == [out.name]
+
+
+def test_jsonl_and_sqlite_contents(tmp_path):
+    xp.export_inventory(ITEMS, str(tmp_path / "a.jsonl.gz"), "jsonl", True)
+    with gzip.open(tmp_path / "a.jsonl.gz", "rt", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert records[0]["record"] == "header" and records[0]["item_count"] == 2
+    assert [r["name"] for r in records[1:]] == ["openssl@3", "requests"]
+
+    xp.export_inventory(ITEMS, str(tmp_path / "a.sqlite"), "sqlite")
+    db = sqlite3.connect(tmp_path / "a.sqlite")
+    assert db.execute("SELECT name, size_mb FROM items ORDER BY name").fetchall() == \
+        [("openssl@3", 50.0), ("requests", 1.5)]
+    db.close()
+
+
+def test_failed_export_leaves_nothing(tmp_path, monkeypatch):
+    def broken(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(xp.shutil, "copyfileobj", broken)
+    with pytest.raises(OSError):
+        xp.export_inventory(ITEMS, str(tmp_path / "inv.sqlite.gz"), "sqlite", True)
+    assert os.listdir(tmp_path) == []
+
+    with pytest.raises(KeyError):
+        xp.export_inventory([{"kind": "x"}], str(tmp_path / "inv.csv"), "csv")
+    assert os.listdir(tmp_path) == []
+
+
+def test_writers_must_write_items():
+    class Incomplete(xp.ExportWriter):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,139 @@
+import csv
+import gzip
+import json
+import os
+import random
+
+import pytest
+
+import xp_app_manager as xp
+
+
+def _jsonl(path, host, rows):
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(json.dumps({"record": "header", "host": host}) + "\n")
+        for kind, name, version, size_mb in rows:
+            f.write(json.dumps({"record": "item", "kind": kind, "name": name,
+                                "version": version, "size_mb": size_mb}) + "\n")
+
+
+def _csv(path, rows):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        out = csv.writer(f)
+        out.writerow(["host", "kind", "name", "version", "size_mb"])
+        out.writerows(rows)
+
+
+@pytest.fixture
+def fleet_dir(tmp_path):
+    _jsonl(tmp_path / "alpha.jsonl.gz", "alpha", [
+        ("pip Package", "requests", "2.28.0", 1.0),
+        ("Application", "Xcode", "15.0", 10000.0),
+    ])
+    _jsonl(tmp_path / "beta.jsonl.gz", "beta", [
+        ("pip Package", "requests", "2.31.0", 1.5),
+        ("Application", "Xcode", "15.0", 12000.0),
+    ])
+    # a second, concatenated export of beta and a row gamma lists twice
+    _csv(tmp_path / "more.csv", [
+        ("beta", "Application", "Xcode", "15.0", 11000.0),
+        ("gamma", "pip Package", "requests", "2.28.0", 1.0),
+        ("gamma", "pip Package", "requests", "2.28.0", 1.0),
+    ])
+    with open(tmp_path / "delta.json", "w", encoding="utf-8") as f:
+        json.dump({"host": "delta", "columns": ["kind", "name", "version", "size_mb", "path"],
+                   "rows": [["Brew Formula", "openssl@3", "3.3.0", 50.0, "/x"]]}, f)
+    return tmp_path
+
+
+def test_build_and_query(fleet_dir):
+    index = xp.FleetIndex.build(sorted(fleet_dir.iterdir()), workers=2)
+    assert sorted(index.hosts) == ["alpha", "beta", "delta", "gamma"]
+    assert len(index.kinds) == 4
+
+    assert sorted(index.host_names(index.hosts_with("requests", "pip", below="2.31"))) == \
+        ["alpha", "gamma"]
+    assert index.host_names(index.hosts_with("Requests", at_least="2.31")) == ["beta"]
+    assert index.hosts_with("requests", "app") == 0
+    assert index.versions_of("requests") == [("2.28.0", "pip Package", 2),
+                                             ("2.31.0", "pip Package", 1)]
+    assert index.top(n=1) == [("pip Package", "requests", 3)]
+    assert xp.fleet_query(index, "hosts openssl@3 formula") == ["delta", "  [1 hosts]"]
+
+
+def test_byte_totals_count_each_host_once(fleet_dir):
+    index = xp.FleetIndex.build(sorted(fleet_dir.iterdir()), workers=2)
+    # beta's two exports disagree: its larger size counts, once
+    assert index.total_size_mb("Xcode", "app") == (22000.0, 2)
+    # gamma lists the same row twice
+    assert index.total_size_mb("requests") == (3.5, 3)
+    assert xp.fleet_query(index, "bytes Xcode app") == ["  Xcode: 21.5G on 2 hosts"]
+
+
+def test_save_load_round_trip(fleet_dir, tmp_path_factory):
+    index = xp.FleetIndex.build(sorted(fleet_dir.iterdir()), workers=2)
+    db = tmp_path_factory.mktemp("db") / "fleet.db"
+    index.save(db)
+    loaded = xp.FleetIndex.load(db)
+    assert loaded.hosts == index.hosts
+    assert loaded.bitmaps == index.bitmaps
+    assert loaded.size_total == index.size_total
+    assert loaded.total_size_mb("requests") == index.total_size_mb("requests")
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_sqlite_exports(tmp_path, compress):
+    items = [xp.InventoryItem("Brew Formula", "openssl@3", "3.3.0", 50.0, "/x"),
+             xp.InventoryItem("pip Package", "requests", "2.31.0", 1.5, "/y")]
+    out = str(tmp_path / ("mac1.sqlite" + (".gz" if compress else "")))
+    xp.export_inventory(items, out, "sqlite", compress)
+    [(host, rows)] = xp.read_fleet_file(out).items()
+    assert sorted(rows) == [("Brew Formula", "openssl@3", "3.3.0", 50.0),
+                            ("pip Package", "requests", "2.31.0", 1.5)]
+
+
+def test_unreadable_files_are_skipped(fleet_dir):
+    xp.export_inventory([xp.InventoryItem("Application", "Xcode", "15.0", 1.0)],
+                        str(fleet_dir / "report.txt"), "txt")
+    (fleet_dir / "broken.jsonl").write_text("{not json\n")
+    index = xp.FleetIndex.build(sorted(fleet_dir.iterdir()), workers=2)
+    index.save(fleet_dir / "fleet.db")  # an index left in the export dir
+    skipped = []
+    index = xp.FleetIndex.build(sorted(fleet_dir.iterdir()), workers=2,
+                                warn=lambda path, reason: skipped.append(path))
+    assert sorted(os.path.basename(p) for p in skipped) == ["broken.jsonl", "fleet.db", "report.txt"]
+    assert sorted(index.hosts) == ["alpha", "beta", "delta", "gamma"]
+
+
+def test_finalized_index_is_read_only(fleet_dir, tmp_path_factory):
+    index = xp.FleetIndex.build(sorted(fleet_dir.iterdir()), workers=2)
+    with pytest.raises(RuntimeError):
+        index.add_host("epsilon", [("pip Package", "requests", "2.31.0", 1.0)])
+    db = tmp_path_factory.mktemp("db") / "fleet.db"
+    index.save(db)
+    with pytest.raises(RuntimeError):
+        xp.FleetIndex.load(db).add_host("epsilon", [])
+
+
+def test_ten_thousand_hosts():
+    rng = random.Random(7)
+    index = xp.FleetIndex()
+    expected_hosts, expected_mb = {}, {}
+    for h in range(10000):
+        rows = []
+        for p in rng.sample(range(200), 30):
+            version = f"1.{rng.randrange(5)}.0"
+            rows.append(("pip Package", f"pkg{p}", version, 2.0))
+            expected_hosts.setdefault((f"pkg{p}", version), set()).add(h)
+            expected_mb[f"pkg{p}"] = expected_mb.get(f"pkg{p}", 0.0) + 2.0
+        index.add_host(f"host{h:05}", rows + rows[:3])  # repeated rows count once
+    index.finalize()
+
+    assert len(index.hosts) == 10000
+    for (name, version), hosts in rng.sample(sorted(expected_hosts.items()), 50):
+        bitmap = index.hosts_with(name, "pip", at_least=version, below=version + ".1")
+        assert index.host_names(bitmap) == [f"host{h:05}" for h in sorted(hosts)]
+    for name in ("pkg0", "pkg99", "pkg199"):
+        mb, hosts = index.total_size_mb(name)
+        assert mb == expected_mb[name]
+        assert hosts == expected_mb[name] / 2.0
@@ -0,0 +1,125 @@
+import os
+import struct
+
+import pytest
+
+import xp_app_manager as xp
+
+X86_64, ARM64 = 0x01000007, 0x0100000C
+
+
+def thin(cputype, size=64):
+    return b"\xcf\xfa\xed\xfe" + struct.pack("<I", cputype) + bytes(size - 8)
+
+
+def fat(*slices, wide=False):
+    """Fat file with each (cputype, body) at a 4 KiB boundary."""
+    entry = ">iiQQII" if wide else ">iiIII"
+    head = struct.pack(">II", xp.FAT_MAGIC_64 if wide else xp.FAT_MAGIC, len(slices))
+    offset, bodies = 4096, b""
+    for cputype, body in slices:
+        head += struct.pack(entry, cputype, 0, offset, len(body), 12, *((0,) if wide else ()))
+        padded = body.ljust((len(body) + 4095) // 4096 * 4096, b"\0")
+        bodies += padded
+        offset += len(padded)
+    return head.ljust(4096, b"\0") + bodies
+
+
+def test_thin():
+    assert xp.macho_slices(thin(ARM64, 100)) == {"arm64": 100}
+    big_endian = b"\xfe\xed\xfa\xce" + struct.pack(">I", 18) + bytes(40)
+    assert xp.macho_slices(big_endian) == {"ppc": 48}
+
+
+@pytest.mark.parametrize("wide", [False, True])
+def test_fat(wide):
+    buf = fat((X86_64, thin(X86_64, 5000)), (ARM64, thin(ARM64, 7000)), wide=wide)
+    assert xp.macho_slices(buf) == {"x86_64": 5000, "arm64": 7000}
+
+
+def test_not_macho():
+    assert xp.macho_slices(b"#!/bin/sh\n" + bytes(40)) == {}
+    assert xp.macho_slices(thin(ARM64)[:27]) == {}
+    # a Java class file shares the fat magic; its "nfat" is the class version
+    assert xp.macho_slices(struct.pack(">IHH", 0xCAFEBABE, 0, 61) + bytes(40)) == {}
+
+
+def test_truncated_fat():
+    buf = fat((X86_64, thin(X86_64, 5000)), (ARM64, thin(ARM64, 7000)))
+    assert xp.macho_slices(buf[:8 + 20 + 10]) == {}  # fat table cut off
+    assert xp.macho_slices(buf[:4096 + 4096 + 100]) == {}  # arm64 slice cut off
+
+
+def test_summary_reclaimable():
+    entries = {
+        "/A.app/a": [1, 1, {"x86_64": 300, "arm64": 400}],
+        "/A.app/b": [2, 1, {"x86_64": 10, "arm64": 20, "i386": 5}],
+        "/A.app/c": [3, 1, {"arm64": 1000}],
+        "/A.app/d": [4, 1, {"x86_64": 50, "ppc": 60}],  # no arm64 slice to keep
+        "/A.app/e": [5, 1, {}],
+    }
+    row = xp.slim_summary("/A.app", entries, "arm64")
+    assert row["macho_files"] == 4
+    assert row["fat_files"] == 3
+    assert row["by_arch"] == {"x86_64": 360, "arm64": 1420, "i386": 5, "ppc": 60}
+    assert row["reclaimable"] == 300 + 10 + 5
+    assert xp.slim_summary("/A.app", entries, "x86_64")["reclaimable"] == 400 + 20 + 5 + 60
+
+
+def _write(path, data, mode=0o755):
+    path.write_bytes(data)
+    path.chmod(mode)
+
+
+def test_cache_reuses_unchanged_files(tmp_path):
+    root = tmp_path / "Tool.app"
+    (root / "Contents" / "MacOS").mkdir(parents=True)
+    exe = root / "Contents" / "MacOS" / "Tool"
+    lib = root / "Contents" / "libx.dylib"
+    _write(exe, fat((X86_64, thin(X86_64, 5000)), (ARM64, thin(ARM64, 7000))))
+    _write(lib, thin(ARM64, 300), 0o644)
+    _write(root / "Contents" / "Info.plist", b"<plist/>" + bytes(40), 0o644)  # not a candidate
+
+    analyzer = xp.SlimAnalyzer(tmp_path / "cache.json.gz")
+    rows = analyzer.run([str(root)], keep="arm64", workers=1)
+    assert analyzer.parsed == 2
+    assert rows[0]["reclaimable"] == 5000
+    assert rows[0]["by_arch"] == {"x86_64": 5000, "arm64": 7300}
+
+    analyzer.save()
+    analyzer = xp.SlimAnalyzer(tmp_path / "cache.json.gz").load()
+    assert analyzer.run([str(root)], keep="arm64", workers=1) == rows
+    assert analyzer.parsed == 0
+
+    # rewritten in place: same inode, new mtime
+    st = os.stat(exe)
+    _write(exe, thin(ARM64, 7000))
+    os.utime(exe, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    rows = analyzer.run([str(root)], keep="arm64", workers=1)
+    assert analyzer.parsed == 1
+    assert rows[0]["reclaimable"] == 0
+
+    # replaced by a new file carrying the old mtime: new inode
+    st = os.stat(lib)
+    new = tmp_path / "libx.new"
+    _write(new, fat((X86_64, thin(X86_64, 100)), (ARM64, thin(ARM64, 300))), 0o644)
+    os.utime(new, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(new, lib)
+    rows = analyzer.run([str(root)], keep="arm64", workers=1)
+    assert analyzer.parsed == 1
+    assert rows[0]["reclaimable"] == 100
+
+
+def test_cache_keeps_other_roots(tmp_path):
+    roots = []
+    for name in ("A.app", "B.app"):
+        root = tmp_path / name
+        root.mkdir()
+        _write(root / "bin", thin(ARM64, 100))
+        roots.append(str(root))
+    analyzer = xp.SlimAnalyzer(tmp_path / "cache.json.gz")
+    analyzer.run(roots, keep="arm64", workers=1)
+    analyzer.run(roots[:1], keep="arm64", workers=1)
+    assert sorted(analyzer.files) == [os.path.join(r, "bin") for r in roots]
+    analyzer.run(roots[1:], keep="arm64", workers=1)
+    assert analyzer.parsed == 0
@@ -7,25 +7,56 @@ pip packages, and running processes.  Lets you uninstall or kill them.
 
 import sys
 import os
+import abc
 import subprocess
 import json
+import csv
+import gzip
+import sqlite3
+import tempfile
 import plistlib
 import platform
 import shutil
 import time
 import random
+import functools
+import re
+import glob
+import argparse
+import asyncio
+import logging
+import logging.handlers
+import queue
+import threading
+import shlex
+import signal
+import socket
+import inspect
+import hmac
+import secrets
+import http.client
+import urllib.parse
+import mmap
+import stat
+import struct
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
+# Startup stages are reported relative to this point (before Qt is imported)
+BOOT_T0 = time.perf_counter()
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QLineEdit, QTableWidget, QTableWidgetItem,
     QHeaderView, QMessageBox, QComboBox, QFrame, QProgressBar,
     QAbstractItemView, QCheckBox, QDialog, QTextEdit, QTabWidget,
-    QGroupBox, QGridLayout, QSizePolicy,
+    QGroupBox, QGridLayout, QSizePolicy, QPlainTextEdit, QInputDialog,
 )
 from PyQt6.QtCore import (
-    Qt, QThread, pyqtSignal, QTimer, QPropertyAnimation,
+    Qt, QObject, QThread, pyqtSignal, QTimer, QPropertyAnimation,
     QEasingCurve, QPoint, QRect, pyqtProperty,
 )
 from PyQt6.QtGui import (
@@ -67,6 +98,901 @@ ROW_SYSTEM      = "#1a0a0a"
 ROW_PIP         = "#0a0a1a"
 ROW_PROCESS     = "#1a0a1a"
 
+# Snapshots, caches and other state live here; override with H4CK3R_HOME
+APP_HOME = Path(os.environ.get(
+    "H4CK3R_HOME",
+    Path.home() / "Library" / "Application Support" / "H4CK3R App Manager",
+))
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  STARTUP PROFILE
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class StartupProfile:
+    """Milliseconds from BOOT_T0 to each named startup stage."""
+
+    def __init__(self):
+        self.stages = []
+
+    def mark(self, stage):
+        if stage not in dict(self.stages):
+            self.stages.append((stage, round((time.perf_counter() - BOOT_T0) * 1000, 1)))
+
+    def save(self, path):
+        """Append one JSON line per launch so startup can be tracked over time."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"at": datetime.now().isoformat(timespec="seconds"),
+                                "stages": dict(self.stages)}) + "\n")
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  TRACING
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add(self, key, n=1):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "args", "counters", "parent", "t0", "c0")
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer, self.name, self.cat, self.args = tracer, name, cat, args
+        self.counters = {}
+
+    def __enter__(self):
+        stack = self.tracer._stack()
+        self.parent = stack[-1] if stack else None
+        stack.append(self)
+        self.c0 = time.thread_time()
+        self.t0 = time.perf_counter()
+        return self
+
+    def add(self, key, n=1):
+        self.counters[key] = self.counters.get(key, 0) + n
+
+    def __exit__(self, *exc):
+        wall = time.perf_counter() - self.t0
+        cpu = time.thread_time() - self.c0
+        self.tracer._stack().pop()
+        if self.parent is not None:
+            for key, n in self.counters.items():
+                self.parent.add(key, n)
+        self.tracer._record(self, wall, cpu)
+        return False
+
+
+class Tracer:
+    """Spans with wall/CPU time and rolled-up counters (bytes, subprocesses).
+
+    Disabled by default: ``span()`` then returns a shared no-op object, so
+    instrumented code pays one attribute check.  Enable from the [PERF] tab
+    or with H4CK3R_TRACE=1.
+    """
+    MAX_EVENTS = 200000
+
+    def __init__(self):
+        self.enabled = bool(os.environ.get("H4CK3R_TRACE"))
+        self.events = deque(maxlen=self.MAX_EVENTS)
+        self.stats = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def span(self, name, cat="app", **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, cat, args)
+
+    def add(self, key, n=1):
+        """Add to a counter of the innermost open span on this thread."""
+        if self.enabled:
+            stack = self._stack()
+            if stack:
+                stack[-1].add(key, n)
+
+    def interval(self, name, cat, t0, wall, **args):
+        """Record a span timed outside a with-block (e.g. across generator yields)."""
+        if self.enabled:
+            span = _Span(self, name, cat, args)
+            span.t0 = t0
+            self._record(span, wall, 0.0)
+
+    def _record(self, span, wall, cpu):
+        thread = threading.current_thread()
+        self.events.append((span.name, span.cat, span.t0, wall, cpu,
+                            thread.ident, thread.name, span.args, dict(span.counters)))
+        with self._lock:
+            st = self.stats.get(span.name)
+            if st is None:
+                st = self.stats[span.name] = {"cat": span.cat, "count": 0, "wall": 0.0,
+                                              "cpu": 0.0, "max": 0.0, "bytes": 0,
+                                              "subprocesses": 0}
+            st["count"] += 1
+            st["wall"] += wall
+            st["cpu"] += cpu
+            st["max"] = max(st["max"], wall)
+            st["bytes"] += span.counters.get("bytes", 0)
+            st["subprocesses"] += span.counters.get("subprocesses", 0)
+
+    def summary(self):
+        with self._lock:
+            return sorted(((name, dict(st)) for name, st in self.stats.items()),
+                          key=lambda kv: kv[1]["wall"], reverse=True)
+
+    def clear(self):
+        self.events.clear()
+        with self._lock:
+            self.stats.clear()
+
+    def chrome_trace(self):
+        """Trace-event JSON (chrome://tracing, Perfetto): one complete event per span."""
+        pid = os.getpid()
+        events, names = [], {}
+        for name, cat, t0, wall, cpu, tid, tname, args, counters in list(self.events):
+            names[tid] = tname
+            events.append({
+                "name": name, "cat": cat, "ph": "X", "pid": pid, "tid": tid,
+                "ts": round((t0 - BOOT_T0) * 1e6, 1), "dur": round(wall * 1e6, 1),
+                "args": {**args, **counters, "cpu_ms": round(cpu * 1000, 3)},
+            })
+        for tid, tname in names.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                           "args": {"name": tname}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path):
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+        os.replace(tmp, path)
+
+
+TRACER = Tracer()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  METRICS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# node_exporter textfile to keep up to date (GUI and daemon); empty = none
+METRICS_FILE = os.environ.get("H4CK3R_METRICS_FILE", "")
+METRICS_PREFIX = "h4ck3r_"
+METRICS_WRITE_S = 15
+# name -> (type, help), rendered in this order
+METRIC_FAMILIES = {
+    "inventory_items": ("gauge", "Items per kind in the current inventory."),
+    "inventory_bytes": ("gauge", "Bytes per kind in the current inventory."),
+    "inventory_partial_items": ("gauge", "Items per kind whose source hit its deadline."),
+    "scan_duration_seconds": ("gauge", "Wall time of the last completed scan."),
+    "scan_completed_timestamp_seconds": ("gauge", "Unix time the last scan completed."),
+    "scan_source_duration_seconds": ("gauge", "Wall time of each source's last run."),
+    "scan_source_items": ("gauge", "Items each source produced in its last run."),
+    "scan_source_runs_total": ("counter", "Source runs by final state."),
+    "disk_size_bytes": ("gauge", "Size of each mounted volume."),
+    "disk_used_bytes": ("gauge", "Used bytes of each mounted volume."),
+    "disk_free_bytes": ("gauge", "Free bytes of each mounted volume."),
+    "subprocess_runs_total": ("counter", "External commands by program and outcome."),
+    "subprocess_seconds_total": ("counter", "Wall time of external commands by program."),
+    "cache_requests_total": ("counter", "Cache lookups by cache and result."),
+}
+
+
+def _label_value(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _metric_value(value):
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+
+class MetricsRegistry:
+    """Prometheus-style gauges and counters, pushed by scans, watchers and RUNNER as they run.
+
+    ``render`` only formats the values already there, so a scrape never
+    walks, stats or spawns anything.  Served as ``GET /metrics`` by the
+    daemon and written to H4CK3R_METRICS_FILE (node_exporter's textfile
+    format) when that is set.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.families = {name: {} for name in METRIC_FAMILIES}
+        self.version = 0  # bumped on every change; writers skip an unchanged registry
+
+    def set(self, name, value, **labels):
+        with self._lock:
+            self.families[name][tuple(labels.items())] = value
+            self.version += 1
+
+    def inc(self, name, by=1, **labels):
+        key = tuple(labels.items())
+        with self._lock:
+            family = self.families[name]
+            family[key] = family.get(key, 0) + by
+            self.version += 1
+
+    def set_family(self, name, rows):
+        """Replace every sample of ``name`` with ``rows`` ([(labels, value)]); labels not in rows go."""
+        with self._lock:
+            self.families[name] = {tuple(labels.items()): value for labels, value in rows}
+            self.version += 1
+
+    def render(self):
+        """Prometheus text exposition format (0.0.4)."""
+        with self._lock:
+            families = [(name, sorted(samples.items()))
+                        for name, samples in self.families.items() if samples]
+        lines = []
+        for name, samples in families:
+            kind, text = METRIC_FAMILIES[name]
+            full = METRICS_PREFIX + name
+            lines += [f"# HELP {full} {text}", f"# TYPE {full} {kind}"]
+            for labels, value in samples:
+                tags = ",".join(f'{k}="{_label_value(v)}"' for k, v in labels)
+                lines.append(f"{full}{{{tags}}} {_metric_value(value)}" if tags
+                             else f"{full} {_metric_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+
+    # ── producers ──
+    def inventory(self, items, wall=None):
+        """Per-kind counts and bytes of ``items``; with ``wall`` also the scan's duration."""
+        counts, sizes, partial = {}, {}, {}
+        for it in items:
+            kind = it["kind"]
+            counts[kind] = counts.get(kind, 0) + 1
+            sizes[kind] = sizes.get(kind, 0) + (it["size_mb"] or 0)
+            if it.get("partial"):
+                partial[kind] = partial.get(kind, 0) + 1
+        self.set_family("inventory_items", [({"kind": k}, n) for k, n in counts.items()])
+        self.set_family("inventory_bytes",
+                        [({"kind": k}, round(mb * 1024 * 1024)) for k, mb in sizes.items()])
+        self.set_family("inventory_partial_items",
+                        [({"kind": k}, partial.get(k, 0)) for k in counts])
+        if wall is not None:
+            self.set("scan_duration_seconds", wall)
+            self.set("scan_completed_timestamp_seconds", round(time.time()))
+
+    def scan_source(self, key, state, count, wall):
+        self.set("scan_source_duration_seconds", wall, source=key)
+        self.set("scan_source_items", count, source=key)
+        self.inc("scan_source_runs_total", source=key, state=state)
+
+    def disk(self, volumes):
+        """DiskWorker.collect()'s "volumes"; unmounted volumes drop out."""
+        for name, field in (("disk_size_bytes", "total"), ("disk_used_bytes", "used"),
+                            ("disk_free_bytes", "free")):
+            self.set_family(name, [({"mount": v["mount"]}, v["bytes"][field])
+                                   for v in volumes if "bytes" in v])
+
+    def cache(self, cache, hits=0, misses=0):
+        if hits:
+            self.inc("cache_requests_total", hits, cache=cache, result="hit")
+        if misses:
+            self.inc("cache_requests_total", misses, cache=cache, result="miss")
+
+
+METRICS = MetricsRegistry()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  COMMAND RUNNER
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class CommandError(Exception):
+    """A command could not be started, exited non-zero, timed out or was cancelled."""
+
+    def __init__(self, cmd, reason, returncode=None, stderr=""):
+        self.cmd = cmd
+        self.reason = reason
+        self.returncode = returncode
+        self.stderr = stderr
+        super().__init__(f"{_command_name(cmd)}: {reason}")
+
+
+class CommandCancelled(CommandError):
+    pass
+
+
+class CancelToken:
+    """Shared flag for one job; cancel() also kills the job's live subprocesses.
+
+    ``source`` names the scan source the job works for (children inherit
+    it); the governor only paces tagged work.
+    """
+
+    def __init__(self, source=None):
+        self.source = source
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._procs = set()
+        self._children = []
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        self._event.set()
+        with self._lock:
+            procs = list(self._procs)
+            children = list(self._children)
+        for proc in procs:
+            _kill(proc)
+        for child in children:
+            child.cancel()
+
+    def child(self):
+        """A token cancelled along with this one that can also be cancelled on its own."""
+        child = CancelToken(self.source)
+        with self._lock:
+            self._children.append(child)
+        if self.cancelled:
+            child.cancel()
+        return child
+
+    def _register(self, proc):
+        with self._lock:
+            self._procs.add(proc)
+        if self.cancelled:
+            _kill(proc)
+
+    def _unregister(self, proc):
+        with self._lock:
+            self._procs.discard(proc)
+
+
+def _command_name(cmd):
+    if isinstance(cmd, str):
+        cmd = cmd.split()
+    return os.path.basename(cmd[0]) if cmd else "?"
+
+
+def _kill(proc):
+    try:
+        proc.kill()
+    except OSError:
+        pass
+
+
+class CommandResult:
+    __slots__ = ("returncode", "stdout", "stderr", "wall")
+
+    def __init__(self, returncode, stdout, stderr, wall):
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.wall = wall
+
+
+class CommandRunner:
+    """Runs every external command: timeouts, cancellation, a concurrency cap, metrics.
+
+    run() buffers the output; lines() yields stdout as it arrives so callers
+    can parse while the tool is still printing.  At most ``max_procs``
+    children run at once (H4CK3R_MAX_PROCS); a governed scan source's
+    commands also wait for its GOVERNOR slot and start at background
+    priority.  Per-program counts, failures, timeouts and wall time are kept
+    for the [PERF] tab.
+    """
+
+    def __init__(self, max_procs=None):
+        self.max_procs = max_procs or int(os.environ.get("H4CK3R_MAX_PROCS", "4"))
+        self._slots = threading.BoundedSemaphore(self.max_procs)
+        self._lock = threading.Lock()
+        self._live = set()
+        self.metrics = {}
+
+    # ── process lifecycle ──
+    def _acquire(self, token):
+        """The source's governor gate, then a runner slot; None if ``token`` fired first."""
+        gate = GOVERNOR.acquire_proc(token)
+        if gate is None:
+            return None
+        while not self._slots.acquire(timeout=0.1):
+            if token is not None and token.cancelled:
+                GOVERNOR.release_proc(gate)
+                return None
+        if token is not None and token.cancelled:
+            self._unslot(gate)
+            return None
+        return gate
+
+    def _unslot(self, gate):
+        self._slots.release()
+        GOVERNOR.release_proc(gate)
+
+    def _spawn(self, cmd, token, stdin, env):
+        try:
+            proc = subprocess.Popen(
+                GOVERNOR.wrap(cmd, token), shell=isinstance(cmd, str), text=True, env=env,
+                stdin=subprocess.PIPE if stdin else subprocess.DEVNULL,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            )
+        except OSError as e:
+            raise CommandError(cmd, "not found" if isinstance(e, FileNotFoundError) else str(e))
+        with self._lock:
+            self._live.add(proc)
+        if token is not None:
+            token._register(proc)
+        return proc
+
+    def _release(self, proc, token, gate):
+        with self._lock:
+            self._live.discard(proc)
+        if token is not None:
+            token._unregister(proc)
+        self._unslot(gate)
+
+    def _record(self, cmd, wall, outcome):
+        name = _command_name(cmd)
+        with self._lock:
+            st = self.metrics.get(name)
+            if st is None:
+                st = self.metrics[name] = {"count": 0, "failed": 0, "timeout": 0,
+                                           "cancelled": 0, "wall": 0.0, "max": 0.0}
+            st["count"] += 1
+            st["wall"] += wall
+            st["max"] = max(st["max"], wall)
+            if outcome != "ok":
+                st[outcome] += 1
+        METRICS.inc("subprocess_runs_total", program=name, outcome=outcome)
+        METRICS.inc("subprocess_seconds_total", wall, program=name)
+
+    def _finish(self, cmd, proc, token, t0, timed_out, stderr, check):
+        wall = time.perf_counter() - t0
+        if token is not None and token.cancelled:
+            self._record(cmd, wall, "cancelled")
+            raise CommandCancelled(cmd, "cancelled")
+        if timed_out:
+            self._record(cmd, wall, "timeout")
+            raise CommandError(cmd, "timed out", stderr=stderr)
+        self._record(cmd, wall, "ok" if proc.returncode == 0 else "failed")
+        if check and proc.returncode != 0:
+            last = stderr.strip().splitlines()[-1] if stderr.strip() else f"exit {proc.returncode}"
+            raise CommandError(cmd, last, proc.returncode, stderr)
+        return wall
+
+    # ── public API ──
+    def run(self, cmd, timeout=30, token=None, input=None, env=None, check=True):
+        """Run to completion and return a CommandResult.
+
+        ``cmd`` is an argv list, or a string for a shell command line.
+        Raises CommandError (CommandCancelled if ``token`` fired).
+        """
+        gate = self._acquire(token)
+        if gate is None:
+            raise CommandCancelled(cmd, "cancelled")
+        with TRACER.span("subprocess", "proc", cmd=_command_line(cmd)):
+            TRACER.add("subprocesses")
+            t0 = time.perf_counter()
+            timed_out = False
+            try:
+                proc = self._spawn(cmd, token, input is not None, env)
+            except CommandError:
+                self._unslot(gate)
+                self._record(cmd, time.perf_counter() - t0, "failed")
+                raise
+            try:
+                try:
+                    out, err = proc.communicate(input, timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    timed_out = True
+                    _kill(proc)
+                    out, err = proc.communicate()
+            finally:
+                self._release(proc, token, gate)
+            wall = self._finish(cmd, proc, token, t0, timed_out, err or "", check)
+        return CommandResult(proc.returncode, out or "", err or "", wall)
+
+    def check_output(self, cmd, timeout=30, token=None):
+        return self.run(cmd, timeout, token).stdout
+
+    def lines(self, cmd, timeout=30, token=None):
+        """Yield stdout lines (without newline) while the command runs.
+
+        The timeout covers the whole command; stderr is drained on a side
+        thread so a chatty tool cannot block on a full pipe.
+        """
+        gate = self._acquire(token)
+        if gate is None:
+            raise CommandCancelled(cmd, "cancelled")
+        # no span across the yields: the consumer's own spans must not nest in it
+        TRACER.add("subprocesses")
+        t0 = time.perf_counter()
+        try:
+            proc = self._spawn(cmd, token, False, None)
+        except CommandError:
+            self._unslot(gate)
+            self._record(cmd, time.perf_counter() - t0, "failed")
+            raise
+        expired = threading.Event()
+        watchdog = threading.Timer(timeout, lambda: (expired.set(), _kill(proc)))
+        watchdog.daemon = True
+        err_chunks = []
+        drain = threading.Thread(target=lambda: err_chunks.append(proc.stderr.read()),
+                                 daemon=True)
+        watchdog.start()
+        drain.start()
+        try:
+            for line in proc.stdout:
+                yield line.rstrip("\n")
+            proc.wait()
+        finally:
+            # early exit from the consumer (break, exception) kills the child
+            if proc.poll() is None:
+                _kill(proc)
+                proc.wait()
+                self._record(cmd, time.perf_counter() - t0, "cancelled")
+            watchdog.cancel()
+            drain.join()
+            proc.stdout.close()
+            proc.stderr.close()
+            self._release(proc, token, gate)
+            TRACER.interval("subprocess", "proc", t0, time.perf_counter() - t0,
+                            cmd=_command_line(cmd))
+        self._finish(cmd, proc, token, t0, expired.is_set(), "".join(err_chunks), True)
+
+    def cancel_all(self):
+        """Kill every live child (window close)."""
+        with self._lock:
+            procs = list(self._live)
+        for proc in procs:
+            _kill(proc)
+
+    def summary(self):
+        with self._lock:
+            return sorted(((name, dict(st)) for name, st in self.metrics.items()),
+                          key=lambda kv: kv[1]["wall"], reverse=True)
+
+    def clear(self):
+        with self._lock:
+            self.metrics.clear()
+
+
+def _command_line(cmd):
+    return (cmd if isinstance(cmd, str) else " ".join(cmd))[:120]
+
+
+RUNNER = CommandRunner()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  SCAN GOVERNOR
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+GOVERNOR_LIMITS = {
+    "files_per_s": 20000,   # files stat'ed per second per source (0 = no cap)
+    "procs": 2,             # subprocesses one source may run at once (0 = RUNNER's cap only)
+    "max_load": 0.8,        # pause while the 1-minute load per CPU is above this (0 = never)
+    "battery_factor": 0.25, # files_per_s multiplier while on battery
+    "min_battery": 20,      # pause below this charge (%) while on battery (0 = never)
+    "background": True,     # background CPU/I-O priority for walk threads and subprocesses
+}
+BACKGROUND_NICE = 10
+QOS_CLASS_BACKGROUND = 0x09
+IOPRIO_IDLE = 3 << 13  # IOPRIO_CLASS_IDLE, level 0
+_IOPRIO_SET = {"x86_64": 251, "aarch64": 30, "arm64": 30}
+
+
+def power_state():
+    """(on battery, charge %) of this machine; (False, None) where it cannot be told."""
+    if sys.platform == "darwin":
+        try:
+            raw = RUNNER.check_output(["pmset", "-g", "batt"], timeout=5)
+        except CommandError:
+            return False, None
+        m = re.search(r"(\d+)%", raw)
+        return "'Battery Power'" in raw, int(m.group(1)) if m else None
+    on_battery, charge = False, None
+    for supply in glob.glob("/sys/class/power_supply/*"):
+        try:
+            with open(os.path.join(supply, "type")) as f:
+                if f.read().strip() != "Battery":
+                    continue
+            with open(os.path.join(supply, "status")) as f:
+                on_battery = on_battery or f.read().strip() == "Discharging"
+            with open(os.path.join(supply, "capacity")) as f:
+                charge = int(f.read().strip())
+        except (OSError, ValueError):
+            continue
+    return on_battery, charge
+
+
+def lower_thread_priority():
+    """Move the calling thread to background CPU and I/O priority (best effort, one way).
+
+    Linux will not let an unprivileged thread lower its nice value again, so
+    only call this on threads that do nothing but governed scan work.
+    """
+    try:
+        import ctypes
+        if sys.platform == "darwin":
+            ctypes.CDLL(None).pthread_set_qos_class_self_np(QOS_CLASS_BACKGROUND, 0)
+            return
+        tid = threading.get_native_id()
+        os.setpriority(os.PRIO_PROCESS, tid,
+                       max(os.getpriority(os.PRIO_PROCESS, tid), BACKGROUND_NICE))
+        nr = _IOPRIO_SET.get(platform.machine())
+        if nr is not None:
+            ctypes.CDLL(None).syscall(nr, 1, tid, IOPRIO_IDLE)  # IOPRIO_WHO_PROCESS = a thread
+    except (OSError, AttributeError):
+        pass
+
+
+class ScanGovernor:
+    """Keeps background scans polite: low priority, capped rates, backing off under pressure.
+
+    Off unless enabled (H4CK3R_GOVERN=1, ``scan --govern``, the daemon by
+    default).  Only work under a token tagged with a scan source is
+    governed; uninstalls and the GUI's own commands never wait.  Limits are
+    GOVERNOR_LIMITS, overridden by ``governor.json`` in APP_HOME::
+
+        {"default": {"files_per_s": 5000}, "sources": {"pkgutil": {"procs": 1}}}
+
+    Walks call ``throttle`` once per directory: a token bucket per source
+    paces files stat'ed, and while the load per CPU is above ``max_load`` or
+    the battery is below ``min_battery`` every governed walk waits.  RUNNER
+    takes a per-source slot (``acquire_proc``) before spawning and starts
+    governed commands under taskpolicy / nice + ionice.  Waiting counts
+    toward the source deadline, so a source held back long enough comes
+    back partial.  ``snapshot`` returns the live counters.
+    """
+    LOAD_TTL_S = 2
+    POWER_TTL_S = 60
+    FREE = ("", None)  # gate of an ungoverned command
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._limits = {}
+        self._buckets = {}  # source -> [tokens, last refill]
+        self._sems = {}
+        self._load = (0.0, 0.0)            # (when, load per CPU)
+        self._power = (-1e9, (False, None))
+        self._waiting = 0
+        self._paused = None  # reason while any walk is paused
+        self._active = -1e9  # last governed walk step
+        self.totals = {"files": 0, "throttled_s": 0.0, "paused_s": 0.0, "pauses": 0}
+        self.sources = {}
+        self.configure(bool(os.environ.get("H4CK3R_GOVERN")))
+
+    def configure(self, enabled=True, path=None):
+        """Switch on/off and (re)read governor.json; commands already holding a slot keep it."""
+        path = Path(path) if path else APP_HOME / "governor.json"
+        try:
+            with open(path, encoding="utf-8") as f:
+                doc = json.load(f)
+        except (OSError, ValueError):
+            doc = {}
+        with self._lock:
+            self.enabled = enabled
+            self.default = {**GOVERNOR_LIMITS, **doc.get("default", {})}
+            self.overrides = doc.get("sources", {})
+            self._limits.clear()
+            self._buckets.clear()
+            self._sems.clear()
+        return self
+
+    def limits(self, source):
+        lim = self._limits.get(source)
+        if lim is None:
+            lim = self._limits[source] = {**self.default, **self.overrides.get(source, {})}
+        return lim
+
+    def _source(self, token):
+        if not self.enabled or token is None:
+            return None
+        return token.source
+
+    def _stats(self, source):
+        st = self.sources.get(source)
+        if st is None:
+            st = self.sources[source] = {"files": 0, "throttled_s": 0.0, "paused_s": 0.0,
+                                         "procs": 0, "waits": 0}
+        return st
+
+    # ── pressure ──
+    def load(self):
+        when, value = self._load
+        now = time.monotonic()
+        if now - when > self.LOAD_TTL_S:
+            try:
+                value = os.getloadavg()[0] / (os.cpu_count() or 1)
+            except OSError:
+                value = 0.0
+            self._load = (now, value)
+        return value
+
+    def power(self):
+        when, value = self._power
+        now = time.monotonic()
+        if now - when > self.POWER_TTL_S:
+            self._power = (now, value)  # one refresher at a time
+            value = power_state()
+            self._power = (now, value)
+        return value
+
+    def _pause_reason(self, lim):
+        if lim["max_load"] and self.load() > lim["max_load"]:
+            return f"load {self.load():.2f}/cpu"
+        on_battery, charge = self.power()
+        if on_battery and charge is not None and charge < lim["min_battery"]:
+            return f"battery {charge}%"
+        return None
+
+    def _sleep(self, token, seconds):
+        """Sleep up to ``seconds`` in short slices; False if ``token`` fired meanwhile."""
+        end = time.monotonic() + seconds
+        while not token.cancelled:
+            left = end - time.monotonic()
+            if left <= 0:
+                return True
+            time.sleep(min(left, 0.1))
+        return False
+
+    # ── walks ──
+    def throttle(self, token, files=1):
+        """Account ``files`` about to be stat'ed; waits while the source is over budget."""
+        source = self._source(token)
+        if source is None:
+            return
+        lim = self.limits(source)
+        if lim["background"] and not getattr(self._local, "lowered", False):
+            self._local.lowered = True
+            lower_thread_priority()
+        reason = self._pause_reason(lim)
+        if reason is not None:
+            with self._lock:
+                if self._paused is None:
+                    self.totals["pauses"] += 1
+                self._paused = reason
+                self._waiting += 1
+            t0 = time.monotonic()
+            while reason is not None and self._sleep(token, 1.0):
+                reason = self._pause_reason(lim)
+                self._paused = reason or self._paused
+            with self._lock:
+                self._waiting -= 1
+                if not self._waiting:
+                    self._paused = None
+                self.totals["paused_s"] += time.monotonic() - t0
+                self._stats(source)["paused_s"] += time.monotonic() - t0
+        rate = lim["files_per_s"]
+        if rate and self.power()[0]:
+            rate *= lim["battery_factor"]
+        now = self._active = time.monotonic()
+        wait = 0.0
+        with self._lock:
+            st = self._stats(source)
+            st["files"] += files
+            self.totals["files"] += files
+            if rate > 0:
+                bucket = self._buckets.get(source)
+                if bucket is None:
+                    bucket = self._buckets[source] = [rate, now]
+                bucket[0] = min(rate, bucket[0] + (now - bucket[1]) * rate) - files
+                bucket[1] = now
+                if bucket[0] < 0:
+                    wait = -bucket[0] / rate
+                    st["waits"] += 1
+                    self._waiting += 1
+        if wait:
+            self._sleep(token, wait)
+            slept = time.monotonic() - now
+            with self._lock:
+                self._waiting -= 1
+                st["throttled_s"] += slept
+                self.totals["throttled_s"] += slept
+
+    # ── subprocesses ──
+    def proc_cap(self, token):
+        """The source's subprocess cap for ``token`` (0 = not governed / uncapped)."""
+        source = self._source(token)
+        return self.limits(source)["procs"] if source is not None else 0
+
+    def acquire_proc(self, token):
+        """Gate for one governed command (FREE if ungoverned); None if ``token`` fired first."""
+        cap = self.proc_cap(token)
+        if not cap:
+            return self.FREE
+        with self._lock:
+            sem = self._sems.get(token.source)
+            if sem is None:
+                sem = self._sems[token.source] = threading.BoundedSemaphore(cap)
+        while not sem.acquire(timeout=0.1):
+            if token.cancelled:
+                return None
+        self._count_proc(token.source, 1)
+        return token.source, sem
+
+    def release_proc(self, gate):
+        source, sem = gate or self.FREE
+        if sem is not None:
+            self._count_proc(source, -1)
+            sem.release()
+
+    def _count_proc(self, source, delta):
+        with self._lock:
+            self._stats(source)["procs"] += delta
+
+    def wrap(self, cmd, token):
+        """``cmd`` started at background priority when ``token``'s source is governed."""
+        source = self._source(token)
+        if source is None or not self.limits(source)["background"]:
+            return cmd
+        if not isinstance(cmd, str) and shutil.which(cmd[0]) is None:
+            return cmd  # let Popen report "not found" rather than the launcher
+        if sys.platform == "darwin" and shutil.which("taskpolicy"):
+            prefix = ["taskpolicy", "-b"]
+        else:
+            prefix = ["nice", "-n", str(BACKGROUND_NICE)]
+            if shutil.which("ionice"):
+                prefix = ["ionice", "-c3"] + prefix
+        if isinstance(cmd, str):
+            return " ".join(prefix + ["/bin/sh", "-c", shlex.quote(cmd)])
+        return prefix + list(cmd)
+
+    # ── counters ──
+    def state(self):
+        if not self.enabled:
+            return "off"
+        with self._lock:
+            if self._paused:
+                return f"paused ({self._paused})"
+            if self._waiting:
+                return "throttled"
+            return "running" if time.monotonic() - self._active < 2 else "idle"
+
+    def snapshot(self):
+        """Live counters: totals, per-source counters, current pressure."""
+        on_battery, charge = self._power[1]
+        state = self.state()
+        with self._lock:
+            return {
+                "enabled": self.enabled, "state": state,
+                "load": round(self._load[1], 2), "on_battery": on_battery, "battery": charge,
+                **{k: round(v, 1) if isinstance(v, float) else v for k, v in self.totals.items()},
+                "sources": {key: {k: round(v, 1) if isinstance(v, float) else v
+                                  for k, v in st.items()}
+                            for key, st in sorted(self.sources.items())},
+            }
+
+    def clear(self):
+        with self._lock:
+            self.totals = {"files": 0, "throttled_s": 0.0, "paused_s": 0.0, "pauses": 0}
+            for st in self.sources.values():
+                st.update(files=0, throttled_s=0.0, paused_s=0.0, waits=0)
+
+
+GOVERNOR = ScanGovernor()
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 #  HACKER ICON
@@ -371,7 +1297,7 @@ QFrame#statsBox {{
 }}
 
 /* ── Text edit (terminal) ── */
-QTextEdit {{
+QTextEdit, QPlainTextEdit {{
     background: {BG_DARKEST};
     color: {NEON_GREEN};
     border: 1px solid {NEON_GREEN_DARK};
@@ -470,325 +1396,4673 @@ QDialog {{
 #  MATRIX RAIN WIDGET
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class MatrixRain(QWidget):
-    """A small Matrix-style digital rain background strip."""
+    """A small Matrix-style digital rain background strip.
+
+    Glyphs are pre-rendered once per brightness level into an atlas pixmap
+    and blitted with drawPixmap; column state lives in fixed-size arrays, so
+    a frame allocates nothing.  The timer stops while the strip is hidden and
+    idles while the window is occluded or minimised.
+    """
+    ROWS = 8
+    CELL_H = 6
+    GLYPH_W = 8
+    MAX_AGE = 10
+    FRAME_MS = 60
+    LOW_POWER_FRAME_MS = 200
+    IDLE_POLL_MS = 500
+    # brightness level by age: head, bright, dim, dark
+    LEVEL_COLORS = ("#ffffff", NEON_GREEN, NEON_GREEN_DIM, NEON_GREEN_DARK)
+    AGE_LEVEL = bytes([0, 1, 1, 2, 2, 2, 3, 3, 3, 3, 3])
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.columns = 80
-        self.drops = [random.randint(-20, 0) for _ in range(self.columns)]
         self.chars = "01アイウエオカキクケコサシスセソタチツテトナニヌネノハヒフヘホマミムメモヤユヨラリルレロワヲン"
-        self.grid = {}
+        self.drops = array("i", (random.randint(-20, 0) for _ in range(self.columns)))
+        cells = self.columns * self.ROWS
+        self.cell_glyph = array("H", bytes(2 * cells))
+        self.cell_y = array("i", [-(1 << 30)] * cells)   # absolute row each cell was written at
+        self.atlas = None
+        self.low_power = False
+        self.running = False
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._tick)
-        self.timer.start(60)
         self.setFixedHeight(50)
 
+    def _frame_ms(self):
+        return self.LOW_POWER_FRAME_MS if self.low_power else self.FRAME_MS
+
+    def set_low_power(self, enabled):
+        self.low_power = enabled
+        if self.timer.isActive():
+            self.timer.start(self._frame_ms())
+
+    def start(self):
+        """The rain is decorative: the window calls this once startup is done."""
+        self.running = True
+        if self.isVisible():
+            self.timer.start(self._frame_ms())
+
+    def showEvent(self, event):
+        if self.running:
+            self.timer.start(self._frame_ms())
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def _build_atlas(self):
+        dpr = self.devicePixelRatioF()
+        atlas = QPixmap(int(self.GLYPH_W * len(self.chars) * dpr),
+                        int(self.CELL_H * len(self.LEVEL_COLORS) * dpr))
+        atlas.setDevicePixelRatio(dpr)
+        atlas.fill(QColor(BG_DARKEST))
+        p = QPainter(atlas)
+        p.setFont(QFont("Menlo", 5))
+        for level, color in enumerate(self.LEVEL_COLORS):
+            p.setPen(QColor(color))
+            for i, ch in enumerate(self.chars):
+                p.drawText(i * self.GLYPH_W, level * self.CELL_H, self.GLYPH_W, self.CELL_H,
+                           Qt.AlignmentFlag.AlignCenter, ch)
+        p.end()
+        self.atlas = atlas
+
+    def _exposed(self):
+        handle = self.window().windowHandle()
+        return handle is None or handle.isExposed()
+
     def _tick(self):
+        if not self._exposed():
+            # occluded / minimised: poll slowly until the window is back
+            if self.timer.interval() != self.IDLE_POLL_MS:
+                self.timer.setInterval(self.IDLE_POLL_MS)
+            return
+        if self.timer.interval() != self._frame_ms():
+            self.timer.setInterval(self._frame_ms())
+        n_chars = len(self.chars)
+        drops, glyphs, ys, rows = self.drops, self.cell_glyph, self.cell_y, self.ROWS
         for i in range(self.columns):
-            self.drops[i] += 1
-            y = self.drops[i]
-            self.grid[(i, y)] = random.choice(self.chars)
+            y = drops[i] + 1
+            drops[i] = y
+            cell = i * rows + y % rows
+            glyphs[cell] = random.randrange(n_chars)
+            ys[cell] = y
             if y > 8 and random.random() > 0.95:
-                self.drops[i] = random.randint(-10, 0)
+                drops[i] = random.randint(-10, 0)
         self.update()
 
     def paintEvent(self, event):
+        if self.atlas is None or self.atlas.devicePixelRatio() != self.devicePixelRatioF():
+            self._build_atlas()
         p = QPainter(self)
         p.fillRect(self.rect(), QColor(BG_DARKEST))
+        atlas, gw, ch = self.atlas, self.GLYPH_W, self.CELL_H
+        dpr = atlas.devicePixelRatio()
+        sgw, sch = int(gw * dpr), int(ch * dpr)   # source rects are in device pixels
         cell_w = max(self.width() // self.columns, 1)
-        cell_h = 6
-        for (cx, cy), ch in list(self.grid.items()):
-            age = self.drops[cx % self.columns] - cy
-            if age > 10:
-                del self.grid[(cx, cy)]
-                continue
-            if age == 0:
-                p.setPen(QColor("#ffffff"))
-            elif age < 3:
-                p.setPen(QColor(NEON_GREEN))
-            elif age < 6:
-                p.setPen(QColor(NEON_GREEN_DIM))
-            else:
-                p.setPen(QColor(NEON_GREEN_DARK))
-            py = (cy % 8) * cell_h
-            p.setFont(QFont("Menlo", 5))
-            p.drawText(cx * cell_w, py, cell_w, cell_h,
-                       Qt.AlignmentFlag.AlignCenter, ch)
+        x_off = (cell_w - gw) // 2
+        drops, glyphs, ys, rows = self.drops, self.cell_glyph, self.cell_y, self.ROWS
+        age_level, max_age = self.AGE_LEVEL, self.MAX_AGE
+        for cx in range(self.columns):
+            head = drops[cx]
+            base = cx * rows
+            x = cx * cell_w + x_off
+            for r in range(rows):
+                age = head - ys[base + r]
+                if 0 <= age <= max_age:
+                    p.drawPixmap(x, r * ch, atlas,
+                                 glyphs[base + r] * sgw, age_level[age] * sch, sgw, sch)
         p.end()
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  BUNDLE METADATA
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PLIST_KEYS = {
+    "CFBundleShortVersionString": "version",
+    "CFBundleVersion": "build",
+    "CFBundleIdentifier": "bundle_id",
+    "CFBundleExecutable": "executable",
+    "LSMinimumSystemVersion": "min_os",
+}
+CPU_TYPES = {7: "i386", 0x01000007: "x86_64", 12: "arm", 0x0100000C: "arm64",
+             18: "ppc", 0x01000012: "ppc64"}
+FAT_MAGIC, FAT_MAGIC_64 = 0xCAFEBABE, 0xCAFEBABF
+# first four bytes of a thin Mach-O -> (struct byte order, header size)
+MACHO_MAGIC = {b"\xcf\xfa\xed\xfe": ("<", 32), b"\xce\xfa\xed\xfe": ("<", 28),
+               b"\xfe\xed\xfa\xcf": (">", 32), b"\xfe\xed\xfa\xce": (">", 28)}
+LC_CODE_SIGNATURE = 0x1D
+CSMAGIC_EMBEDDED_SIGNATURE, CSMAGIC_CODEDIRECTORY = 0xFADE0CC0, 0xFADE0C02
+CS_SUPPORTS_TEAMID = 0x20200
+META_THREADS = 8
+MDLS_BATCH = 256
+
+
+def bplist_strings(data, wanted):
+    """String values of the ``wanted`` top-level keys of a binary plist.
+
+    Reads the trailer, the offset table and the top dict, and decodes only
+    the matching keys and values.  None if ``data`` is not a binary plist
+    with a dict at the top; callers then fall back to plistlib.
+    """
+    if len(data) < 40 or not data.startswith(b"bplist00"):
+        return None
+    try:
+        off_size, ref_size, _, top, table = struct.unpack(">6xBBQQQ", data[-32:])
+
+        def offset(ref):
+            pos = table + ref * off_size
+            return int.from_bytes(data[pos:pos + off_size], "big")
+
+        def count(pos):
+            # a 0xF length nibble means an int object with the real count follows
+            low = data[pos] & 0xF
+            if low != 0xF:
+                return low, pos + 1
+            nbytes = 1 << (data[pos + 1] & 0xF)
+            return int.from_bytes(data[pos + 2:pos + 2 + nbytes], "big"), pos + 2 + nbytes
+
+        def string(ref):
+            pos = offset(ref)
+            n, start = count(pos)
+            if data[pos] >> 4 == 0x5:
+                return data[start:start + n].decode("ascii")
+            if data[pos] >> 4 == 0x6:
+                return data[start:start + 2 * n].decode("utf-16-be")
+            return None
+
+        pos = offset(top)
+        if data[pos] >> 4 != 0xD:
+            return None
+        n, start = count(pos)
+        refs = [int.from_bytes(data[start + i * ref_size:start + (i + 1) * ref_size], "big")
+                for i in range(2 * n)]
+        out = {}
+        for i in range(n):
+            key = string(refs[i])
+            if key in wanted:
+                value = string(refs[n + i])
+                if value is not None:
+                    out[key] = value
+        return out
+    except (IndexError, struct.error, UnicodeDecodeError):
+        return None
+
+
+def _signature_team(f, at):
+    """Team ID from the CodeDirectory of the embedded signature at ``at`` (None if unsigned/ad hoc)."""
+    f.seek(at)
+    head = f.read(12)
+    if len(head) < 12:
+        return None
+    magic, _, blobs = struct.unpack(">III", head)
+    if magic != CSMAGIC_EMBEDDED_SIGNATURE or blobs > 64:
+        return None
+    index = f.read(8 * blobs)
+    for i in range(len(index) // 8):
+        slot, offset = struct.unpack_from(">II", index, 8 * i)
+        if slot != 0:  # CSSLOT_CODEDIRECTORY
+            continue
+        f.seek(at + offset)
+        cd = f.read(52)
+        if len(cd) < 52:
+            return None
+        magic, _, version = struct.unpack_from(">III", cd)
+        team_offset, = struct.unpack_from(">I", cd, 48)
+        if magic != CSMAGIC_CODEDIRECTORY or version < CS_SUPPORTS_TEAMID or not team_offset:
+            return None
+        f.seek(at + offset + team_offset)
+        return f.read(64).split(b"\0", 1)[0].decode("ascii", "replace") or None
+    return None
+
+
+def _macho_slice(f, base, want_team):
+    """(arch, team ID) of the thin Mach-O at ``base`` in ``f``; None if there is none."""
+    f.seek(base)
+    head = f.read(28)
+    fmt = MACHO_MAGIC.get(head[:4])
+    if fmt is None or len(head) < 28:
+        return None
+    order, header_size = fmt
+    _, cputype, _, _, ncmds, sizeofcmds, _ = struct.unpack(order + "7I", head)
+    arch = CPU_TYPES.get(cputype, hex(cputype))
+    if not want_team:
+        return arch, None
+    f.seek(base + header_size)
+    cmds = f.read(min(sizeofcmds, 1 << 20))
+    pos = 0
+    for _ in range(ncmds):
+        if pos + 16 > len(cmds):
+            break
+        cmd, size, dataoff, _ = struct.unpack_from(order + "4I", cmds, pos)
+        if cmd == LC_CODE_SIGNATURE:
+            return arch, _signature_team(f, base + dataoff)
+        if size < 8:
+            break
+        pos += size
+    return arch, None
+
+
+def macho_info(path):
+    """(architectures, code-signing team ID) of a Mach-O file, thin or fat; ([], None) if neither."""
+    archs, team = [], None
+    try:
+        with open(path, "rb") as f:
+            head = f.read(8)
+            magic, nfat = struct.unpack(">II", head) if len(head) == 8 else (0, 0)
+            # Java class files share 0xCAFEBABE; their "count" is a large version number
+            if magic in (FAT_MAGIC, FAT_MAGIC_64) and nfat < 32:
+                entry = ">iiQQII" if magic == FAT_MAGIC_64 else ">iiIII"
+                size = struct.calcsize(entry)
+                table = f.read(size * nfat)
+                bases = [struct.unpack_from(entry, table, i * size)[2]
+                         for i in range(len(table) // size)]
+            else:
+                bases = [0]
+            for base in bases:
+                found = _macho_slice(f, base, team is None)
+                if found:
+                    archs.append(found[0])
+                    team = team or found[1]
+    except (OSError, struct.error):
+        pass
+    return archs, team
+
+
+def read_bundle_meta(app_path):
+    """Version, bundle ID, executable, minimum OS, architectures and team ID of an .app.
+
+    Binary Info.plists go through bplist_strings; XML ones through plistlib.
+    """
+    meta = {"version": "-"}
+    try:
+        with open(os.path.join(app_path, "Contents", "Info.plist"), "rb") as f:
+            data = f.read()
+        info = bplist_strings(data, PLIST_KEYS)
+        if info is None:
+            info = plistlib.loads(data)
+        for key, field in PLIST_KEYS.items():
+            if isinstance(info.get(key), str):
+                meta[field] = info[key]
+    except Exception:
+        pass
+    if meta["version"] == "-" and "build" in meta:
+        meta["version"] = meta["build"]
+    if meta.get("executable"):
+        meta["archs"], meta["team_id"] = macho_info(
+            os.path.join(app_path, "Contents", "MacOS", meta["executable"]))
+    return meta
+
+
+def bundle_stamp(app_path, executable):
+    """mtimes of Info.plist and the main executable: what read_bundle_meta depends on."""
+    contents = os.path.join(app_path, "Contents")
+    return _mtime_stamp(os.path.join(contents, "Info.plist"),
+                        os.path.join(contents, "MacOS", executable or ""))
+
+
+class BundleMetaCache:
+    """read_bundle_meta results keyed by bundle path, reused while bundle_stamp matches.
+
+    Thread-safe; loaded on first use and written back by ``save`` only if
+    something was re-read.  Last-used dates are not cached: using an app
+    does not touch its bundle, so no mtime would notice.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else APP_HOME / "bundle-meta.json.gz"
+        self._entries = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._entries is None:
+                try:
+                    with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                        self._entries = json.load(f)
+                except (OSError, ValueError):
+                    self._entries = {}
+            return self._entries
+
+    def get(self, app_path, token=None):
+        GOVERNOR.throttle(token)
+        entry = self._load().get(app_path)
+        if entry is not None:
+            stamp, meta = entry
+            if stamp == bundle_stamp(app_path, meta.get("executable")):
+                METRICS.cache("bundle-meta", hits=1)
+                return meta
+        METRICS.cache("bundle-meta", misses=1)
+        meta = read_bundle_meta(app_path)
+        with self._lock:
+            self._entries[app_path] = [bundle_stamp(app_path, meta.get("executable")), meta]
+            self._dirty = True
+        return meta
+
+    def get_many(self, paths, token=None):
+        """``get`` for each path on a META_THREADS pool; stops early once ``token`` is cancelled."""
+        self._load()
+        out = []
+        pool = ThreadPoolExecutor(META_THREADS, thread_name_prefix="plist")
+        try:
+            for meta in pool.map(self.get, paths, [token] * len(paths)):
+                if token is not None and token.cancelled:
+                    break
+                out.append(meta)
+        finally:
+            pool.shutdown(cancel_futures=True)
+        return out
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = dict(self._entries)
+            self._dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        os.close(fd)
+        with gzip.open(tmp, "wt", compresslevel=1, encoding="utf-8") as f:
+            json.dump(entries, f, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+
+BUNDLE_META = BundleMetaCache()
+
+
+def bundle_meta_text(meta):
+    """Multi-line summary of an item's meta (bundle metadata, cache ages, leftover paths)."""
+    def day(ts):
+        return datetime.fromtimestamp(ts).strftime("%Y-%m-%d") if ts else None
+
+    lines = [
+        ("bundle id", meta.get("bundle_id")),
+        ("executable", meta.get("executable")),
+        ("arch", " + ".join(meta.get("archs") or ())),
+        ("min macOS", meta.get("min_os")),
+        ("team", meta.get("team_id")),
+        ("last used", meta.get("last_used")),
+        ("newest file", day(meta.get("newest_mtime"))),
+        ("last read", day(meta.get("newest_atime"))),
+        *(("path", p) for p in meta.get("paths", ())),
+    ]
+    return "\n".join(f"{label:<11} {value}" for label, value in lines if value)
+
+
+def last_used_command(paths):
+    return ["mdls", "-name", "kMDItemLastUsedDate", "-raw", "-nullMarker", "", *paths]
+
+
+def apply_last_used(items, raw):
+    """Attach ``mdls -raw`` output (one NUL-separated value per path, in order) to ``items``."""
+    for item, value in zip(items, raw.split("\0")):
+        item.meta = dict(item.meta or {}, last_used=value.strip() or None)
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 #  SCAN WORKER
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class InventoryItem:
+    """One inventory row as a __slots__ record; kind and version strings are interned.
+
+    Indexes like the dict it replaced (``item["name"]``, ``item.get("path")``,
+    ``item["size_mb"] = ...``), so exports, snapshots and diffs accept both.
+    ``uninstall_cmd`` is derived from the kind on access, not stored.
+    ``meta`` holds bundle metadata for apps (see read_bundle_meta), else None.
+    """
+    __slots__ = ("kind", "name", "version", "size_mb", "path", "partial", "meta")
+
+    def __init__(self, kind, name, version="-", size_mb=0, path="", partial=False, meta=None):
+        self.kind = sys.intern(kind)
+        self.name = name
+        self.version = sys.intern(version)
+        self.size_mb = size_mb
+        self.path = path
+        self.partial = partial
+        self.meta = meta
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d["kind"], d["name"], d.get("version") or "-", d.get("size_mb") or 0,
+                   d.get("path") or "", bool(d.get("partial")), d.get("meta"))
+
+    @property
+    def uninstall_cmd(self):
+        return uninstall_command(self)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        setattr(self, key, sys.intern(value) if key in ("kind", "version") else value)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def as_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __repr__(self):
+        return f"InventoryItem({self.kind!r}, {self.name!r}, {self.version!r})"
+
+
+def uninstall_command(item):
+    """Shell command that removes ``item``, derived from its kind."""
+    kind, name = item["kind"], item["name"]
+    if kind in ("Application", "User App", "Dev Cache"):
+        return f'rm -rf "{item["path"]}"'
+    if kind == "Brew Formula":
+        return f"brew uninstall --formula {name}"
+    if kind == "Brew Cask":
+        return f"brew uninstall --cask {name}"
+    if kind == "pip Package":
+        return f"pip3 uninstall -y --break-system-packages {name}"
+    if kind == "System Pkg":
+        return f"pkgutil --forget {name}"
+    if kind == "Leftover":
+        return "rm -rf " + " ".join(shlex.quote(p) for p in item["meta"]["paths"])
+    if kind in SOURCE_KINDS:
+        return SOURCE_KINDS[kind].remove_command(item)
+    return ""
+
+
+def filter_indices(items, kind, query):
+    """The TYPE / FIND filter over InventoryItems: exact kind ("All" = any),
+    case-insensitive name substring.  Returns matching positions as an array("i").
+    """
+    query = query.lower()
+    if kind == "All" and not query:
+        return array("i", range(len(items)))
+    if not query:
+        return array("i", [i for i, it in enumerate(items) if it.kind == kind])
+    if kind == "All":
+        return array("i", [i for i, it in enumerate(items) if query in it.name.lower()])
+    return array("i", [i for i, it in enumerate(items)
+                       if it.kind == kind and query in it.name.lower()])
+
+
+def app_bundles(folder):
+    """Sorted paths of the ``*.app`` bundles directly in ``folder``."""
+    try:
+        names = sorted(os.listdir(folder))
+    except OSError:
+        return []
+    return [os.path.join(folder, n) for n in names
+            if n.endswith(".app") and os.path.isdir(os.path.join(folder, n))]
+
+
+def app_item(path, kind, meta=None):
+    version = meta.get("version", "-") if meta else "-"
+    return InventoryItem(kind, os.path.basename(path).replace(".app", ""), version, 0, path,
+                         meta=meta)
+
+
+def brew_item(line, kind, cellar=""):
+    """Item for one ``brew list --versions`` line (None for a blank one)."""
+    parts = line.split()
+    if not parts:
+        return None
+    name = parts[0]
+    return InventoryItem(kind, name, parts[1] if len(parts) > 1 else "-", 0,
+                         os.path.join(cellar, name) if kind == "Brew Formula" else "")
+
+
+def pip_items(raw):
+    """Items from ``pip3 list --format=json``; ValueError on garbage."""
+    return [InventoryItem("pip Package", pkg["name"], pkg.get("version", "-"))
+            for pkg in json.loads(raw)]
+
+
+def pkgutil_item(pkg):
+    return InventoryItem("System Pkg", pkg)
+
+
+# (row name, path under $HOME, prune unit); None = `brew --cache`.  Prune units:
+# "files" drops old files one by one (content-addressed caches), "children"
+# drops a whole child (one project, archive or simulator) only if all of it is old.
+DEV_CACHES = (
+    ("pip cache", "Library/Caches/pip", "files"),
+    ("Homebrew cache", None, "files"),
+    ("npm cache", ".npm/_cacache", "files"),
+    ("Yarn cache", "Library/Caches/Yarn", "files"),
+    ("Xcode DerivedData", "Library/Developer/Xcode/DerivedData", "children"),
+    ("Xcode Archives", "Library/Developer/Xcode/Archives", "children"),
+    ("Xcode DeviceSupport", "Library/Developer/Xcode/iOS DeviceSupport", "children"),
+    ("CoreSimulator devices", "Library/Developer/CoreSimulator/Devices", "children"),
+    ("CoreSimulator caches", "Library/Developer/CoreSimulator/Caches", "files"),
+)
+PRUNE_UNITS = {name: unit for name, _, unit in DEV_CACHES}
+
+
+def dev_cache_items(brew_cache=""):
+    """"Dev Cache" rows for the DEV_CACHES that exist; a walk fills size and ages."""
+    home = Path.home()
+    brew_cache = brew_cache or str(home / "Library" / "Caches" / "Homebrew")
+    items = []
+    for name, rel, _ in DEV_CACHES:
+        path = brew_cache if rel is None else str(home / rel)
+        if os.path.isdir(path):
+            items.append(InventoryItem("Dev Cache", name, "-", 0, path, meta={}))
+    return items
+
+
+def dir_usage(path, token=None):
+    """(bytes, newest mtime, newest atime) of the files under ``path``; links are not followed."""
+    total, newest_m, newest_a = 0, 0.0, 0.0
+    with TRACER.span("walk", "io", path=path) as sp:
+        for dirpath, _, filenames in os.walk(path):
+            if token is not None and token.cancelled:
+                break
+            GOVERNOR.throttle(token, len(filenames))
+            for f in filenames:
+                try:
+                    st = os.lstat(os.path.join(dirpath, f))
+                except OSError:
+                    continue
+                total += st.st_size
+                newest_m = max(newest_m, st.st_mtime)
+                newest_a = max(newest_a, st.st_atime)
+        sp.add("bytes", total)
+    return total, newest_m, newest_a
+
+
+def prune_cache(path, unit, cutoff, token=None, dry_run=False, progress=None):
+    """Delete what under ``path`` was neither modified nor read since ``cutoff`` (epoch s).
+
+    Deletes while it walks (os.walk bottom-up, or one child at a time), so
+    only the directory being visited is ever listed in memory.  With
+    ``dry_run`` nothing is deleted.  Returns (entries removed, bytes freed);
+    ``progress(removed, freed)`` is called every 500 entries.
+    """
+    removed = freed = 0
+
+    def gone(nbytes):
+        nonlocal removed, freed
+        removed += 1
+        freed += nbytes
+        if progress and removed % 500 == 0:
+            progress(removed, freed)
+
+    if unit == "children":
+        try:
+            with os.scandir(path) as it:
+                for e in it:
+                    if token is not None and token.cancelled:
+                        break
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            nbytes, newest_m, newest_a = dir_usage(e.path, token)
+                        else:
+                            st = e.stat(follow_symlinks=False)
+                            nbytes, newest_m, newest_a = st.st_size, st.st_mtime, st.st_atime
+                        if max(newest_m, newest_a) >= cutoff or (token is not None and token.cancelled):
+                            continue
+                        if not dry_run:
+                            if e.is_dir(follow_symlinks=False):
+                                shutil.rmtree(e.path)
+                            else:
+                                os.unlink(e.path)
+                    except OSError:
+                        continue
+                    gone(nbytes)
+        except OSError:
+            pass
+        return removed, freed
+
+    for dirpath, _, filenames in os.walk(path, topdown=False):
+        if token is not None and token.cancelled:
+            break
+        for f in filenames:
+            fp = os.path.join(dirpath, f)
+            try:
+                st = os.lstat(fp)
+                if max(st.st_mtime, st.st_atime) >= cutoff:
+                    continue
+                if not dry_run:
+                    os.unlink(fp)
+            except OSError:
+                continue
+            gone(st.st_size)
+        if dirpath != path and not dry_run:
+            try:
+                os.rmdir(dirpath)  # only if the sweep left it empty
+            except OSError:
+                pass
+    return removed, freed
+
+
+def pkg_info_version(info):
+    for ln in info.splitlines():
+        if ln.startswith("version:"):
+            return ln.split(":", 1)[1].strip()
+    return "-"
+
+
+def finish_source(key, items, stamp, state, checkpoints, warn):
+    """Flag a source's items partial if it hit its deadline and checkpoint it."""
+    if state == "partial":
+        for it in items:
+            it["partial"] = True
+    if checkpoints is not None:
+        try:
+            checkpoints.save(key, items, stamp, complete=state == "done")
+        except OSError as e:
+            warn(f"[WARN] checkpoint {key}: {e}")
+
+
+RECEIPTS_DIR = os.environ.get("H4CK3R_RECEIPTS", "/var/db/receipts")
+SCAN_DEADLINE_S = float(os.environ.get("H4CK3R_SOURCE_DEADLINE", "120"))
+CHECKPOINT_SCHEMA = "h4ck3r.checkpoint"
+CHECKPOINT_VERSION = 2  # v2 rows carry partial and meta
+CHECKPOINT_COLUMNS = ("kind", "name", "version", "size_mb", "path", "partial", "meta")
+CHECKPOINT_TTL_S = 3600
+
+
+def _mtime_stamp(*paths):
+    """Cheap change marker for a source: mtimes of the directories it lists."""
+    stamp = []
+    for path in paths:
+        try:
+            stamp.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return stamp
+
+
+def _brew_prefix():
+    brew = shutil.which("brew")
+    return os.path.dirname(os.path.dirname(brew)) if brew else ""
+
+
+@functools.lru_cache(maxsize=4)
+def _pip_site_packages(pip):
+    # "pip X.Y from /…/site-packages/pip (python 3.x)"
+    try:
+        out = RUNNER.check_output([pip, "--version"], timeout=10).strip()
+    except CommandError:
+        return ""
+    if " from " not in out:
+        return ""
+    return os.path.dirname(out.split(" from ", 1)[1].rsplit(" (python", 1)[0])
+
+
+def pip_site_packages():
+    """site-packages of the ``pip3`` on PATH ("" if there is none); asked once per pip3."""
+    pip = shutil.which("pip3")
+    return _pip_site_packages(os.path.realpath(pip)) if pip else ""
+
+
+def source_stamp(key):
+    """Checkpoint stamp for a source: the mtimes of the directories it lists.
+
+    None when a source has no such directory (dev caches grow without
+    touching one); its checkpoints are never reused.
+    """
+    brew, site = _brew_prefix(), pip_site_packages() if key == "pip" else ""
+    dirs = {
+        "applications": ["/Applications"],
+        "user-applications": [str(Path.home() / "Applications")],
+        "brew-formulae": [os.path.join(brew, "Cellar")] if brew else None,
+        "brew-casks": [os.path.join(brew, "Caskroom")] if brew else None,
+        "pkgutil": [RECEIPTS_DIR],
+        "pip": [site] if site else None,
+    }.get(key)
+    if key in SOURCE_KEYS:
+        return SOURCE_KEYS[key].stamp()
+    return _mtime_stamp(*dirs) if dirs else None
+
+
+class ScanCheckpoints:
+    """Per-source results of an unfinished scan, so a restart only re-runs what is missing.
+
+    A checkpoint is reused when its source completed, it is younger than
+    CHECKPOINT_TTL_S and the source has a stamp that still matches.  Rows keep
+    ``partial`` and ``meta``, so a resumed source is indistinguishable from
+    a re-run one.  A scan that finishes clears them; from then on the
+    snapshot is the record.
+    """
+
+    def __init__(self, root=None):
+        self.root = Path(root) if root else APP_HOME / "checkpoints"
+
+    def save(self, key, items, stamp, complete):
+        self.root.mkdir(parents=True, exist_ok=True)
+        doc = {
+            "schema": CHECKPOINT_SCHEMA,
+            "version": CHECKPOINT_VERSION,
+            "source": key,
+            "stamp": stamp,
+            "saved_at": time.time(),
+            "complete": complete,
+            "columns": list(CHECKPOINT_COLUMNS),
+            "rows": [[it["kind"], it["name"], it["version"], it.get("size_mb") or 0,
+                      it.get("path") or "", bool(it.get("partial")), it.get("meta")]
+                     for it in items],
+        }
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        os.close(fd)
+        with gzip.open(tmp, "wt", compresslevel=1, encoding="utf-8") as f:
+            json.dump(doc, f, separators=(",", ":"))
+        os.replace(tmp, self.root / f"{key}.json.gz")
+
+    def load(self, key, stamp):
+        try:
+            with gzip.open(self.root / f"{key}.json.gz", "rt", encoding="utf-8") as f:
+                doc = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (doc.get("schema") != CHECKPOINT_SCHEMA or doc.get("version") != CHECKPOINT_VERSION
+                or not doc.get("complete") or stamp is None or doc.get("stamp") != stamp
+                or time.time() - doc.get("saved_at", 0) > CHECKPOINT_TTL_S):
+            return None
+        cols = doc["columns"]
+        return [InventoryItem.from_dict(dict(zip(cols, row))) for row in doc["rows"]]
+
+    def clear(self):
+        if not self.root.is_dir():
+            return
+        for path in self.root.glob("*.json.gz"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
 class ScanWorker(QThread):
+    """One cancellable task per source, all in flight at once.
+
+    Each source runs under its own child CancelToken, which a deadline timer
+    fires after ``deadline`` seconds; whatever the source produced by then is
+    kept and flagged ``partial``.  Size walks are separate tasks on a shared
+    pool.  With ``checkpoints`` every finished source is saved, and sources
+    already saved (and unchanged) are loaded instead of re-run.
+    """
     progress = pyqtSignal(int, str)
+    warning = pyqtSignal(str)
+    source_done = pyqtSignal(str, int, str)  # key, items, done | resumed | partial | failed
     finished = pyqtSignal(list)
 
+    WALK_THREADS = 4
+
+    def __init__(self, checkpoints=None, deadline=SCAN_DEADLINE_S):
+        super().__init__()
+        self.token = CancelToken()
+        self.checkpoints = checkpoints
+        self.deadline = deadline
+        self._walk_pool = None
+
+    def cancel(self):
+        self.token.cancel()
+
+    def sources(self):
+        """(key, scan(out, token)) per inventory source."""
+        user_apps = str(Path.home() / "Applications")
+        return [
+            ("applications",
+             lambda out, tok: self._scan_applications("/Applications", "Application", out, tok)),
+            ("user-applications",
+             lambda out, tok: self._scan_applications(user_apps, "User App", out, tok)),
+            ("brew-formulae", self._scan_brew_formulae),
+            ("brew-casks", self._scan_brew_casks),
+            ("pip", self._scan_pip),
+            ("pkgutil", self._scan_pkgutil),
+            ("dev-caches", self._scan_dev_caches),
+        ] + [(src.key, functools.partial(self._scan_package_source, src))
+             for src in PACKAGE_SOURCES if src.available()]
+
     def run(self):
-        results = []
-        self.progress.emit(0, "[SCAN] /Applications ...")
-        results += self._scan_applications("/Applications", "Application")
-        self.progress.emit(15, "[SCAN] ~/Applications ...")
-        results += self._scan_applications(
-            str(Path.home() / "Applications"), "User App"
-        )
-        self.progress.emit(30, "[SCAN] Homebrew formulae ...")
-        results += self._scan_brew_formulae()
-        self.progress.emit(45, "[SCAN] Homebrew casks ...")
-        results += self._scan_brew_casks()
-        self.progress.emit(60, "[SCAN] pip3 packages ...")
-        results += self._scan_pip()
-        self.progress.emit(75, "[SCAN] System packages (pkgutil) ...")
-        results += self._scan_pkgutil()
-        self.progress.emit(100, f"[DONE] {len(results)} targets acquired")
-        self.finished.emit(results)
+        t0 = time.perf_counter()
+        sources = self.sources()
+        results, states = {}, {}
+        self.progress.emit(0, f"[SCAN] {len(sources)} sources ...")
+        self._walk_pool = ThreadPoolExecutor(self.WALK_THREADS, thread_name_prefix="walk")
+        try:
+            with TRACER.span("scan", "scan"), \
+                    ThreadPoolExecutor(len(sources), thread_name_prefix="scan") as pool:
+                futures = {pool.submit(self._run_source, *src): src[0] for src in sources}
+                for fut in as_completed(futures):
+                    key = futures[fut]
+                    results[key], states[key] = fut.result()
+                    if self.token.cancelled:
+                        continue
+                    self.source_done.emit(key, len(results[key]), states[key])
+                    self.progress.emit(len(results) * 100 // len(sources),
+                                       f"[SCAN] {key}: {len(results[key])} ({states[key]})")
+        finally:
+            self._walk_pool.shutdown(cancel_futures=True)
+            self._walk_pool = None
+        if self.token.cancelled:
+            return
+        if self.checkpoints is not None and all(s in ("done", "resumed") for s in states.values()):
+            self.checkpoints.clear()
+        try:
+            BUNDLE_META.save()
+        except OSError as e:
+            self.warning.emit(f"[WARN] bundle metadata cache: {e}")
+        items = [it for key, _ in sources for it in results[key]]
+        METRICS.inventory(items, time.perf_counter() - t0)
+        self.progress.emit(100, f"[DONE] {len(items)} targets acquired")
+        self.finished.emit(items)
+
+    def _run_source(self, key, scan):
+        started = time.perf_counter()
+        stamp = source_stamp(key)
+        if self.checkpoints is not None:
+            cached = self.checkpoints.load(key, stamp)
+            METRICS.cache("checkpoint", hits=int(cached is not None), misses=int(cached is None))
+            if cached is not None:
+                METRICS.scan_source(key, "resumed", len(cached), time.perf_counter() - started)
+                return cached, "resumed"
+        token = self.token.child()
+        token.source = key
+        deadline = threading.Timer(self.deadline, token.cancel)
+        deadline.daemon = True
+        deadline.start()
+        items, state = [], "done"
+        with TRACER.span(f"scan:{key}", "scan") as sp:
+            try:
+                scan(items, token)
+            except CommandCancelled:
+                pass
+            except CommandError as e:
+                self.warning.emit(f"[WARN] {e}")
+                state = "failed"
+            finally:
+                deadline.cancel()
+            sp.add("items", len(items))
+        if self.token.cancelled:
+            return items, "cancelled"
+        if token.cancelled:
+            state = "partial"
+        finish_source(key, items, stamp, state, self.checkpoints, self.warning.emit)
+        METRICS.scan_source(key, state, len(items), time.perf_counter() - started)
+        return items, state
 
     @staticmethod
-    def _get_app_version(app_path):
-        plist = os.path.join(app_path, "Contents", "Info.plist")
+    def _dir_size_mb(path, token=None):
+        total = 0
+        with TRACER.span("walk", "io", path=path) as sp:
+            try:
+                for dirpath, _, filenames in os.walk(path):
+                    if token is not None and token.cancelled:
+                        break
+                    GOVERNOR.throttle(token, len(filenames))
+                    for f in filenames:
+                        fp = os.path.join(dirpath, f)
+                        try:
+                            total += os.path.getsize(fp)
+                        except OSError:
+                            pass
+            except Exception:
+                pass
+            sp.add("bytes", total)
+        return round(total / (1024 * 1024), 1)
+
+    def _walk_sizes(self, walks, token, ages=False, walk=None):
+        """Fill size_mb for (item, target) pairs, one task per walk.
+
+        ``walk(target, token)`` returns the size in MB (default: _dir_size_mb
+        of a path).  With ``ages`` the newest file mtime/atime go into the
+        item's meta too.
+        """
+        pool = self._walk_pool or ThreadPoolExecutor(self.WALK_THREADS, thread_name_prefix="walk")
+        walk = dir_usage if ages else walk or self._dir_size_mb
         try:
-            with open(plist, "rb") as f:
-                data = plistlib.load(f)
-            return data.get("CFBundleShortVersionString",
-                            data.get("CFBundleVersion", "-"))
-        except Exception:
+            futures = {pool.submit(walk, path, token): item for item, path in walks}
+            for fut in as_completed(futures):
+                item = futures[fut]
+                if ages:
+                    nbytes, item.meta["newest_mtime"], item.meta["newest_atime"] = fut.result()
+                    item["size_mb"] = round(nbytes / (1024 * 1024), 1)
+                else:
+                    item["size_mb"] = fut.result()
+        finally:
+            if pool is not self._walk_pool:
+                pool.shutdown(cancel_futures=True)
+
+    def _scan_applications(self, folder, kind, out=None, token=None):
+        items = [] if out is None else out
+        token = token or self.token
+        paths = app_bundles(folder)
+        found = [app_item(path, kind, meta)
+                 for path, meta in zip(paths, BUNDLE_META.get_many(paths, token))]
+        items += found
+        self._fill_last_used(found, token)
+        self._walk_sizes([(item, item["path"]) for item in found], token)
+        return items
+
+    @staticmethod
+    def _fill_last_used(items, token):
+        """kMDItemLastUsedDate for app items, one mdls per MDLS_BATCH bundles."""
+        for i in range(0, len(items), MDLS_BATCH):
+            batch = items[i:i + MDLS_BATCH]
+            try:
+                raw = RUNNER.check_output(last_used_command([it["path"] for it in batch]),
+                                          timeout=30, token=token)
+            except CommandCancelled:
+                raise
+            except CommandError:
+                return  # no Spotlight: leave last_used unset
+            apply_last_used(batch, raw)
+
+    def _scan_brew_formulae(self, out=None, token=None):
+        items = [] if out is None else out
+        token = token or self.token
+        cellar = RUNNER.check_output(["brew", "--cellar"], timeout=5, token=token).strip()
+        walks = []
+        for line in RUNNER.lines(["brew", "list", "--formula", "--versions"],
+                                 timeout=30, token=token):
+            item = brew_item(line, "Brew Formula", cellar)
+            if item is None:
+                continue
+            items.append(item)
+            if os.path.isdir(item["path"]):
+                walks.append((item, item["path"]))
+        self._walk_sizes(walks, token)
+        return items
+
+    def _scan_brew_casks(self, out=None, token=None):
+        items = [] if out is None else out
+        for line in RUNNER.lines(["brew", "list", "--cask", "--versions"],
+                                 timeout=30, token=token or self.token):
+            item = brew_item(line, "Brew Cask")
+            if item is not None:
+                items.append(item)
+        return items
+
+    def _scan_pip(self, out=None, token=None):
+        items = [] if out is None else out
+        cmd = ["pip3", "list", "--format=json"]
+        raw = RUNNER.check_output(cmd, timeout=15, token=token or self.token)
+        try:
+            items += pip_items(raw)
+        except (ValueError, KeyError, TypeError):
+            raise CommandError(cmd, "unparseable JSON output")
+        return items
+
+    def _scan_dev_caches(self, out=None, token=None):
+        items = [] if out is None else out
+        token = token or self.token
+        brew_cache = os.environ.get("HOMEBREW_CACHE", "")
+        if not brew_cache and shutil.which("brew"):
+            try:
+                brew_cache = RUNNER.check_output(["brew", "--cache"], timeout=5, token=token).strip()
+            except CommandCancelled:
+                raise
+            except CommandError:
+                pass  # dev_cache_items falls back to the default location
+        found = dev_cache_items(brew_cache)
+        items += found
+        self._walk_sizes([(item, item["path"]) for item in found], token, ages=True)
+        return items
+
+    def _scan_package_source(self, source, out=None, token=None):
+        items = [] if out is None else out
+        token = token or self.token
+        found = []
+        for item in source.items(token):
+            if token.cancelled:
+                break
+            items.append(item)
+            found.append(item)
+        self._walk_sizes([(item, item) for item in found], token, walk=source.size)
+        return items
+
+    @staticmethod
+    def _pkg_version(pkg, token):
+        try:
+            info = RUNNER.check_output(["pkgutil", "--pkg-info", pkg], timeout=5, token=token)
+        except CommandCancelled:
+            raise
+        except CommandError:
             return "-"
+        return pkg_info_version(info)
+
+    def _scan_pkgutil(self, out=None, token=None):
+        items = [] if out is None else out
+        token = token or self.token
+        pkgs = sorted(p for p in RUNNER.lines(["pkgutil", "--pkgs"], timeout=15, token=token) if p)
+        found = [pkgutil_item(pkg) for pkg in pkgs]
+        items += found
+        # one --pkg-info per receipt; RUNNER caps how many run at once.  On
+        # cancel the receipts not reached yet keep version "-".
+        with ThreadPoolExecutor(max_workers=RUNNER.max_procs) as pool:
+            versions = pool.map(self._pkg_version, pkgs, [token] * len(pkgs))
+            for item, ver in zip(found, versions):
+                item["version"] = ver
+        return items
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  PACKAGE SOURCES
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class PackageSource(abc.ABC):
+    """A package manager read from its on-disk layout instead of its CLI.
+
+    A subclass sets ``key`` (scan source and checkpoint name), ``kind`` (row
+    type), ``alias`` (short kind for fleet queries) and ``colors`` (row
+    background, text), and implements items().  remove_command() may return
+    "" for a row that must not be removed.  Both scan engines run every
+    source in PACKAGE_SOURCES the same way: items() on a worker thread, then
+    size() per item on the walk pool, under the source's deadline; stamp()
+    decides whether a checkpoint of it is still good.
+    """
+    key = kind = alias = ""
+    colors = (BG_TABLE, NEON_GREEN)
+
+    def roots(self):
+        """Paths whose mtimes change when packages are added or removed."""
+        return []
+
+    def available(self):
+        return any(os.path.exists(p) for p in self.roots())
+
+    def stamp(self):
+        roots = self.roots()
+        return _mtime_stamp(*roots) if roots else None
+
+    @abc.abstractmethod
+    def items(self, token):
+        """Yield InventoryItems; size() fills size_mb afterwards."""
+
+    def size(self, item, token):
+        """Size in MB; by default a walk of the item's path."""
+        return ScanWorker._dir_size_mb(item["path"], token) if item.get("path") else 0
+
+    def remove_command(self, item):
+        """Shell command that removes ``item``."""
+        return f'rm -rf "{item["path"]}"'
+
+
+class MacPortsSource(PackageSource):
+    """Installed ports from the MacPorts registry database (read-only, no ``port`` call)."""
+    key, kind, alias = "macports", "MacPorts Port", "port"
+    colors = (ROW_BREW_FORM, NEON_ORANGE)
+
+    def __init__(self, prefix=None):
+        self.prefix = prefix or os.environ.get("MACPORTS_PREFIX", "/opt/local")
+        self.registry = os.path.join(self.prefix, "var", "macports", "registry", "registry.db")
+
+    def roots(self):
+        return [self.registry]
+
+    def _query(self, sql, *args):
+        try:
+            con = sqlite3.connect(Path(self.registry).as_uri() + "?mode=ro", uri=True)
+        except sqlite3.Error as e:
+            raise CommandError(["port"], f"registry: {e}")
+        try:
+            return con.execute(sql, args).fetchall()
+        except sqlite3.Error as e:
+            raise CommandError(["port"], f"registry: {e}")
+        finally:
+            con.close()
+
+    def items(self, token):
+        rows = self._query("SELECT name, version, revision, variants FROM ports "
+                           "WHERE state = 'installed' ORDER BY name")
+        for name, version, revision, variants in rows:
+            yield InventoryItem(self.kind, name, f"{version}_{revision}{variants or ''}", 0,
+                                os.path.join(self.prefix, "var", "macports", "software", name))
+
+    def size(self, item, token):
+        rows = self._query("SELECT f.actual_path FROM files f JOIN ports p ON f.id = p.id "
+                           "WHERE p.name = ? AND p.state = 'installed' AND f.active = 1",
+                           item["name"])
+        total = 0
+        for i, (path,) in enumerate(rows):
+            if token.cancelled:
+                break
+            if i % 256 == 0:
+                GOVERNOR.throttle(token, min(256, len(rows) - i))
+            try:
+                total += os.lstat(path).st_size
+            except (OSError, TypeError):
+                pass
+        return round(total / (1024 * 1024), 1)
+
+    def remove_command(self, item):
+        return f"port uninstall {shlex.quote(item['name'])} @{shlex.quote(item['version'])}"
+
+
+class CondaSource(PackageSource):
+    """conda environments of the usual installs plus ~/.conda/environments.txt; one row per env.
+
+    A base env is the install root and holds every named env in ``envs/``,
+    so it is never removed; named envs go through ``conda env remove``.
+    """
+    key, kind, alias = "conda", "conda Env", "conda"
+    colors = (ROW_PIP, NEON_GREEN_DIM)
+    INSTALLS = ("miniconda3", "anaconda3", "miniforge3", "mambaforge", "micromamba")
+
+    def installs(self):
+        home, brew = Path.home(), _brew_prefix()
+        candidates = [str(home / d) for d in self.INSTALLS]
+        candidates += [os.path.join("/opt", d) for d in self.INSTALLS]
+        if brew:
+            candidates += [os.path.join(brew, "Caskroom", cask, "base")
+                           for cask in ("miniconda", "miniforge", "anaconda")]
+        if os.environ.get("CONDA_EXE"):
+            candidates.append(os.path.dirname(os.path.dirname(os.environ["CONDA_EXE"])))
+        return [p for p in dict.fromkeys(candidates) if os.path.isdir(os.path.join(p, "conda-meta"))]
+
+    def envs(self):
+        """(env path, install root) for every environment, bases included."""
+        found = {}
+        for root in self.installs():
+            found[root] = root
+            try:
+                for name in sorted(os.listdir(os.path.join(root, "envs"))):
+                    found.setdefault(os.path.join(root, "envs", name), root)
+            except OSError:
+                pass
+        try:
+            with open(Path.home() / ".conda" / "environments.txt", encoding="utf-8") as f:
+                for line in f:
+                    found.setdefault(line.strip(), None)
+        except OSError:
+            pass
+        return [(p, root) for p, root in found.items()
+                if p and os.path.isdir(os.path.join(p, "conda-meta"))]
+
+    def roots(self):
+        return [str(Path.home() / ".conda" / "environments.txt")] + \
+            [os.path.join(p, "conda-meta") for p, _ in self.envs()]
+
+    def items(self, token):
+        for path, root in self.envs():
+            try:
+                names = [n for n in os.listdir(os.path.join(path, "conda-meta")) if n.endswith(".json")]
+            except OSError:
+                continue
+            python = next((n for n in names if n.startswith("python-") and n[7:8].isdigit()), "")
+            name = f"{os.path.basename(path)} (base)" if path == root else os.path.basename(path)
+            yield InventoryItem(self.kind, name, python.split("-")[1] if python else "-", 0, path,
+                                meta={"packages": len(names), "install": root, "base": path == root})
+
+    def remove_command(self, item):
+        meta = item.get("meta") or {}
+        if meta.get("base") or item["name"].endswith(" (base)"):
+            return ""
+        conda = os.path.join(meta["install"], "bin", "conda") if meta.get("install") else ""
+        conda = f'"{conda}"' if conda and os.path.exists(conda) else "conda"
+        return f'{conda} env remove -y -p "{item["path"]}"'
+
+
+class NpmGlobalSource(PackageSource):
+    """Globally installed npm packages: ``lib/node_modules`` of each known prefix."""
+    key, kind, alias = "npm-global", "npm Package", "npm"
+    colors = (ROW_BREW_CASK, NEON_YELLOW)
+
+    def node_modules(self):
+        prefixes = [os.environ.get("NPM_CONFIG_PREFIX", ""), _brew_prefix(), "/usr/local",
+                    "/opt/homebrew", str(Path.home() / ".npm-global")]
+        prefixes += sorted(glob.glob(str(Path.home() / ".nvm" / "versions" / "node" / "*")))
+        seen, out = set(), []
+        for prefix in filter(None, prefixes):
+            path = os.path.join(prefix, "lib", "node_modules")
+            real = os.path.realpath(path)
+            if real not in seen and os.path.isdir(path):
+                seen.add(real)
+                out.append(path)
+        return out
+
+    @staticmethod
+    def _packages(node_modules):
+        """(name, path) per package, scoped (@scope/name) ones included."""
+        try:
+            names = sorted(os.listdir(node_modules))
+        except OSError:
+            return []
+        out = []
+        for name in names:
+            path = os.path.join(node_modules, name)
+            if name.startswith("."):
+                continue
+            if name.startswith("@"):
+                try:
+                    out += [(f"{name}/{sub}", os.path.join(path, sub))
+                            for sub in sorted(os.listdir(path)) if not sub.startswith(".")]
+                except OSError:
+                    pass
+            else:
+                out.append((name, path))
+        return out
+
+    def roots(self):
+        roots = []
+        for nm in self.node_modules():
+            roots.append(nm)
+            try:
+                roots += [os.path.join(nm, n) for n in sorted(os.listdir(nm)) if n.startswith("@")]
+            except OSError:
+                pass
+        return roots
+
+    def items(self, token):
+        for nm in self.node_modules():
+            for name, path in self._packages(nm):
+                try:
+                    with open(os.path.join(path, "package.json"), encoding="utf-8") as f:
+                        version = json.load(f).get("version") or "-"
+                except (OSError, ValueError, AttributeError):
+                    version = "-"
+                yield InventoryItem(self.kind, name, str(version), 0, path)
+
+    def remove_command(self, item):
+        prefix = item["path"].split(f"{os.sep}lib{os.sep}node_modules{os.sep}")[0]
+        return f'npm uninstall -g --prefix "{prefix}" {shlex.quote(item["name"])}'
+
+
+_GEM_SPEC = re.compile(r"^(.+?)-(\d[^-]*)(?:-(.+))?$")
+
+
+class GemSource(PackageSource):
+    """Ruby gems from the ``specifications/*.gemspec`` of each gem dir (default gems skipped)."""
+    key, kind, alias = "gems", "Ruby Gem", "gem"
+    colors = (ROW_SYSTEM, NEON_RED_DIM)
+
+    def gem_dirs(self):
+        home, brew = Path.home(), _brew_prefix()
+        patterns = [str(home / ".gem" / "ruby" / "*"), str(home / ".local" / "share" / "gem" / "ruby" / "*"),
+                    str(home / ".rbenv" / "versions" / "*" / "lib" / "ruby" / "gems" / "*"),
+                    str(home / ".rubies" / "*" / "lib" / "ruby" / "gems" / "*"),
+                    "/usr/local/lib/ruby/gems/*", "/opt/homebrew/lib/ruby/gems/*"]
+        if brew:
+            patterns.append(os.path.join(brew, "lib", "ruby", "gems", "*"))
+        dirs = [os.environ["GEM_HOME"]] if os.environ.get("GEM_HOME") else []
+        for pattern in patterns:
+            dirs += sorted(glob.glob(pattern))
+        return [d for d in dict.fromkeys(dirs) if os.path.isdir(os.path.join(d, "specifications"))]
+
+    def roots(self):
+        return [os.path.join(d, "specifications") for d in self.gem_dirs()]
+
+    def items(self, token):
+        for gem_dir in self.gem_dirs():
+            try:
+                specs = sorted(os.listdir(os.path.join(gem_dir, "specifications")))
+            except OSError:
+                continue
+            for spec in specs:
+                m = _GEM_SPEC.match(spec[:-len(".gemspec")]) if spec.endswith(".gemspec") else None
+                if m:
+                    yield InventoryItem(self.kind, m.group(1), m.group(2), 0,
+                                        os.path.join(gem_dir, "gems", spec[:-len(".gemspec")]))
+
+    def remove_command(self, item):
+        gem_dir = os.path.dirname(os.path.dirname(item["path"]))
+        return (f'gem uninstall -x -I -i "{gem_dir}" -v {shlex.quote(item["version"])} '
+                f'{shlex.quote(item["name"])}')
+
+
+_CRATES_TOML = re.compile(r'^"(\S+) (\S+) [^"]*"\s*=\s*\[(.*)\]')
+
+
+class CargoSource(PackageSource):
+    """``cargo install``ed crates from $CARGO_HOME/.crates2.json (or the older .crates.toml)."""
+    key, kind, alias = "cargo", "Cargo Crate", "crate"
+    colors = (ROW_APP, NEON_ORANGE)
+
+    def __init__(self, home=None):
+        self.home = home or os.environ.get("CARGO_HOME") or str(Path.home() / ".cargo")
+
+    def roots(self):
+        return [os.path.join(self.home, ".crates2.json"), os.path.join(self.home, ".crates.toml")]
+
+    def crates(self):
+        """{(name, version): [bin names]}."""
+        try:
+            with open(os.path.join(self.home, ".crates2.json"), encoding="utf-8") as f:
+                installs = json.load(f).get("installs", {})
+            return {tuple(spec.split(" ")[:2]): info.get("bins", []) for spec, info in installs.items()}
+        except (OSError, ValueError, AttributeError):
+            pass
+        crates = {}
+        try:
+            with open(os.path.join(self.home, ".crates.toml"), encoding="utf-8") as f:
+                for line in f:
+                    m = _CRATES_TOML.match(line.strip())
+                    if m:
+                        crates[(m.group(1), m.group(2))] = re.findall(r'"([^"]+)"', m.group(3))
+        except OSError:
+            pass
+        return crates
+
+    def items(self, token):
+        for (name, version), bins in sorted(self.crates().items()):
+            path = os.path.join(self.home, "bin", bins[0]) if bins else ""
+            yield InventoryItem(self.kind, name, version, 0, path, meta={"bins": bins})
+
+    def size(self, item, token):
+        bins = (item.get("meta") or {}).get("bins") or [os.path.basename(item["path"])]
+        total = 0
+        for name in bins:
+            try:
+                total += os.path.getsize(os.path.join(self.home, "bin", name))
+            except OSError:
+                pass
+        return round(total / (1024 * 1024), 1)
+
+    def remove_command(self, item):
+        root = os.path.dirname(os.path.dirname(item["path"])) if item["path"] else self.home
+        return f'cargo uninstall --root "{root}" {shlex.quote(item["name"])}'
+
+
+PACKAGE_SOURCES = [MacPortsSource(), CondaSource(), NpmGlobalSource(), GemSource(), CargoSource()]
+SOURCE_KINDS = {src.kind: src for src in PACKAGE_SOURCES}
+SOURCE_KEYS = {src.key: src for src in PACKAGE_SOURCES}
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  PROCESS SCANNER
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+def ps_row(line):
+    """Process row for one ``ps aux`` line (None if it is malformed)."""
+    parts = line.split(None, 10)
+    if len(parts) < 11:
+        return None
+    return {
+        "user": parts[0],
+        "pid": parts[1],
+        "cpu": parts[2],
+        "mem": parts[3],
+        "command": parts[10][:120],
+    }
+
+
+class ProcessWorker(QThread):
+    warning = pyqtSignal(str)
+    finished = pyqtSignal(list)
+
+    def run(self):
+        procs = []
+        try:
+            lines = RUNNER.lines(["ps", "aux"], timeout=10)
+            next(lines, None)  # header
+            procs = [row for row in map(ps_row, lines) if row is not None]
+        except CommandError as e:
+            self.warning.emit(f"[WARN] {e}")
+        self.finished.emit(procs)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  USAGE TRACKING
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+USAGE_SCHEMA = "h4ck3r.usage"
+# seconds between process samples; 0 turns the sampler off
+USAGE_INTERVAL = float(os.environ.get("H4CK3R_USAGE_INTERVAL", "60"))
+USAGE_KINDS = ("Application", "User App", "Brew Formula")
+
+
+def usage_prefixes(items):
+    """{path prefix: item path} over bundle and keg paths; a formula also owns its opt/ link."""
+    index = {}
+    for it in items:
+        path = it.get("path")
+        if it["kind"] not in USAGE_KINDS or not path:
+            continue
+        index[path.rstrip("/")] = path
+        if it["kind"] == "Brew Formula":
+            index[os.path.join(os.path.dirname(os.path.dirname(path)), "opt", it["name"])] = path
+    return index
+
+
+def usage_owner(command, index, depth=12):
+    """Item path owning the executable at the start of ``command`` (None if no item does).
+
+    Every '/' boundary is tried from the left, so bundle paths with spaces
+    resolve, and helper apps nested in a bundle count for the outer one.
+    """
+    pos = command.find("/", 1)
+    while pos != -1 and depth:
+        owner = index.get(command[:pos])
+        if owner:
+            return owner
+        pos = command.find("/", pos + 1)
+        depth -= 1
+    return None
+
+
+def _mdls_time(value):
+    """Epoch seconds of an mdls date ("2024-05-01 09:30:00 +0000"), None if unparsable."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S %z").timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class UsageStore:
+    """Run time and last-seen time per inventory item, keyed by bundle or keg path.
+
+    ``items`` maps path -> [seconds seen running, last seen, first seen]
+    (epoch seconds).  ``started`` is the first sample ever taken, so an item
+    never seen has been unused for at least that long.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else APP_HOME / "usage.json.gz"
+        self.items = {}
+        self.started = None
+        self.last_sample = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                doc = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if doc.get("schema") == USAGE_SCHEMA:
+            self.items = doc.get("items", {})
+            self.started = doc.get("started")
+            self.last_sample = doc.get("last_sample")
+        return self
+
+    def save(self):
+        with self.lock:
+            doc = {"schema": USAGE_SCHEMA, "started": self.started,
+                   "last_sample": self.last_sample, "items": self.items}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            os.close(fd)
+            with gzip.open(tmp, "wt", compresslevel=1, encoding="utf-8") as f:
+                json.dump(doc, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+
+    def record(self, owners, now=None, interval=USAGE_INTERVAL):
+        """Credit every path in ``owners`` with the time since the previous sample.
+
+        A gap over twice the interval (sleep, app not running) credits one interval.
+        """
+        now = now or time.time()
+        with self.lock:
+            elapsed = now - self.last_sample if self.last_sample else interval
+            credit = elapsed if 0 < elapsed <= 2 * interval else interval
+            self.started = self.started or now
+            self.last_sample = now
+            for path in owners:
+                entry = self.items.get(path)
+                if entry is None:
+                    self.items[path] = [credit, now, now]
+                else:
+                    entry[0] += credit
+                    entry[1] = now
+
+    def stats(self, item, now=None):
+        """(days unused, True if never seen, MB per hour of use) for an inventory item.
+
+        Spotlight's last-used date (apps) counts as a sighting.  Days unused is
+        None when there is no data at all; MB/h is None until the item has run.
+        """
+        now = now or time.time()
+        entry = self.items.get(item.get("path")) if item.get("path") else None
+        seen = [t for t in (entry[1] if entry else None,
+                            _mdls_time((item.get("meta") or {}).get("last_used"))) if t]
+        if seen:
+            idle, never = (now - max(seen)) / 86400, False
+        elif self.started and item["kind"] in USAGE_KINDS:
+            idle, never = (now - self.started) / 86400, True
+        else:
+            return None, False, None
+        per_hour = item["size_mb"] / (entry[0] / 3600) if entry and entry[0] else None
+        return max(idle, 0.0), never, per_hour
+
+
+class UsageSampler(QThread):
+    """Samples ``ps aux`` every ``interval`` seconds and credits the items that own a process.
+
+    One ``ps`` and a few dict lookups per process and minute; the store is
+    written every ``save_every`` samples and on stop().
+    """
+    warning = pyqtSignal(str)
+
+    def __init__(self, store, interval=USAGE_INTERVAL, save_every=10):
+        super().__init__()
+        self.store = store
+        self.interval = interval
+        self.save_every = save_every
+        self._index = {}
+        self._stop = threading.Event()
+
+    def set_items(self, items):
+        self._index = usage_prefixes(items)
+
+    def sample(self):
+        index = self._index
+        lines = RUNNER.lines(["ps", "aux"], timeout=10)
+        next(lines, None)  # header
+        owners = {usage_owner(row["command"], index) for row in map(ps_row, lines) if row}
+        owners.discard(None)
+        self.store.record(owners, interval=self.interval)
+        return owners
+
+    def run(self):
+        taken = 0
+        while not self._stop.is_set():
+            if self._index:
+                try:
+                    self.sample()
+                    taken += 1
+                except CommandError as e:
+                    self.warning.emit(f"[WARN] usage sample: {e}")
+                if taken and taken % self.save_every == 0:
+                    self._save()
+            self._stop.wait(self.interval)
+
+    def _save(self):
+        try:
+            self.store.save()
+        except OSError as e:
+            self.warning.emit(f"[WARN] usage store: {e}")
+
+    def stop(self):
+        self._stop.set()
+        self.wait(2000)
+        if self.store.last_sample:
+            self._save()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  DISK USAGE WORKER
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class DiskWorker(QThread):
+    finished = pyqtSignal(dict)
+
+    @staticmethod
+    def _mounted_volumes():
+        """Boot volume, the APFS data volume and everything under /Volumes."""
+        candidates = ["/", "/System/Volumes/Data"]
+        try:
+            candidates += [os.path.join("/Volumes", n)
+                           for n in sorted(os.listdir("/Volumes"))]
+        except OSError:
+            pass
+        seen, mounts = set(), []
+        for mp in candidates:
+            try:
+                dev = os.stat(mp).st_dev
+            except OSError:
+                continue
+            # /Volumes/Macintosh HD is a symlink back to / — same device
+            if dev in seen or not os.path.ismount(mp):
+                continue
+            seen.add(dev)
+            mounts.append(mp)
+        return mounts
+
+    @staticmethod
+    def _usage(mount):
+        usage = shutil.disk_usage(mount)
+        return {
+            "mount": mount,
+            "total_gb": round(usage.total / (1024**3), 1),
+            "used_gb": round(usage.used / (1024**3), 1),
+            "free_gb": round(usage.free / (1024**3), 1),
+            "percent": round(usage.used / usage.total * 100, 1) if usage.total else 0,
+            "bytes": {"total": usage.total, "used": usage.used, "free": usage.free},
+        }
+
+    @classmethod
+    def collect(cls):
+        """Usage of the boot volume, plus every mounted volume under "volumes"."""
+        volumes = []
+        for mount in cls._mounted_volumes():
+            try:
+                volumes.append(cls._usage(mount))
+            except Exception:
+                pass
+        if volumes:
+            info = dict(volumes[0])
+        else:
+            info = {"mount": "/", "total_gb": 0, "used_gb": 0, "free_gb": 0, "percent": 0}
+        info["volumes"] = volumes
+        METRICS.disk(volumes)
+        return info
+
+    def run(self):
+        self.finished.emit(self.collect())
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  SPACE BREAKDOWN WORKER
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class SpaceWorker(QThread):
+    """Attributes used bytes to the inventory: apps, Cellar, Caskroom, pip, caches.
+
+    Sizes already measured by ScanWorker are reused, 0 MB included; only the
+    children of each root that the inventory does not cover, or whose source
+    hit its deadline (partial, maybe never walked), are walked, in parallel.
+    """
+    progress = pyqtSignal(int, str)
+    finished = pyqtSignal(list)
+
+    def __init__(self, items):
+        super().__init__()
+        self.items = items
+
+    @staticmethod
+    def _tool_output(cmd):
+        try:
+            return RUNNER.check_output(cmd, timeout=10).strip()
+        except CommandError:
+            return ""
+
+    def _roots(self):
+        home = Path.home()
+        return [
+            ("Applications", ["/Applications", str(home / "Applications")]),
+            ("Cellar", [self._tool_output(["brew", "--cellar"])]),
+            ("Caskroom", [self._tool_output(["brew", "--caskroom"])]),
+            ("pip site-packages", [pip_site_packages()]),
+            ("Caches", [str(home / "Library" / "Caches")]),
+        ]
+
+    def run(self):
+        cached = {it["path"]: it["size_mb"] for it in self.items
+                  if it.get("path") and it.get("size_mb") is not None and not it.get("partial")}
+        totals, pending = {}, []
+        for category, roots in self._roots():
+            totals[category] = {"category": category, "size_mb": 0.0,
+                                "cached": 0, "walked": 0}
+            for root in roots:
+                if not root or not os.path.isdir(root):
+                    continue
+                try:
+                    names = os.listdir(root)
+                except OSError:
+                    continue
+                for name in names:
+                    full = os.path.join(root, name)
+                    if full in cached:
+                        totals[category]["size_mb"] += cached[full]
+                        totals[category]["cached"] += 1
+                    else:
+                        pending.append((category, full))
+
+        self.progress.emit(0, f"[SPACE] walking {len(pending)} uncached paths ...")
+        workers = min(8, os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(self._path_size_mb, full): category
+                       for category, full in pending}
+            for done, fut in enumerate(as_completed(futures), 1):
+                category = futures[fut]
+                totals[category]["size_mb"] += fut.result()
+                totals[category]["walked"] += 1
+                if done % 50 == 0:
+                    self.progress.emit(int(done * 100 / len(pending)),
+                                       f"[SPACE] {done}/{len(pending)} walked")
+
+        rows = list(totals.values())
+        for row in rows:
+            row["size_mb"] = round(row["size_mb"], 1)
+        try:
+            used_mb = shutil.disk_usage(str(Path.home())).used / (1024 * 1024)
+            attributed = sum(r["size_mb"] for r in rows)
+            rows.append({"category": "Other", "size_mb": round(max(used_mb - attributed, 0), 1),
+                         "cached": 0, "walked": 0})
+        except OSError:
+            pass
+        rows.sort(key=lambda r: r["size_mb"], reverse=True)
+        self.finished.emit(rows)
+
+    @staticmethod
+    def _path_size_mb(path):
+        if os.path.isdir(path) and not os.path.islink(path):
+            return ScanWorker._dir_size_mb(path)
+        try:
+            return round(os.lstat(path).st_size / (1024 * 1024), 1)
+        except OSError:
+            return 0
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  LEFTOVER FINDER
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+LIBRARY_DIRS = ("Application Support", "Caches", "Containers", "Group Containers",
+                "Preferences", "Logs", "Saved Application State", "HTTPStorages")
+LIBRARY_INDEX_SCHEMA = "h4ck3r.library-index"
+_LIBRARY_SUFFIXES = (".plist", ".savedState", ".binarycookies", ".log")
+# Group Containers are "<TEAMID>.<id>" or "group.<id>"
+_GROUP_PREFIX = re.compile(r"^(?:[A-Z0-9]{10}\.|group\.)")
+
+
+def normalize_app_name(name):
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def library_key(name):
+    """("id", bundle ID) or ("name", normalized name) for a ~/Library entry name."""
+    for suffix in _LIBRARY_SUFFIXES:
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    name = _GROUP_PREFIX.sub("", name)
+    if name.count(".") >= 2 and " " not in name:
+        return "id", name.lower()
+    return "name", normalize_app_name(name)
+
+
+class LibraryIndex:
+    """Size and bundle-ID / name key of every entry in the LIBRARY_DIRS of ~/Library.
+
+    Each directory's own file bytes and subdirectory names are kept with its
+    mtime, and a directory whose mtime has not moved is not listed again, so
+    a repeat build only scandirs what changed.  A file growing in place does
+    not move its directory's mtime; it is picked up once the directory changes.
+    """
+    WALK_THREADS = 8
+
+    def __init__(self, library=None, path=None):
+        self.library = Path(library) if library else Path.home() / "Library"
+        self.path = Path(path) if path else APP_HOME / "library-index.json.gz"
+        self.dirs = {}     # dir -> [mtime_ns, file bytes, subdir names]
+        self.entries = []  # {"path", "dir", "key": (kind, value), "bytes"}
+        self.walked = 0    # directories listed by the last build
+
+    def load(self):
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                doc = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if doc.get("schema") == LIBRARY_INDEX_SCHEMA:
+            self.dirs = doc.get("dirs", {})
+        return self
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        os.close(fd)
+        with gzip.open(tmp, "wt", compresslevel=1, encoding="utf-8") as f:
+            json.dump({"schema": LIBRARY_INDEX_SCHEMA, "dirs": self.dirs}, f,
+                      separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    def _tree(self, root, token):
+        """(bytes under ``root``, {dir: record} for its directories, dirs listed)."""
+        total, seen, listed = 0, {}, 0
+        stack = [root]
+        while stack:
+            if token is not None and token.cancelled:
+                break
+            path = stack.pop()
+            try:
+                mtime = os.lstat(path).st_mtime_ns
+            except OSError:
+                continue
+            record = self.dirs.get(path)
+            if record is None or record[0] != mtime:
+                files, subdirs = 0, []
+                try:
+                    with os.scandir(path) as it:
+                        for e in it:
+                            try:
+                                if e.is_dir(follow_symlinks=False):
+                                    subdirs.append(e.name)
+                                else:
+                                    files += e.stat(follow_symlinks=False).st_size
+                            except OSError:
+                                pass
+                except OSError:
+                    pass
+                record = [mtime, files, subdirs]
+                listed += 1
+            seen[path] = record
+            total += record[1]
+            stack.extend(os.path.join(path, name) for name in record[2])
+        return total, seen, listed
+
+    def build(self, token=None, progress=None):
+        """Re-index; on cancel the previous index is kept."""
+        entries, trees = [], []
+        for sub in LIBRARY_DIRS:
+            try:
+                with os.scandir(self.library / sub) as it:
+                    for e in it:
+                        entry = {"path": e.path, "dir": sub, "key": library_key(e.name), "bytes": 0}
+                        try:
+                            if e.is_dir(follow_symlinks=False):
+                                trees.append(entry)
+                            else:
+                                entry["bytes"] = e.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            pass
+                        entries.append(entry)
+            except OSError:
+                continue
+        seen, walked = {}, 0
+        with TRACER.span("library_index", "io", entries=len(entries)) as sp, \
+                ThreadPoolExecutor(self.WALK_THREADS, thread_name_prefix="library") as pool:
+            futures = {pool.submit(self._tree, entry["path"], token): entry for entry in trees}
+            for done, fut in enumerate(as_completed(futures), 1):
+                futures[fut]["bytes"], dirs, listed = fut.result()
+                seen.update(dirs)
+                walked += listed
+                if progress and done % 50 == 0:
+                    progress(done, len(futures))
+            sp.add("walked", walked)
+        if token is not None and token.cancelled:
+            return self
+        self.dirs, self.entries, self.walked = seen, entries, walked
+        return self
+
+
+def installed_keys(items):
+    """(bundle IDs, normalized names) that the inventory accounts for."""
+    ids, names = set(), set()
+    for it in items:
+        names.add(normalize_app_name(it["name"]))
+        meta = it.get("meta") or {}
+        if meta.get("bundle_id"):
+            ids.add(meta["bundle_id"].lower())
+        if meta.get("executable"):
+            names.add(normalize_app_name(meta["executable"]))
+    names.discard("")
+    return ids, names
+
+
+def _id_owned(bundle_id, ids, names):
+    """An installed ID is a dot-prefix of ``bundle_id``, or one of its parts names an item."""
+    parts = bundle_id.split(".")
+    return (any(".".join(parts[:n]) in ids for n in range(2, len(parts) + 1))
+            or any(normalize_app_name(p) in names for p in parts[1:]))
+
+
+def find_leftovers(entries, items):
+    """Group the LibraryIndex entries nothing in ``items`` accounts for, biggest first.
+
+    Only bundle-ID entries (outside com.apple) start a group, and sub-IDs
+    join their parent's.  A name entry (``Application Support/Foo``) joins a
+    group whose last ID part is the same name; other name entries are left
+    alone, since nothing says which app they came from.
+    """
+    ids, names = installed_keys(items)
+    groups, loose = {}, []
+    for entry in sorted(entries, key=lambda e: len(e["key"][1])):
+        kind, key = entry["key"]
+        if kind == "name":
+            if key and key not in names:
+                loose.append(entry)
+            continue
+        if key.startswith("com.apple.") or _id_owned(key, ids, names):
+            continue
+        parts = key.split(".")
+        group = next((".".join(parts[:n]) for n in range(2, len(parts))
+                      if ".".join(parts[:n]) in groups), key)
+        groups.setdefault(group, []).append(entry)
+    by_name = {normalize_app_name(g.rsplit(".", 1)[1]): g for g in groups}
+    for entry in loose:
+        group = by_name.get(entry["key"][1])
+        if group:
+            groups[group].append(entry)
+    return sorted(({"key": g, "paths": [e["path"] for e in members],
+                    "bytes": sum(e["bytes"] for e in members)}
+                   for g, members in groups.items()),
+                  key=lambda g: g["bytes"], reverse=True)
+
+
+def app_leftovers(entries, item):
+    """LibraryIndex entries of app ``item``: its bundle ID or a sub-ID, or its name."""
+    bundle_id = ((item.get("meta") or {}).get("bundle_id") or "").lower()
+    name = normalize_app_name(item["name"])
+    out = []
+    for entry in entries:
+        kind, key = entry["key"]
+        if kind == "id" and bundle_id and (key == bundle_id or key.startswith(bundle_id + ".")):
+            out.append(entry)
+        elif kind == "name" and name and key == name:
+            out.append(entry)
+    return out
+
+
+def leftover_item(key, paths, nbytes):
+    """A "Leftover" inventory row: removable like any other, via rm -rf of ``paths``."""
+    return InventoryItem("Leftover", key, "-", round(nbytes / (1024 * 1024), 1), paths[0],
+                         meta={"paths": list(paths)})
+
+
+APP_KINDS = ("Application", "User App")
+
+
+def fill_bundle_ids(items):
+    """Read Info.plist for app rows that came without a bundle ID (snapshot, checkpoint, daemon).
+
+    Returns the app rows that still have none; matching must not run then,
+    or their Library data would be reported as orphaned.
+    """
+    missing = []
+    for it in items:
+        if it["kind"] not in APP_KINDS or (it.get("meta") or {}).get("bundle_id"):
+            continue
+        if os.path.isdir(it["path"] or ""):
+            it.meta = {**(it.get("meta") or {}), **BUNDLE_META.get(it["path"])}
+        if not it.meta or not it.meta.get("bundle_id"):
+            missing.append(it)
+    return missing
+
+
+class LeftoverWorker(QThread):
+    """Refreshes the LibraryIndex and matches it against the inventory.
+
+    Refuses (``failed``) when the inventory has no app rows, or an app row
+    has no bundle ID even after reading its Info.plist.
+    """
+    progress = pyqtSignal(int, str)
+    finished = pyqtSignal(list, list)  # orphan groups, index entries
+    failed = pyqtSignal(str)
+
+    def __init__(self, items, index):
+        super().__init__()
+        self.items = items
+        self.index = index
+        self.token = CancelToken()
+
+    def cancel(self):
+        self.token.cancel()
+
+    def run(self):
+        if not any(it["kind"] in APP_KINDS for it in self.items):
+            self.failed.emit("the inventory has no applications; not matching ~/Library against it")
+            return
+        missing = fill_bundle_ids(self.items)
+        if missing:
+            names = ", ".join(it["name"] for it in missing[:5])
+            self.failed.emit(f"{len(missing)} apps have no readable bundle ID ({names}); "
+                             f"not matching ~/Library against an incomplete inventory")
+            return
+        if not self.index.dirs:
+            self.index.load()
+        self.progress.emit(0, f"[LEFTOVERS] indexing ~/Library ({len(self.index.dirs)} dirs cached) ...")
+        self.index.build(self.token, lambda done, total: self.progress.emit(
+            done * 100 // total, f"[LEFTOVERS] {done}/{total} entries"))
+        if self.token.cancelled:
+            return
+        try:
+            self.index.save()
+        except OSError:
+            pass
+        self.finished.emit(find_leftovers(self.index.entries, self.items), self.index.entries)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  UNIVERSAL-BINARY SLIMMING
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+MACHO_CACHE_SCHEMA = "h4ck3r.macho-cache"
+# besides executables, files with these names are checked for a Mach-O header
+MACHO_SUFFIXES = (".dylib", ".so", ".bundle", ".node")
+
+
+def host_arch():
+    machine = platform.machine()
+    return {"aarch64": "arm64", "amd64": "x86_64"}.get(machine.lower(), machine)
+
+
+def macho_slices(buf):
+    """{arch: bytes} of the Mach-O image in ``buf`` (bytes or an mmap); {} if it is not one.
+
+    Only the header is read: a fat file's slice sizes come from its fat
+    table, and a thin file is a single slice the size of ``buf``.  A fat
+    table cut short, or a slice reaching past the end, gives {}.
+    """
+    if len(buf) < 28:
+        return {}
+    magic, nfat = struct.unpack_from(">II", buf)
+    if magic in (FAT_MAGIC, FAT_MAGIC_64) and nfat < 32:
+        entry = ">iiQQII" if magic == FAT_MAGIC_64 else ">iiIII"
+        size = struct.calcsize(entry)
+        out = {}
+        for i in range(nfat):
+            pos = 8 + i * size
+            if pos + size > len(buf):
+                return {}
+            cputype, _, offset, nbytes = struct.unpack_from(entry, buf, pos)[:4]
+            if offset + nbytes > len(buf):
+                return {}
+            arch = CPU_TYPES.get(cputype, hex(cputype))
+            out[arch] = out.get(arch, 0) + nbytes
+        return out
+    fmt = MACHO_MAGIC.get(bytes(buf[:4]))
+    if fmt is None:
+        return {}
+    cputype, = struct.unpack_from(fmt[0] + "I", buf, 4)
+    return {CPU_TYPES.get(cputype, hex(cputype)): len(buf)}
+
+
+def slim_scan_tree(root, cached):
+    """Mach-O slices of the candidate files under ``root``.  Runs in a worker process.
+
+    Candidates are executable regular files and MACHO_SUFFIXES.  Entries of
+    ``cached`` ({path: [inode, mtime_ns, slices]}) whose inode and mtime
+    still match are reused unread.  Returns (root, entries, files parsed).
+    """
+    entries, parsed = {}, 0
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.lstat(path)
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode) or st.st_size < 28 \
+                    or not (st.st_mode & 0o111 or name.endswith(MACHO_SUFFIXES)):
+                continue
+            hit = cached.get(path)
+            if hit is not None and hit[0] == st.st_ino and hit[1] == st.st_mtime_ns:
+                entries[path] = hit
+                continue
+            try:
+                with open(path, "rb") as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    slices = macho_slices(m)
+            except (OSError, ValueError):
+                slices = {}
+            entries[path] = [st.st_ino, st.st_mtime_ns, slices]
+            parsed += 1
+    return root, entries, parsed
+
+
+def slim_summary(root, entries, keep):
+    """Per-bundle totals: bytes per architecture, and what dropping all but ``keep`` frees."""
+    by_arch, macho, fat, reclaim = {}, 0, 0, 0
+    for _, _, slices in entries.values():
+        if not slices:
+            continue
+        macho += 1
+        for arch, nbytes in slices.items():
+            by_arch[arch] = by_arch.get(arch, 0) + nbytes
+        if len(slices) > 1:
+            fat += 1
+            if keep in slices:
+                reclaim += sum(n for arch, n in slices.items() if arch != keep)
+    return {"path": root, "macho_files": macho, "fat_files": fat, "by_arch": by_arch,
+            "reclaimable": reclaim}
+
+
+class SlimAnalyzer:
+    """Universal-binary report over app bundles and Cellar kegs.
+
+    One slim_scan_tree task per root on a process pool.  Parsed headers are
+    cached per file in APP_HOME, keyed by inode and mtime, so a repeat run
+    only opens files that were replaced.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else APP_HOME / "macho-cache.json.gz"
+        self.files = {}  # path -> [inode, mtime_ns, {arch: bytes}]
+        self.parsed = 0  # files opened by the last run
+
+    def load(self):
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                doc = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if doc.get("schema") == MACHO_CACHE_SCHEMA:
+            self.files = doc.get("files", {})
+        return self
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        os.close(fd)
+        with gzip.open(tmp, "wt", compresslevel=1, encoding="utf-8") as f:
+            json.dump({"schema": MACHO_CACHE_SCHEMA, "files": self.files}, f,
+                      separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    def _root_of(self, path, roots):
+        parent = os.path.dirname(path)
+        while parent not in roots:
+            up = os.path.dirname(parent)
+            if up == parent:
+                return None
+            parent = up
+        return parent
+
+    def run(self, roots, keep=None, workers=None, progress=None):
+        """Summaries for ``roots``, most reclaimable first."""
+        keep = keep or host_arch()
+        roots = [r for r in dict.fromkeys(roots) if os.path.isdir(r)]
+        wanted = set(roots)
+        cached = {root: {} for root in roots}
+        kept = {}
+        for path, entry in self.files.items():
+            root = self._root_of(path, wanted)
+            if root is None:
+                kept[path] = entry
+            else:
+                cached[root][path] = entry
+        rows, parsed = [], 0
+        with TRACER.span("slim", "io", roots=len(roots)), \
+                ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(slim_scan_tree, root, cached[root]) for root in roots]
+            for done, fut in enumerate(as_completed(futures), 1):
+                root, entries, n = fut.result()
+                kept.update(entries)
+                parsed += n
+                METRICS.cache("macho", hits=len(entries) - n, misses=n)
+                rows.append(slim_summary(root, entries, keep))
+                if progress:
+                    progress(done, len(futures))
+        self.files, self.parsed = kept, parsed
+        rows.sort(key=lambda r: r["reclaimable"], reverse=True)
+        return rows
+
+
+def slim_roots(items):
+    """App bundles and Cellar kegs of the inventory."""
+    return [it["path"] for it in items
+            if it["kind"] in ("Application", "User App", "Brew Formula") and it.get("path")]
+
+
+class SlimWorker(QThread):
+    progress = pyqtSignal(int, str)
+    finished = pyqtSignal(list)
+
+    def __init__(self, items):
+        super().__init__()
+        self.items = items
+        self.analyzer = SlimAnalyzer()
+
+    def run(self):
+        self.analyzer.load()
+        rows = self.analyzer.run(slim_roots(self.items), progress=lambda done, total: self.progress.emit(
+            done * 100 // total, f"[SLIM] {done}/{total} bundles"))
+        try:
+            self.analyzer.save()
+        except OSError:
+            pass
+        self.finished.emit(rows)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  TREEMAP ENGINE
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+TREEMAP_VISIBLE_DEPTH = 3
+TREEMAP_KEEP_DEPTH = 5      # levels kept below a scan root, so drill-downs are free
+TREEMAP_MAX_CHILDREN = 120  # per node, the rest is lumped into one tile
+
+
+class DiskNode:
+    """Aggregated size of one directory.  Files are never kept as objects:
+    they only add to ``own`` of the nearest kept directory."""
+    __slots__ = ("name", "path", "size", "own", "children", "parent",
+                 "depth_known", "complete")
+
+    def __init__(self, name, path, parent=None, depth_known=0):
+        self.name = name
+        self.path = path
+        self.size = 0
+        self.own = 0
+        self.children = {}
+        self.parent = parent
+        self.depth_known = depth_known
+        self.complete = False
+
+    def add(self, nbytes, own=False):
+        if own:
+            self.own += nbytes
+        node = self
+        while node is not None:
+            node.size += nbytes
+            node = node.parent
+
+    def snapshot(self, depth):
+        """Detached copy limited to ``depth`` levels, safe to hand to the UI thread."""
+        copy = DiskNode(self.name, self.path, None, min(depth, self.depth_known))
+        copy.size, copy.own, copy.complete = self.size, self.own, self.complete
+        if depth > 0:
+            for name, child in list(self.children.items()):
+                sub = child.snapshot(depth - 1)
+                sub.parent = copy
+                copy.children[name] = sub
+        return copy
+
+    def find(self, path):
+        """Descend to ``path`` if it lies inside this measured subtree."""
+        if path == self.path:
+            return self
+        prefix = self.path.rstrip(os.sep) + os.sep
+        if not path.startswith(prefix):
+            return None
+        node = self
+        for part in path[len(prefix):].split(os.sep):
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def tiles(self):
+        """(label, size, node) tiles sorted by size, own files as one tile."""
+        kids = sorted(self.children.values(), key=lambda n: n.size, reverse=True)
+        tiles = [(k.name, k.size, k) for k in kids[:TREEMAP_MAX_CHILDREN] if k.size > 0]
+        rest = sum(k.size for k in kids[TREEMAP_MAX_CHILDREN:])
+        if rest:
+            tiles.append((f"<{len(kids) - TREEMAP_MAX_CHILDREN} more>", rest, None))
+        if self.own:
+            tiles.append(("<files>", self.own, None))
+        tiles.sort(key=lambda t: t[1], reverse=True)
+        return tiles
+
+
+def _worst_ratio(row_sum, row_max, row_min, short):
+    s2, w2 = row_sum * row_sum, short * short
+    return max(w2 * row_max / s2, s2 / (w2 * row_min))
+
+
+def squarify(sizes, x, y, w, h):
+    """Squarified treemap layout (Bruls, Huizing & van Wijk).
+
+    ``sizes`` must be sorted descending; returns one (x, y, w, h) per size.
+    """
+    total = float(sum(sizes))
+    if total <= 0 or w <= 0 or h <= 0:
+        return [(x, y, 0.0, 0.0)] * len(sizes)
+    scale = w * h / total
+    areas = [sz * scale for sz in sizes]
+    rects = []
+    i, n = 0, len(areas)
+    while i < n:
+        short = min(w, h)
+        start = i
+        row_sum = row_max = row_min = areas[i]
+        i += 1
+        while i < n and areas[i] > 0:
+            a = areas[i]
+            nxt = _worst_ratio(row_sum + a, max(row_max, a), min(row_min, a), short)
+            if nxt > _worst_ratio(row_sum, row_max, row_min, short):
+                break
+            row_sum += a
+            row_max, row_min = max(row_max, a), min(row_min, a)
+            i += 1
+        if row_sum <= 0:
+            rects.extend([(x, y, 0.0, 0.0)] * (n - start))
+            break
+        if w >= h:
+            col_w = row_sum / h
+            cy = y
+            for a in areas[start:i]:
+                rects.append((x, cy, col_w, a / col_w))
+                cy += a / col_w
+            x, w = x + col_w, w - col_w
+        else:
+            row_h = row_sum / w
+            cx = x
+            for a in areas[start:i]:
+                rects.append((cx, y, a / row_h, row_h))
+                cx += a / row_h
+            y, h = y + row_h, h - row_h
+    return rects
+
+
+class TreeScanWorker(QThread):
+    """Streaming scandir walk that aggregates sizes into ``DiskNode``s.
+
+    Only directories within TREEMAP_KEEP_DEPTH of the root get a node; anything
+    deeper is summed into its nearest kept ancestor.  Snapshots of the visible
+    depth are streamed every few hundred milliseconds.
+    """
+    partial = pyqtSignal(object)
+    finished = pyqtSignal(object)
+
+    def __init__(self, path, keep_depth=TREEMAP_KEEP_DEPTH):
+        super().__init__()
+        self.path = path
+        self.keep_depth = keep_depth
+
+    def run(self):
+        root = DiskNode(os.path.basename(self.path.rstrip(os.sep)) or self.path,
+                        self.path, None, self.keep_depth)
+        stack = [(self.path, root, 0)]
+        last_emit = time.monotonic()
+        files = 0
+        while stack:
+            if self.isInterruptionRequested():
+                return
+            path, anchor, depth = stack.pop()
+            local = 0
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if depth < self.keep_depth:
+                                    child = DiskNode(entry.name, entry.path, anchor,
+                                                     self.keep_depth - depth - 1)
+                                    anchor.children[entry.name] = child
+                                    stack.append((entry.path, child, depth + 1))
+                                else:
+                                    stack.append((entry.path, anchor, depth + 1))
+                            else:
+                                local += entry.stat(follow_symlinks=False).st_size
+                                files += 1
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+            if local:
+                anchor.add(local, own=True)
+            now = time.monotonic()
+            if now - last_emit > 0.3:
+                last_emit = now
+                self.partial.emit(root.snapshot(TREEMAP_VISIBLE_DEPTH))
+        for node in self._iter_nodes(root):
+            node.complete = True
+        self.finished.emit(root)
+
+    @staticmethod
+    def _iter_nodes(root):
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(node.children.values())
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  EXPORT ENGINE
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+EXPORT_SCHEMA = "h4ck3r.inventory"
+EXPORT_SCHEMA_VERSION = 1
+EXPORT_FIELDS = ("kind", "name", "version", "size_mb", "path")
+
+
+def export_metadata(count):
+    return {
+        "schema": EXPORT_SCHEMA,
+        "schema_version": EXPORT_SCHEMA_VERSION,
+        "host": platform.node(),
+        "user": os.getenv("USER", ""),
+        "os_version": platform.mac_ver()[0],
+        "exported_at": datetime.now().astimezone().isoformat(timespec="seconds"),
+        "item_count": count,
+    }
+
+
+def export_row(item):
+    return {
+        "kind": item["kind"],
+        "name": item["name"],
+        "version": item["version"],
+        "size_mb": item.get("size_mb") or 0,
+        "path": item.get("path") or "",
+    }
+
+
+class ExportWriter(abc.ABC):
+    """One output format.  ``open`` gets the temp path; the engine renames it, or calls
+    ``discard`` to drop what a failed export left besides it."""
+    extension = ""
+    label = ""
+
+    def open(self, path, compress):
+        self.fh = (gzip.open(path, "wt", compresslevel=6, encoding="utf-8", newline="") if compress
+                   else open(path, "w", encoding="utf-8", newline=""))
+
+    def write_header(self, meta):
+        pass
+
+    @abc.abstractmethod
+    def write_item(self, item):
+        pass
+
+    def close(self):
+        self.fh.close()
+
+    def discard(self):
+        pass
+
+
+class TextExportWriter(ExportWriter):
+    """The original fixed-width report, kept for humans."""
+    extension = "txt"
+    label = "Text"
+
+    def write_header(self, meta):
+        self.fh.write("# H4CK3R App Manager — Export\n")
+        self.fh.write(f"# Date: {meta['exported_at']}\n")
+        self.fh.write(f"# Total: {meta['item_count']} items\n")
+        self.fh.write(f"{'='*80}\n\n")
+
+    def write_item(self, item):
+        self.fh.write(f"[{item['kind']:<14}]  {item['name']:<40}  v{item['version']:<12}  "
+                      f"{item['size_mb']}MB\n")
+
+
+class JsonlExportWriter(ExportWriter):
+    """First line is the header record, then one item record per line."""
+    extension = "jsonl"
+    label = "JSON Lines"
+
+    def write_header(self, meta):
+        self.fh.write(json.dumps({"record": "header", **meta}) + "\n")
+
+    def write_item(self, item):
+        self.fh.write(json.dumps({"record": "item", **item}) + "\n")
+
+
+class CsvExportWriter(ExportWriter):
+    """Flat table; schema version and host are repeated per row so files can be concatenated."""
+    extension = "csv"
+    label = "CSV"
+
+    def write_header(self, meta):
+        self.prefix = [meta["schema_version"], meta["host"]]
+        self.csv = csv.writer(self.fh)
+        self.csv.writerow(["schema_version", "host", *EXPORT_FIELDS])
+
+    def write_item(self, item):
+        self.csv.writerow(self.prefix + [item[f] for f in EXPORT_FIELDS])
+
+
+class SqliteExportWriter(ExportWriter):
+    """``meta`` key/value table plus an ``items`` table.  Compression wraps the finished file."""
+    extension = "sqlite"
+    label = "SQLite"
+
+    def open(self, path, compress):
+        self.path, self.compress = path, compress
+        self.db_path = path + ".db" if compress else path
+        self.db = None
+        self.db = sqlite3.connect(self.db_path)
+        self.db.execute("PRAGMA journal_mode=OFF")
+        self.db.execute("PRAGMA synchronous=OFF")
+        self.db.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.db.execute(
+            "CREATE TABLE items (kind TEXT, name TEXT, version TEXT, size_mb REAL, path TEXT)")
+        self.batch = []
+
+    def write_header(self, meta):
+        self.db.executemany("INSERT INTO meta VALUES (?, ?)",
+                            [(k, str(v)) for k, v in meta.items()])
+
+    def write_item(self, item):
+        self.batch.append(tuple(item[f] for f in EXPORT_FIELDS))
+        if len(self.batch) >= 1000:
+            self._flush()
+
+    def _flush(self):
+        self.db.executemany("INSERT INTO items VALUES (?, ?, ?, ?, ?)", self.batch)
+        self.batch = []
+
+    def close(self):
+        self._flush()
+        self.db.execute("CREATE INDEX items_kind_name ON items (kind, name)")
+        self.db.commit()
+        self.db.close()
+        if self.compress:
+            with open(self.db_path, "rb") as src, gzip.open(self.path, "wb", compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(self.db_path)
+
+    def discard(self):
+        if self.db is not None:
+            self.db.close()
+        if self.compress and os.path.exists(self.db_path):
+            os.remove(self.db_path)
+
+
+EXPORT_WRITERS = {w.extension: w for w in (
+    TextExportWriter, JsonlExportWriter, CsvExportWriter, SqliteExportWriter,
+)}
+
+
+def export_inventory(items, out_path, fmt="jsonl", compress=False, progress=None):
+    """Stream ``items`` through the ``fmt`` writer into ``out_path`` atomically.
+
+    ``progress(done, total)`` is called every 500 items.  Returns the item count.
+    """
+    writer = EXPORT_WRITERS[fmt]()
+    total = len(items)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(out_path) or ".",
+                               prefix=".h4ck3r_export.", suffix=".tmp")
+    os.close(fd)
+    try:
+        writer.open(tmp, compress)
+        try:
+            writer.write_header(export_metadata(total))
+            for done, item in enumerate(items, 1):
+                writer.write_item(export_row(item))
+                if progress and done % 500 == 0:
+                    progress(done, total)
+        finally:
+            writer.close()
+        os.chmod(tmp, 0o644)  # mkstemp's 0600 would keep exports from fleet tooling
+        os.replace(tmp, out_path)
+    except BaseException:
+        writer.discard()
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    if progress:
+        progress(total, total)
+    return total
+
+
+def default_export_path(fmt, compress):
+    name = f"h4ck3r_export.{EXPORT_WRITERS[fmt].extension}" + (".gz" if compress else "")
+    return os.path.expanduser(os.path.join("~/Desktop", name))
+
+
+class ExportWorker(QThread):
+    progress = pyqtSignal(int, str)
+    finished = pyqtSignal(str, int)
+    failed = pyqtSignal(str)
+
+    def __init__(self, items, out_path, fmt, compress):
+        super().__init__()
+        self.items = items
+        self.out_path = out_path
+        self.fmt = fmt
+        self.compress = compress
+
+    def _on_progress(self, done, total):
+        self.progress.emit(int(done * 100 / max(total, 1)),
+                           f"[EXPORT] {done}/{total} records")
+
+    def run(self):
+        try:
+            count = export_inventory(self.items, self.out_path, self.fmt,
+                                     self.compress, self._on_progress)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(self.out_path, count)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  SNAPSHOTS & DIFF
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+SNAPSHOT_SCHEMA = "h4ck3r.snapshot"
+SNAPSHOT_SCHEMA_VERSION = 2  # v2 adds the partial and meta columns; v1 still loads
+SNAPSHOT_COLUMNS = EXPORT_FIELDS + ("partial", "meta")
+SNAPSHOT_KEEP = 60
+
+_VERSION_SPLIT = re.compile(r"[._\-+~ ]+|(?<=\d)(?=[a-zA-Z])|(?<=[a-zA-Z])(?=\d)")
+
+
+@functools.lru_cache(maxsize=65536)
+def version_key(version):
+    """Sortable key: numeric parts compare as ints and rank above text parts."""
+    key = []
+    for part in _VERSION_SPLIT.split(str(version)):
+        if not part:
+            continue
+        key.append((1, int(part), "") if part.isdigit() else (0, 0, part.lower()))
+    return tuple(key)
+
+
+class SnapshotStore:
+    """Completed scans, one gzip'd column-list JSON file each, newest last.
+
+    Rows keep ``partial`` and ``meta``: the preload and the daemon serve a
+    snapshot as the live inventory until the next scan.
+    """
+
+    def __init__(self, root=None):
+        self.root = Path(root) if root else APP_HOME / "snapshots"
+
+    def save(self, items, taken_at=None):
+        self.root.mkdir(parents=True, exist_ok=True)
+        taken_at = taken_at or datetime.now()
+        doc = {
+            "schema": SNAPSHOT_SCHEMA,
+            "schema_version": SNAPSHOT_SCHEMA_VERSION,
+            "host": platform.node(),
+            "taken_at": taken_at.astimezone().isoformat(timespec="seconds"),
+            "columns": list(SNAPSHOT_COLUMNS),
+            "rows": [[it["kind"], it["name"], it["version"], it.get("size_mb") or 0,
+                      it.get("path") or "", bool(it.get("partial")), it.get("meta")]
+                     for it in items],
+        }
+        path = self.root / f"{taken_at.strftime('%Y%m%d-%H%M%S')}.json.gz"
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        os.close(fd)
+        with gzip.open(tmp, "wt", compresslevel=6, encoding="utf-8") as f:
+            json.dump(doc, f, separators=(",", ":"))
+        os.replace(tmp, path)
+        self.prune()
+        return path
+
+    def list(self):
+        if not self.root.is_dir():
+            return []
+        return sorted(self.root.glob("*.json.gz"))
+
+    def resolve(self, ref):
+        """Snapshot id ("20250101-120000"), index ("-1" = latest) or file path."""
+        if os.path.exists(ref):
+            return Path(ref)
+        snaps = self.list()
+        try:
+            return snaps[int(ref)]
+        except (ValueError, IndexError):
+            pass
+        for snap in snaps:
+            if snap.name.startswith(ref):
+                return snap
+        raise FileNotFoundError(f"no snapshot matching {ref!r}")
+
+    def prune(self, keep=SNAPSHOT_KEEP):
+        for old in self.list()[:-keep]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+
+def load_inventory(path):
+    """Items from a snapshot or a JSON Lines export (gzip'd or not)."""
+    path = str(path)
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        if ".jsonl" in path:
+            return [rec for rec in map(json.loads, f) if rec.get("record") == "item"]
+        doc = json.load(f)
+    if doc.get("schema") != SNAPSHOT_SCHEMA:
+        raise ValueError(f"{path}: not a {SNAPSHOT_SCHEMA} file")
+    if doc.get("schema_version", 0) > SNAPSHOT_SCHEMA_VERSION:
+        raise ValueError(f"{path}: snapshot schema v{doc['schema_version']} is newer than this tool")
+    cols = doc["columns"]
+    return [dict(zip(cols, row)) for row in doc["rows"]]
+
+
+def diff_inventories(old_items, new_items):
+    """Hash join on (kind, name).  Returns added/removed/upgraded/downgraded/changed/resized."""
+    old_index = {(it["kind"], it["name"]): it for it in old_items}
+    result = {"added": [], "removed": [], "upgraded": [], "downgraded": [],
+              "changed": [], "resized": [], "size_delta_mb": 0.0}
+    for new in new_items:
+        key = (new["kind"], new["name"])
+        old = old_index.pop(key, None)
+        new_size = new.get("size_mb") or 0
+        if old is None:
+            result["added"].append(new)
+            result["size_delta_mb"] += new_size
+            continue
+        delta = new_size - (old.get("size_mb") or 0)
+        result["size_delta_mb"] += delta
+        if old["version"] != new["version"]:
+            ok, nk = version_key(old["version"]), version_key(new["version"])
+            bucket = "upgraded" if nk > ok else "downgraded" if nk < ok else "changed"
+            result[bucket].append((old, new))
+        elif abs(delta) >= 0.1:
+            result["resized"].append((old, new))
+    result["removed"] = list(old_index.values())
+    result["size_delta_mb"] -= sum(it.get("size_mb") or 0 for it in result["removed"])
+    result["size_delta_mb"] = round(result["size_delta_mb"], 1)
+    return result
+
+
+def format_diff(diff):
+    def size(it):
+        return f"  ({it['size_mb']}MB)" if it.get("size_mb") else ""
+
+    def delta(old, new):
+        d = (new.get("size_mb") or 0) - (old.get("size_mb") or 0)
+        return f"  ({d:+.1f}MB)" if abs(d) >= 0.1 else ""
+
+    lines = []
+    for it in sorted(diff["added"], key=lambda i: (i["kind"], i["name"])):
+        lines.append(f"  + [{it['kind']}] {it['name']} {it['version']}{size(it)}")
+    for it in sorted(diff["removed"], key=lambda i: (i["kind"], i["name"])):
+        lines.append(f"  - [{it['kind']}] {it['name']} {it['version']}{size(it)}")
+    for tag, bucket in (("↑", "upgraded"), ("↓", "downgraded"), ("~", "changed"), ("±", "resized")):
+        for old, new in sorted(diff[bucket], key=lambda p: (p[1]["kind"], p[1]["name"])):
+            ver = (f"{old['version']} -> {new['version']}"
+                   if old["version"] != new["version"] else new["version"])
+            lines.append(f"  {tag} [{new['kind']}] {new['name']} {ver}{delta(old, new)}")
+    lines.append(
+        f"  {len(diff['added'])} added, {len(diff['removed'])} removed, "
+        f"{len(diff['upgraded'])} upgraded, {len(diff['downgraded'])} downgraded, "
+        f"size delta {diff['size_delta_mb']:+.1f}MB"
+    )
+    return lines
+
+
+class SnapshotLoadWorker(QThread):
+    """Loads an inventory so the table has data before any scan runs.
+
+    A running daemon's inventory wins over the newest snapshot.  ``client``
+    is reset to None if the daemon does not answer.
+    """
+    finished = pyqtSignal(list, str)
+
+    def __init__(self, client=None):
+        super().__init__()
+        self.client = client
+
+    def run(self):
+        if self.client is not None:
+            try:
+                status = self.client.call("status")
+                if status["items"]:
+                    items = [InventoryItem.from_dict(d) for d in self.client.inventory()]
+                    self.finished.emit(items, f"daemon, scanned {status['scanned_at']}")
+                    return
+            except (OSError, ValueError, RpcError):
+                self.client = None
+        items, label = [], ""
+        try:
+            snaps = SnapshotStore().list()
+            if snaps:
+                items = [InventoryItem.from_dict(d) for d in load_inventory(snaps[-1])]
+                label = "snapshot " + snaps[-1].name.replace(".json.gz", "")
+        except Exception:
+            items = []
+        self.finished.emit(items, label)
+
+
+class SnapshotWorker(QThread):
+    finished = pyqtSignal(str)
+
+    def __init__(self, items):
+        super().__init__()
+        self.items = items
+
+    def run(self):
+        try:
+            path = SnapshotStore().save(self.items)
+        except Exception:
+            path = ""
+        self.finished.emit(str(path))
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  OUTDATED PACKAGES
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PACKAGE_INDEX_SCHEMA = "h4ck3r.package-index"
+BREW_API_URL = "https://formulae.brew.sh/api/{}.json"
+PYPI_JSON_URL = "https://pypi.org/pypi/{}/json"
+_PEP440 = re.compile(
+    r"^v?(?:(\d+)!)?(\d+(?:\.\d+)*)"
+    r"(?:[-_.]?(a|b|c|rc|alpha|beta|pre|preview)[-_.]?(\d*))?"
+    r"(?:-(\d+)|[-_.]?(?:post|rev|r)[-_.]?(\d*))?"
+    r"(?:[-_.]?dev[-_.]?(\d*))?"
+    r"(?:\+[a-z0-9.]*)?$")
+_PRE_RANK = {"a": 0, "alpha": 0, "b": 1, "beta": 1, "c": 2, "rc": 2, "pre": 2, "preview": 2}
+_BREW_REVISION = re.compile(r"^(.*)_(\d+)$")
+
+
+def _trim_zeros(parts):
+    parts = list(parts)
+    while parts and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
+@functools.lru_cache(maxsize=65536)
+def pep440_key(version):
+    """PEP 440 order as a tuple (None if ``version`` is not PEP 440).
+
+    1.0.dev1 < 1.0a1 < 1.0rc1 < 1.0 == 1.0.0 < 1.0.post1; local labels are ignored.
+    """
+    m = _PEP440.match(version.strip().lower())
+    if m is None:
+        return None
+    epoch, release, pre_l, pre_n, post_implicit, post_n, dev_n = m.groups()
+    if pre_l:
+        pre = (0, _PRE_RANK[pre_l], int(pre_n or 0))
+    elif dev_n is not None and post_implicit is None and post_n is None:
+        pre = (-1, 0, 0)  # X.dev sorts before X's pre-releases
+    else:
+        pre = (1, 0, 0)
+    post = post_implicit if post_implicit is not None else post_n
+    return (int(epoch or 0), _trim_zeros(int(p) for p in release.split(".")), pre,
+            -1 if post is None else int(post or 0),
+            (1, 0) if dev_n is None else (0, int(dev_n or 0)))
+
+
+@functools.lru_cache(maxsize=65536)
+def brew_key(version):
+    """Homebrew order: ``,``-separated cask parts in turn, then the ``_N`` revision.
+
+    None for versions that cannot be compared ("latest", "-").
+    """
+    if version in ("latest", "-", ""):
+        return None
+    m = _BREW_REVISION.match(version)
+    main, revision = (m.group(1), int(m.group(2))) if m else (version, 0)
+    parts = []
+    for part in main.split(","):
+        key = list(version_key(part))
+        while key and key[-1] == (1, 0, ""):
+            key.pop()
+        parts.append(tuple(key))
+    return tuple(parts), revision
+
+
+def pypi_name(name):
+    """PEP 503 normalized project name."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+# inventory kind -> (index source, name normalizer, version key)
+OUTDATED_KINDS = {
+    "Brew Formula": ("brew-formula", str.lower, brew_key),
+    "Brew Cask": ("brew-cask", str.lower, brew_key),
+    "pip Package": ("pypi", pypi_name, pep440_key),
+}
+
+
+def parse_index_doc(doc):
+    """{source: {name: version}} from any index file this engine understands.
+
+    Homebrew's API files (formula/cask, plain or .jws.json), ``brew info
+    --json=v2`` dumps, and flat {name: version} PyPI snapshots.
+    """
+    if isinstance(doc, dict) and isinstance(doc.get("payload"), str):
+        doc = json.loads(doc["payload"])
+    out = {}
+    if isinstance(doc, dict) and ("formulae" in doc or "casks" in doc):
+        for part in (doc.get("formulae") or [], doc.get("casks") or []):
+            for source, table in parse_index_doc(part).items():
+                out.setdefault(source, {}).update(table)
+        return out
+    if isinstance(doc, list):
+        for entry in doc:
+            if "token" in entry:
+                out.setdefault("brew-cask", {})[entry["token"].lower()] = str(entry.get("version", ""))
+            elif (entry.get("versions") or {}).get("stable"):
+                version = entry["versions"]["stable"]
+                if entry.get("revision"):
+                    version = f"{version}_{entry['revision']}"
+                table = out.setdefault("brew-formula", {})
+                for name in [entry["name"], *(entry.get("aliases") or []),
+                             *(entry.get("oldnames") or [])]:
+                    table[name.lower()] = version
+        return out
+    if isinstance(doc, dict) and all(isinstance(v, str) for v in doc.values()):
+        return {"pypi": {pypi_name(k): v for k, v in doc.items()}}
+    raise ValueError("not a Homebrew API/info dump or a {name: version} PyPI snapshot")
+
+
+def _fetch_json(url, timeout=30):
+    import urllib.request
+    with urllib.request.urlopen(url, timeout=timeout) as r:
+        return json.load(r)
+
+
+class PackageIndex:
+    """Latest known version per package, per source, kept in APP_HOME.
+
+    Only the refresh_* methods touch Homebrew's cache or the network;
+    ``outdated`` works from the saved file.  Version keys of the index are
+    parsed once per source and reused for every comparison.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else APP_HOME / "package-index.json.gz"
+        self.sources = {}    # source -> {name: version}
+        self.refreshed = {}  # source -> ISO time
+        self._keys = {}      # source -> {name: (version, key)}
+
+    def load(self):
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                doc = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if doc.get("schema") == PACKAGE_INDEX_SCHEMA:
+            self.sources = doc.get("sources", {})
+            self.refreshed = doc.get("refreshed", {})
+            self._keys = {}
+        return self
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        os.close(fd)
+        with gzip.open(tmp, "wt", compresslevel=6, encoding="utf-8") as f:
+            json.dump({"schema": PACKAGE_INDEX_SCHEMA, "sources": self.sources,
+                       "refreshed": self.refreshed}, f, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    def merge(self, parsed):
+        now = datetime.now().astimezone().isoformat(timespec="seconds")
+        for source, table in parsed.items():
+            self.sources.setdefault(source, {}).update(table)
+            self.refreshed[source] = now
+            self._keys.pop(source, None)
+        return self
+
+    def import_file(self, path):
+        opener = gzip.open if str(path).endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            return self.merge(parse_index_doc(json.load(f)))
+
+    def refresh_brew(self, cache_dir=""):
+        """Homebrew's own API cache if brew has one (offline), else formulae.brew.sh."""
+        api = Path(cache_dir or os.environ.get("HOMEBREW_CACHE", "")
+                   or Path.home() / "Library" / "Caches" / "Homebrew") / "api"
+        for what in ("formula", "cask"):
+            local = api / f"{what}.jws.json"
+            if local.is_file():
+                self.import_file(local)
+            else:
+                self.merge(parse_index_doc(_fetch_json(BREW_API_URL.format(what))))
+        return self
+
+    def refresh_pypi(self, names, token=None, workers=16):
+        """Latest release of each pip package in ``names`` from PyPI's JSON API."""
+        def latest(name):
+            if token is not None and token.cancelled:
+                return name, None
+            try:
+                return name, _fetch_json(PYPI_JSON_URL.format(name), timeout=10)["info"]["version"]
+            except Exception:
+                return name, None
+
+        with ThreadPoolExecutor(workers, thread_name_prefix="pypi") as pool:
+            found = {pypi_name(n): v for n, v in pool.map(latest, sorted(set(names))) if v}
+        return self.merge({"pypi": found})
+
+    def keys(self, source, key_fn):
+        table = self._keys.get(source)
+        if table is None:
+            table = self._keys[source] = {
+                name: (version, key_fn(version))
+                for name, version in self.sources.get(source, {}).items()}
+        return table
+
+    def outdated(self, items):
+        """{position in ``items``: latest version} for every item the index has a newer version of."""
+        out = {}
+        tables = {kind: (self.keys(source, key_fn), norm, key_fn)
+                  for kind, (source, norm, key_fn) in OUTDATED_KINDS.items()}
+        for pos, it in enumerate(items):
+            spec = tables.get(it["kind"])
+            if spec is None:
+                continue
+            table, norm, key_fn = spec
+            hit = table.get(norm(it["name"]))
+            if hit is None or hit[1] is None:
+                continue
+            mine = key_fn(it["version"])
+            if mine is not None and mine < hit[1]:
+                out[pos] = hit[0]
+        return out
+
+
+class OutdatedWorker(QThread):
+    """Loads (and with ``refresh`` first rebuilds) the PackageIndex, then flags items."""
+    progress = pyqtSignal(int, str)
+    warning = pyqtSignal(str)
+    finished = pyqtSignal(dict)
+
+    def __init__(self, items, refresh=False):
+        super().__init__()
+        self.items = items
+        self.refresh = refresh
+        self.token = CancelToken()
+
+    def cancel(self):
+        self.token.cancel()
+
+    def run(self):
+        index = PackageIndex().load()
+        if self.refresh:
+            self.progress.emit(0, "[OUTDATED] refreshing package index ...")
+            try:
+                index.refresh_brew()
+            except Exception as e:
+                self.warning.emit(f"[WARN] Homebrew index: {e}")
+            index.refresh_pypi([it["name"] for it in self.items if it["kind"] == "pip Package"],
+                               self.token)
+            try:
+                index.save()
+            except OSError as e:
+                self.warning.emit(f"[WARN] package index: {e}")
+        with TRACER.span("outdated", "scan", items=len(self.items)):
+            self.finished.emit(index.outdated(self.items))
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  FLEET INDEX
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+def _popcount(bitmap):
+    return bin(bitmap).count("1")
+
+
+KIND_ALIASES = {
+    "app": "Application", "userapp": "User App", "formula": "Brew Formula",
+    "cask": "Brew Cask", "pip": "pip Package", "pkg": "System Pkg", "cache": "Dev Cache",
+    **{src.alias: src.kind for src in PACKAGE_SOURCES},
+}
+
+
+FLEET_FORMATS = (".jsonl", ".csv", ".sqlite", ".json")  # .gz of any of them too
+
+
+def _fleet_sqlite(path, hosts):
+    """Rows of a SqliteExportWriter file (gzip'd ones are unpacked to a temp file first)."""
+    tmp = None
+    if path.endswith(".gz"):
+        fd, tmp = tempfile.mkstemp(suffix=".sqlite")
+        with os.fdopen(fd, "wb") as dst, gzip.open(path, "rb") as src:
+            shutil.copyfileobj(src, dst)
+    try:
+        db = sqlite3.connect(f"file:{urllib.parse.quote(tmp or path)}?mode=ro", uri=True)
+        try:
+            meta = dict(db.execute("SELECT key, value FROM meta"))
+            host = meta.get("host") or os.path.basename(path).split(".")[0]
+            hosts.setdefault(host, []).extend(
+                (kind, name, version, float(size_mb or 0))
+                for kind, name, version, size_mb in db.execute(
+                    "SELECT kind, name, version, size_mb FROM items"))
+        except sqlite3.DatabaseError as e:
+            raise ValueError(f"not an inventory export ({e})")
+        finally:
+            db.close()
+    finally:
+        if tmp is not None:
+            os.remove(tmp)
+
+
+def read_fleet_file(path):
+    """Stream one export (JSONL/CSV/SQLite, gzip'd or not) or snapshot into {host: rows}.
+
+    Rows are (kind, name, version, size_mb) tuples.  Runs in a worker process.
+    ValueError for a file in none of FLEET_FORMATS (text exports, fleet indexes).
+    """
+    path = str(path)
+    hosts = {}
+    opener = gzip.open if path.endswith(".gz") else open
+    suffix = os.path.splitext(path[:-3] if path.endswith(".gz") else path)[1]
+    if suffix == ".jsonl":
+        host = os.path.basename(path).split(".")[0]
+        rows = None
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                rec = json.loads(line)
+                if rec.get("record") == "header":
+                    host = rec.get("host") or host
+                    rows = hosts.setdefault(host, [])
+                elif rec.get("record") == "item":
+                    if rows is None:
+                        rows = hosts.setdefault(host, [])
+                    rows.append((rec["kind"], rec["name"], rec["version"],
+                                 float(rec.get("size_mb") or 0)))
+    elif suffix == ".csv":
+        with opener(path, "rt", encoding="utf-8", newline="") as f:
+            for rec in csv.DictReader(f):
+                hosts.setdefault(rec["host"], []).append(
+                    (rec["kind"], rec["name"], rec["version"], float(rec["size_mb"] or 0)))
+    elif suffix == ".sqlite":
+        _fleet_sqlite(path, hosts)
+    elif suffix == ".json":
+        with opener(path, "rt", encoding="utf-8") as f:
+            doc = json.load(f)
+        cols = doc["columns"]
+        k, n, v, sz = (cols.index(c) for c in ("kind", "name", "version", "size_mb"))
+        hosts[doc.get("host") or os.path.basename(path)] = [
+            (r[k], r[n], r[v], float(r[sz] or 0)) for r in doc["rows"]]
+    else:
+        raise ValueError(f"not a fleet format (want {', '.join(FLEET_FORMATS)}, optionally .gz)")
+    return hosts
+
+
+def _read_fleet_file_or_error(path):
+    """(read_fleet_file(path), None), or ({}, reason) for a file that cannot be read."""
+    try:
+        return read_fleet_file(path), None
+    except (OSError, ValueError, KeyError, IndexError, TypeError, EOFError, csv.Error) as e:
+        return {}, f"{type(e).__name__}: {e}"
+
+
+class FleetIndex:
+    """Deduplicated columnar index over many hosts' inventories.
+
+    One row per distinct (kind, name, version); each row has the summed size
+    across hosts and a host bitmap (a Python int, bit i = host i).  A host
+    counts once per row: when it shows up in several files, or a file lists
+    the same row twice, its largest size is the one summed.  Hosts are added
+    before ``finalize``; a finalized or loaded index is read-only.
+    """
+
+    def __init__(self):
+        self.hosts = []
+        self.host_ids = {}
+        self.kinds, self.names, self.versions = [], [], []
+        self.size_total = []
+        self.bitmaps = []
+        self.key_ids = {}
+        self._members = []  # per key: {host id: size_mb}
+        self._by_name = None
+
+    # ── build ──
+    def add_host(self, host, rows):
+        if self._members is None:
+            raise RuntimeError("the index is finalized; build a new one to add hosts")
+        hid = self.host_ids.get(host)
+        if hid is None:
+            hid = self.host_ids[host] = len(self.hosts)
+            self.hosts.append(host)
+        key_ids, members = self.key_ids, self._members
+        for kind, name, version, size_mb in rows:
+            key = (kind, name, version)
+            kid = key_ids.get(key)
+            if kid is None:
+                kid = key_ids[key] = len(self.kinds)
+                self.kinds.append(kind)
+                self.names.append(name)
+                self.versions.append(version)
+                members.append({})
+            sizes = members[kid]
+            if size_mb > sizes.get(hid, -1.0):
+                sizes[hid] = size_mb
+
+    def finalize(self):
+        """Turn the per-key host sizes into size totals and bitmaps."""
+        nbytes = (len(self.hosts) + 7) // 8
+        self.bitmaps, self.size_total = [], []
+        for sizes in self._members:
+            bits = bytearray(nbytes)
+            for h in sizes:
+                bits[h >> 3] |= 1 << (h & 7)
+            self.bitmaps.append(int.from_bytes(bits, "little"))
+            self.size_total.append(sum(sizes.values()))
+        self._members = None
+        self._by_name = None
+        return self
+
+    @classmethod
+    def build(cls, paths, workers=None, progress=None, warn=None):
+        """Index of ``paths``; a file that cannot be read is passed to ``warn(path, reason)``."""
+        index = cls()
+        paths = list(paths)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_read_fleet_file_or_error, paths, chunksize=16)
+            for done, (path, (hosts, error)) in enumerate(zip(paths, results), 1):
+                if error is not None and warn:
+                    warn(path, error)
+                for host, rows in hosts.items():
+                    index.add_host(host, rows)
+                if progress:
+                    progress(done, len(paths))
+        return index.finalize()
+
+    # ── persistence ──
+    def save(self, path):
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        os.close(fd)
+        db = sqlite3.connect(tmp)
+        db.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        db.execute("CREATE TABLE hosts (id INTEGER PRIMARY KEY, name TEXT)")
+        db.execute("CREATE TABLE keys (id INTEGER PRIMARY KEY, kind TEXT, name TEXT, "
+                   "version TEXT, size_total REAL, bitmap BLOB)")
+        db.execute("INSERT INTO meta VALUES ('schema_version', ?)", (str(EXPORT_SCHEMA_VERSION),))
+        db.executemany("INSERT INTO hosts VALUES (?, ?)", enumerate(self.hosts))
+        nbytes = (len(self.hosts) + 7) // 8
+        db.executemany("INSERT INTO keys VALUES (?, ?, ?, ?, ?, ?)", (
+            (i, self.kinds[i], self.names[i], self.versions[i], self.size_total[i],
+             self.bitmaps[i].to_bytes(nbytes, "little"))
+            for i in range(len(self.kinds))
+        ))
+        db.commit()
+        db.close()
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        index = cls()
+        index._members = None
+        db = sqlite3.connect(path)
+        index.hosts = [name for _, name in db.execute("SELECT id, name FROM hosts ORDER BY id")]
+        index.host_ids = {h: i for i, h in enumerate(index.hosts)}
+        for kid, kind, name, version, size_total, bitmap in db.execute(
+                "SELECT id, kind, name, version, size_total, bitmap FROM keys ORDER BY id"):
+            index.kinds.append(kind)
+            index.names.append(name)
+            index.versions.append(version)
+            index.size_total.append(size_total)
+            index.bitmaps.append(int.from_bytes(bitmap, "little"))
+            index.key_ids[(kind, name, version)] = kid
+        db.close()
+        return index
+
+    # ── queries ──
+    def _rows_for(self, name, kind=None):
+        if self._by_name is None:
+            self._by_name = {}
+            for kid, n in enumerate(self.names):
+                self._by_name.setdefault(n.lower(), []).append(kid)
+        kind = KIND_ALIASES.get(kind, kind)
+        return [kid for kid in self._by_name.get(name.lower(), [])
+                if kind is None or self.kinds[kid] == kind]
+
+    def host_names(self, bitmap):
+        out = []
+        while bitmap:
+            low = bitmap & -bitmap
+            out.append(self.hosts[low.bit_length() - 1])
+            bitmap ^= low
+        return out
+
+    def hosts_with(self, name, kind=None, below=None, at_least=None):
+        """Bitmap of hosts with ``name`` installed, optionally in a version range."""
+        lo = version_key(at_least) if at_least else None
+        hi = version_key(below) if below else None
+        bitmap = 0
+        for kid in self._rows_for(name, kind):
+            vk = version_key(self.versions[kid])
+            if (hi is None or vk < hi) and (lo is None or vk >= lo):
+                bitmap |= self.bitmaps[kid]
+        return bitmap
+
+    def versions_of(self, name, kind=None):
+        return sorted(((self.versions[kid], self.kinds[kid], _popcount(self.bitmaps[kid]))
+                       for kid in self._rows_for(name, kind)),
+                      key=lambda r: version_key(r[0]))
+
+    def total_size_mb(self, name, kind=None):
+        kids = self._rows_for(name, kind)
+        hosts = 0
+        for kid in kids:
+            hosts |= self.bitmaps[kid]
+        return sum(self.size_total[kid] for kid in kids), _popcount(hosts)
+
+    def top(self, kind=None, n=20):
+        kind = KIND_ALIASES.get(kind, kind)
+        per_name = {}
+        for kid, k in enumerate(self.kinds):
+            if kind is None or k == kind:
+                key = (k, self.names[kid])
+                per_name[key] = per_name.get(key, 0) | self.bitmaps[kid]
+        ranked = sorted(per_name.items(), key=lambda kv: _popcount(kv[1]), reverse=True)
+        return [(k, name, _popcount(bm)) for (k, name), bm in ranked[:n]]
+
+
+FLEET_HELP = """\
+  hosts NAME [KIND] [< VER] [>= VER]   hosts with NAME (optionally in a version range)
+  versions NAME [KIND]                 installed versions and host counts
+  bytes NAME [KIND]                    total size across the fleet
+  top [KIND] [N]                       most widely installed packages
+  stats                                index summary
+  KIND: app userapp formula cask pip pkg, or a full type name"""
+
+
+def fleet_query(index, line):
+    """Run one query line against ``index``; returns output lines."""
+    argv = shlex.split(line)
+    if not argv:
+        return []
+    cmd, args = argv[0], argv[1:]
+    below = at_least = None
+    for op in ("<", ">="):
+        if op in args:
+            i = args.index(op)
+            if op == "<":
+                below = args[i + 1]
+            else:
+                at_least = args[i + 1]
+            del args[i:i + 2]
+    if cmd == "hosts" and args:
+        names = index.host_names(index.hosts_with(args[0], args[1] if len(args) > 1 else None,
+                                                  below, at_least))
+        return names + [f"  [{len(names)} hosts]"]
+    if cmd == "versions" and args:
+        return [f"  {v:<20} {k:<14} {n} hosts"
+                for v, k, n in index.versions_of(args[0], args[1] if len(args) > 1 else None)]
+    if cmd == "bytes" and args:
+        mb, hosts = index.total_size_mb(args[0], args[1] if len(args) > 1 else None)
+        return [f"  {args[0]}: {mb / 1024:.1f}G on {hosts} hosts"]
+    if cmd == "top":
+        kind = args[0] if args and not args[0].isdigit() else None
+        n = int(args[-1]) if args and args[-1].isdigit() else 20
+        return [f"  {count:>7}  [{k}] {name}" for k, name, count in index.top(kind, n)]
+    if cmd == "stats":
+        return [f"  {len(index.hosts)} hosts, {len(index.kinds)} distinct (kind, name, version) rows"]
+    return [FLEET_HELP]
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  RECEIPT FILES
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+RECEIPT_INDEX_SCHEMA = "h4ck3r.receipt-index"
+DELETE_CHUNK = 256
+# never deleted, whichever receipt lists them; SIP guards most of these anyway
+PROTECTED_PREFIXES = ("/System/", "/bin/", "/sbin/", "/usr/bin/", "/usr/sbin/", "/usr/lib/",
+                      "/usr/libexec/", "/private/var/db/", "/Library/Apple/")
+
+
+def receipt_stamp(pkg_id):
+    """mtimes of a receipt's .plist and .bom: they change on reinstall."""
+    base = os.path.join(RECEIPTS_DIR, pkg_id)
+    return _mtime_stamp(base + ".plist", base + ".bom")
+
+
+def receipt_prefix(pkg_id):
+    """Where a receipt's relative paths are rooted (its InstallPrefixPath)."""
+    try:
+        with open(os.path.join(RECEIPTS_DIR, pkg_id + ".plist"), "rb") as f:
+            prefix = plistlib.load(f).get("InstallPrefixPath") or ""
+    except Exception:
+        prefix = ""
+    return "/" + prefix.strip("/")
+
+
+class ReceiptIndex:
+    """Files of every installed receipt, and how many receipts list each path.
+
+    Built with one ``pkgutil --files`` per receipt, all in flight at once
+    through RUNNER.  Each receipt's list is cached on disk with its
+    receipt_stamp, so after the first build only new or reinstalled
+    receipts are listed again; ``ensure`` skips even that while the
+    receipts directory is unchanged, so one build covers the session.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else APP_HOME / "receipt-index.json.gz"
+        self.pkgs = {}       # pkg id -> {"stamp", "prefix", "files": [absolute paths]}
+        self.refcount = {}   # absolute path -> number of receipts listing it
+        self.listed = 0      # receipts re-listed by the last build
+        self._dir_stamp = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                doc = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return doc.get("pkgs", {}) if doc.get("schema") == RECEIPT_INDEX_SCHEMA else {}
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        os.close(fd)
+        with gzip.open(tmp, "wt", compresslevel=1, encoding="utf-8") as f:
+            json.dump({"schema": RECEIPT_INDEX_SCHEMA, "pkgs": self.pkgs}, f,
+                      separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    @staticmethod
+    def _list(pkg_id, token):
+        prefix = receipt_prefix(pkg_id)
+        rel = RUNNER.check_output(["pkgutil", "--files", pkg_id], timeout=60, token=token)
+        return {"stamp": receipt_stamp(pkg_id), "prefix": prefix,
+                "files": [os.path.join(prefix, p) for p in rel.splitlines() if p]}
+
+    def ensure(self, token=None):
+        """Bring the index up to date; a no-op while the receipts directory is unchanged."""
+        with self._lock:
+            stamp = _mtime_stamp(RECEIPTS_DIR)
+            if self.pkgs and stamp == self._dir_stamp and None not in stamp:
+                return self
+            cached = self.pkgs or self._load()
+            ids = sorted(p for p in RUNNER.lines(["pkgutil", "--pkgs"], timeout=15, token=token)
+                         if p)
+            pkgs, stale = {}, []
+            for pkg_id in ids:
+                entry = cached.get(pkg_id)
+                if entry is not None and any(entry["stamp"]) \
+                        and entry["stamp"] == receipt_stamp(pkg_id):
+                    pkgs[pkg_id] = entry
+                else:
+                    stale.append(pkg_id)
+            with TRACER.span("receipt_index", "io", receipts=len(ids), listed=len(stale)), \
+                    ThreadPoolExecutor(max_workers=RUNNER.max_procs) as pool:
+                for pkg_id, entry in zip(stale, pool.map(self._list, stale, [token] * len(stale))):
+                    pkgs[pkg_id] = entry
+            METRICS.cache("receipts", hits=len(ids) - len(stale), misses=len(stale))
+            refcount = {}
+            for entry in pkgs.values():
+                for path in entry["files"]:
+                    refcount[path] = refcount.get(path, 0) + 1
+            self.pkgs, self.refcount, self.listed = pkgs, refcount, len(stale)
+            self._dir_stamp = stamp
+            if stale or len(pkgs) != len(cached):
+                try:
+                    self._save()
+                except OSError:
+                    pass
+            return self
+
+    def plan(self, pkg_ids):
+        """What removing ``pkg_ids`` together would delete.
+
+        A path is owned when every receipt that lists it is in ``pkg_ids``.
+        Returns {"files", "dirs" (deepest first), "bytes", "shared", "missing"};
+        paths already gone count as missing, PROTECTED_PREFIXES as shared.
+        """
+        mine = {}
+        for pkg_id in pkg_ids:
+            for path in self.pkgs.get(pkg_id, {}).get("files", ()):
+                mine[path] = mine.get(path, 0) + 1
+        files, dirs, total, shared, missing = [], [], 0, 0, 0
+        for path, n in mine.items():
+            if n < self.refcount.get(path, 0) or path.startswith(PROTECTED_PREFIXES) \
+                    or path == "/":
+                shared += 1
+                continue
+            try:
+                st = os.lstat(path)
+            except OSError:
+                missing += 1
+                continue
+            if stat.S_ISDIR(st.st_mode):
+                dirs.append(path)
+            else:
+                files.append(path)
+                total += st.st_size
+        dirs.sort(key=lambda p: p.count("/"), reverse=True)
+        return {"files": files, "dirs": dirs, "bytes": total, "shared": shared, "missing": missing}
+
+
+RECEIPTS = ReceiptIndex()
+
+
+def delete_paths(paths, password, token=None, rmdir=False):
+    """Remove ``paths`` as root, DELETE_CHUNK per command, RUNNER.max_procs commands at once.
+
+    ``rm -f`` for files; with ``rmdir`` directories are removed only if
+    empty, one depth level at a time so children go before parents.
+    Returns the number of paths in chunks that failed.
+    """
+    def run(chunk):
+        cmd = ["sudo", "-S", "-p", "", "rmdir" if rmdir else "rm", *([] if rmdir else ["-f"]),
+               "--", *chunk]
+        try:
+            r = RUNNER.run(cmd, timeout=120, token=token, input=password + "\n", check=False)
+        except CommandCancelled:
+            raise
+        except CommandError:
+            return len(chunk)
+        return 0 if r.returncode == 0 else len(chunk)
+
+    if rmdir:
+        levels = {}
+        for path in paths:
+            levels.setdefault(path.count("/"), []).append(path)
+        batches = [levels[depth] for depth in sorted(levels, reverse=True)]
+    else:
+        batches = [list(paths)]
+    failed = 0
+    with ThreadPoolExecutor(max_workers=RUNNER.max_procs) as pool:
+        for batch in batches:
+            chunks = [batch[i:i + DELETE_CHUNK] for i in range(0, len(batch), DELETE_CHUNK)]
+            failed += sum(pool.map(run, chunks))
+    return failed
+
+
+def remove_receipt_files(pkg_ids, password, token, log):
+    """Delete the files only ``pkg_ids`` own, before their receipts are forgotten.
+
+    Apple's own receipts (com.apple.*) are left to ``pkgutil --forget`` alone.
+    """
+    pkg_ids = [p for p in pkg_ids if not p.startswith("com.apple.")]
+    if not pkg_ids:
+        return
+    try:
+        RECEIPTS.ensure(token)
+    except CommandCancelled:
+        raise
+    except CommandError as e:
+        log(f"  [WARN] receipt index: {e}; only forgetting receipts")
+        return
+    plan = RECEIPTS.plan(pkg_ids)
+    log(f"  [RECEIPTS] {len(plan['files'])} files, {len(plan['dirs'])} dirs, "
+        f"{_fmt_bytes(plan['bytes'])} owned only by {len(pkg_ids)} package(s); "
+        f"{plan['shared']} shared paths kept, {plan['missing']} already gone")
+    with TRACER.span("delete", "uninstall", files=len(plan["files"])):
+        failed = delete_paths(plan["files"], password, token)
+        delete_paths(plan["dirs"], password, token, rmdir=True)
+    if failed:
+        log(f"  [FAIL] {failed} files could not be removed")
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  UNINSTALL WORKER
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+def sudo_command(cmd, password):
+    """(shell command, stdin) for an uninstall command.
+
+    ``rm -rf``, ``pkgutil`` and ``port`` need root: they run under ``sudo -S``
+    with the password on stdin, never on a command line.
+    """
+    if cmd.startswith(("rm -rf", "pkgutil", "port ")):
+        return f"sudo -S -p '' {cmd}", password + "\n"
+    return cmd, None
+
+
+def last_error_line(stderr):
+    return stderr.strip().split("\n")[-1] if stderr.strip() else "unknown error"
+
+
+class UninstallWorker(QThread):
+    log = pyqtSignal(str)
+    done = pyqtSignal(int, int)
+
+    def __init__(self, items, password):
+        super().__init__()
+        self.items = items
+        self.password = password
+        self.token = CancelToken()
+
+    def cancel(self):
+        self.token.cancel()
+
+    def run(self):
+        ok = fail = 0
+        pkgs = [it["name"] for it in self.items if it["kind"] == "System Pkg"]
+        if pkgs:
+            try:
+                remove_receipt_files(pkgs, self.password, self.token, self.log.emit)
+            except CommandCancelled:
+                pass
+        for item in self.items:
+            if self.token.cancelled:
+                break
+            cmd = uninstall_command(item)
+            if not cmd:
+                self.log.emit(f"  [SKIP] {item['name']}: not removable from here")
+                continue
+            self.log.emit(f"  $ {cmd}")
+            with TRACER.span("uninstall", "uninstall", cmd=cmd[:120]):
+                shell_cmd, stdin = sudo_command(cmd, self.password)
+                try:
+                    r = RUNNER.run(shell_cmd, timeout=120, token=self.token,
+                                   input=stdin, check=False)
+                except CommandError as e:
+                    self.log.emit(f"  [ERR] {e}")
+                    fail += 1
+                    continue
+                if r.returncode == 0:
+                    self.log.emit(f"  [OK] {item['name']} removed")
+                    ok += 1
+                else:
+                    self.log.emit(f"  [FAIL] {last_error_line(r.stderr)}")
+                    fail += 1
+        self.done.emit(ok, fail)
+
+
+class PruneWorker(QThread):
+    """Age-based prune of Dev Cache rows (see prune_cache); no root needed."""
+    progress = pyqtSignal(int, str)
+    log = pyqtSignal(str)
+    done = pyqtSignal(list)  # (item, entries removed, bytes freed) per cache
+
+    def __init__(self, items, days):
+        super().__init__()
+        self.items = items
+        self.days = days
+        self.token = CancelToken()
+
+    def cancel(self):
+        self.token.cancel()
+
+    def run(self):
+        cutoff = time.time() - self.days * 86400
+        results = []
+        for n, item in enumerate(self.items):
+            if self.token.cancelled:
+                break
+            self.progress.emit(n * 100 // len(self.items), f"[PRUNE] {item['name']} ...")
+            with TRACER.span("prune", "uninstall", path=item["path"]):
+                removed, freed = prune_cache(
+                    item["path"], PRUNE_UNITS.get(item["name"], "files"), cutoff, self.token,
+                    progress=lambda r, f, name=item["name"]: self.progress.emit(
+                        n * 100 // len(self.items), f"[PRUNE] {name}: {r} removed, {_fmt_bytes(f)}"))
+            self.log.emit(f"  [OK] {item['name']}: {removed} removed, {_fmt_bytes(freed)} freed")
+            results.append((item, removed, freed))
+        self.done.emit(results)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  ASYNC ENGINE
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+ENGINE = os.environ.get("H4CK3R_ENGINE", "thread")
+
+
+def _ignore(*args):
+    pass
+
+
+class AsyncEngine:
+    """asyncio counterpart of ScanWorker, ProcessWorker, DiskWorker and UninstallWorker.
+
+    Commands run through ``asyncio.create_subprocess_exec``, so hundreds of
+    ``pkgutil --pkg-info`` calls can be in flight without an OS thread each
+    (capped by ``max_procs``, H4CK3R_ASYNC_PROCS).  Plist reads and size
+    walks of scan sources go to their own small executor (``walk``), whose
+    threads the GOVERNOR may lower to background priority for good; other
+    blocking calls (uninstalls, disk, the daemon's files) use ``io``.  The GUI drives the engine on a single
+    bridge thread (``submit``); ``xp_app_manager.py scan`` uses asyncio.run.
+    Command metrics land in RUNNER, next to the thread engine's.
+    """
+
+    def __init__(self, max_procs=None, io_threads=8, deadline=SCAN_DEADLINE_S, checkpoints=None):
+        self.max_procs = max_procs or int(os.environ.get("H4CK3R_ASYNC_PROCS", "32"))
+        self.deadline = deadline
+        self.checkpoints = checkpoints
+        self._io = ThreadPoolExecutor(io_threads, thread_name_prefix="async-io")
+        self._walks = ThreadPoolExecutor(io_threads, thread_name_prefix="async-walk")
+        self._sem = self._sem_loop = None
+        self._source_sems = {}
+        self._loop = self._thread = None
+
+    # ── bridge ──
+    def submit(self, coro):
+        """Run ``coro`` on the engine's loop thread; returns a concurrent.futures.Future."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever,
+                                            name="asyncio-bridge", daemon=True)
+            self._thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def close(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(2)
+            self._loop = self._thread = None
+        self._io.shutdown(wait=False, cancel_futures=True)
+        self._walks.shutdown(wait=False, cancel_futures=True)
+
+    # ── primitives ──
+    def _slots(self):
+        loop = asyncio.get_running_loop()
+        if self._sem_loop is not loop:
+            self._sem, self._sem_loop = asyncio.Semaphore(self.max_procs), loop
+            self._source_sems = {}
+        return self._sem
+
+    def _source_slots(self, token):
+        """The governor's per-source cap as an asyncio.Semaphore (None = uncapped)."""
+        cap = GOVERNOR.proc_cap(token)
+        if not cap:
+            return None
+        self._slots()  # resets the per-source semaphores on a new loop
+        sem = self._source_sems.get(token.source)
+        if sem is None:
+            sem = self._source_sems[token.source] = asyncio.Semaphore(cap)
+        return sem
+
+    async def io(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._io, fn, *args)
+
+    async def walk(self, fn, *args):
+        """io() for a scan source's walks and plist reads, kept off the shared pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._walks, fn, *args)
+
+    async def command(self, cmd, timeout=30, token=None, input=None, check=True):
+        """Async RUNNER.run(): same arguments, same CommandError / CommandCancelled."""
+        gate = self._source_slots(token)
+        if gate is None:
+            return await self._command(cmd, timeout, token, input, check)
+        async with gate:
+            GOVERNOR._count_proc(token.source, 1)
+            try:
+                return await self._command(cmd, timeout, token, input, check)
+            finally:
+                GOVERNOR._count_proc(token.source, -1)
+
+    async def _command(self, cmd, timeout, token, input, check):
+        async with self._slots():
+            if token is not None and token.cancelled:
+                raise CommandCancelled(cmd, "cancelled")
+            t0 = time.perf_counter()
+            pipes = {"stdin": subprocess.PIPE if input is not None else subprocess.DEVNULL,
+                     "stdout": subprocess.PIPE, "stderr": subprocess.PIPE}
+            launch = GOVERNOR.wrap(cmd, token)
+            try:
+                if isinstance(launch, str):
+                    proc = await asyncio.create_subprocess_shell(launch, **pipes)
+                else:
+                    proc = await asyncio.create_subprocess_exec(*launch, **pipes)
+            except OSError as e:
+                RUNNER._record(cmd, time.perf_counter() - t0, "failed")
+                raise CommandError(cmd, "not found" if isinstance(e, FileNotFoundError) else str(e))
+            if token is not None:
+                token._register(proc)
+            timed_out = False
+            out = err = b""
+            try:
+                out, err = await asyncio.wait_for(
+                    proc.communicate(input.encode() if input is not None else None), timeout)
+            except asyncio.TimeoutError:
+                timed_out = True
+                _kill(proc)
+                await proc.wait()
+            except asyncio.CancelledError:
+                # a source deadline cancelled us: take the child down too, and reap it
+                _kill(proc)
+                await asyncio.shield(proc.wait())
+                raise
+            finally:
+                if token is not None:
+                    token._unregister(proc)
+            TRACER.interval("subprocess", "proc", t0, time.perf_counter() - t0,
+                            cmd=_command_line(cmd))
+            out = out.decode("utf-8", "replace")
+            err = err.decode("utf-8", "replace")
+            wall = RUNNER._finish(cmd, proc, token, t0, timed_out, err, check)
+            return CommandResult(proc.returncode, out, err, wall)
+
+    # ── inventory ──
+    async def scan(self, token=None, progress=_ignore, warn=_ignore, source_done=_ignore):
+        """All sources concurrently; None if ``token`` was cancelled.
+
+        Same deadline, partial and checkpoint rules as ScanWorker.
+        """
+        token = token or CancelToken()
+        user_apps = str(Path.home() / "Applications")
+        sources = [
+            ("applications", lambda out, tok: self._apps("/Applications", "Application", out, tok)),
+            ("user-applications", lambda out, tok: self._apps(user_apps, "User App", out, tok)),
+            ("brew-formulae", self._brew_formulae),
+            ("brew-casks", self._brew_casks),
+            ("pip", self._pip),
+            ("pkgutil", self._pkgutil),
+            ("dev-caches", self._dev_caches),
+        ] + [(src.key, functools.partial(self._package_source, src))
+             for src in PACKAGE_SOURCES if src.available()]
+        results, states = {}, {}
+        t0 = time.perf_counter()
+        progress(0, f"[SCAN] {len(sources)} sources (async) ...")
+
+        async def one(key, scan):
+            results[key], states[key] = await self._run_source(key, scan, token, warn)
+            if not token.cancelled:
+                source_done(key, len(results[key]), states[key])
+                progress(len(results) * 100 // len(sources),
+                         f"[SCAN] {key}: {len(results[key])} ({states[key]})")
+
+        with TRACER.span("scan", "scan", engine="async"):
+            await asyncio.gather(*(one(key, scan) for key, scan in sources))
+        if token.cancelled:
+            return None
+        if self.checkpoints is not None and all(s in ("done", "resumed") for s in states.values()):
+            await self.io(self.checkpoints.clear)
+        try:
+            await self.io(BUNDLE_META.save)
+        except OSError as e:
+            warn(f"[WARN] bundle metadata cache: {e}")
+        items = [it for key, _ in sources for it in results[key]]
+        METRICS.inventory(items, time.perf_counter() - t0)
+        progress(100, f"[DONE] {len(items)} targets acquired")
+        return items
+
+    async def _run_source(self, key, scan, token, warn):
+        started = time.perf_counter()
+        stamp = source_stamp(key)
+        if self.checkpoints is not None:
+            cached = await self.io(self.checkpoints.load, key, stamp)
+            METRICS.cache("checkpoint", hits=int(cached is not None), misses=int(cached is None))
+            if cached is not None:
+                METRICS.scan_source(key, "resumed", len(cached), time.perf_counter() - started)
+                return cached, "resumed"
+        child = token.child()
+        child.source = key
+        items, state = [], "done"
+        t0 = time.perf_counter()
+        try:
+            await asyncio.wait_for(scan(items, child), self.deadline)
+        except asyncio.TimeoutError:
+            child.cancel()
+            state = "partial"
+        except CommandCancelled:
+            state = "partial"
+        except CommandError as e:
+            warn(f"[WARN] {e}")
+            state = "failed"
+        TRACER.interval(f"scan:{key}", "scan", t0, time.perf_counter() - t0, items=len(items))
+        if token.cancelled:
+            return items, "cancelled"
+        await self.io(finish_source, key, items, stamp, state, self.checkpoints, warn)
+        METRICS.scan_source(key, state, len(items), time.perf_counter() - started)
+        return items, state
+
+    async def _fill_size(self, item, token):
+        item["size_mb"] = await self.walk(ScanWorker._dir_size_mb, item["path"], token)
+
+    async def _apps(self, folder, kind, out, token):
+        paths = await self.walk(app_bundles, folder)
+        metas = await asyncio.gather(*(self.walk(BUNDLE_META.get, path, token) for path in paths))
+        found = [app_item(path, kind, meta) for path, meta in zip(paths, metas)]
+        out += found
+
+        async def last_used(batch):
+            try:
+                r = await self.command(last_used_command([it["path"] for it in batch]), 30, token)
+            except CommandCancelled:
+                raise
+            except CommandError:
+                return
+            apply_last_used(batch, r.stdout)
+
+        await asyncio.gather(
+            *(last_used(found[i:i + MDLS_BATCH]) for i in range(0, len(found), MDLS_BATCH)),
+            *(self._fill_size(item, token) for item in found))
+
+    async def _brew_formulae(self, out, token):
+        cellar, listing = await asyncio.gather(
+            self.command(["brew", "--cellar"], 5, token),
+            self.command(["brew", "list", "--formula", "--versions"], 30, token),
+        )
+        found = [it for it in (brew_item(line, "Brew Formula", cellar.stdout.strip())
+                               for line in listing.stdout.splitlines()) if it]
+        out += found
+        await asyncio.gather(*(self._fill_size(it, token) for it in found))
+
+    async def _brew_casks(self, out, token):
+        listing = await self.command(["brew", "list", "--cask", "--versions"], 30, token)
+        out += [it for it in (brew_item(line, "Brew Cask") for line in listing.stdout.splitlines())
+                if it]
+
+    async def _pip(self, out, token):
+        cmd = ["pip3", "list", "--format=json"]
+        r = await self.command(cmd, 15, token)
+        try:
+            out += pip_items(r.stdout)
+        except (ValueError, KeyError, TypeError):
+            raise CommandError(cmd, "unparseable JSON output")
+
+    async def _dev_caches(self, out, token):
+        brew_cache = os.environ.get("HOMEBREW_CACHE", "")
+        if not brew_cache and shutil.which("brew"):
+            try:
+                brew_cache = (await self.command(["brew", "--cache"], 5, token)).stdout.strip()
+            except CommandCancelled:
+                raise
+            except CommandError:
+                pass
+        found = dev_cache_items(brew_cache)
+        out += found
+
+        async def fill(item):
+            nbytes, item.meta["newest_mtime"], item.meta["newest_atime"] = \
+                await self.walk(dir_usage, item["path"], token)
+            item["size_mb"] = round(nbytes / (1024 * 1024), 1)
+
+        await asyncio.gather(*map(fill, found))
+
+    async def _package_source(self, source, out, token):
+        def collect():
+            for item in source.items(token):
+                if token.cancelled:
+                    break
+                out.append(item)
+            return list(out)
+
+        async def fill(item):
+            item["size_mb"] = await self.walk(source.size, item, token)
+
+        await asyncio.gather(*map(fill, await self.walk(collect)))
+
+    async def _pkgutil(self, out, token):
+        r = await self.command(["pkgutil", "--pkgs"], 15, token)
+        found = [pkgutil_item(pkg) for pkg in sorted(filter(None, r.stdout.splitlines()))]
+        out += found
+
+        async def fill(item):
+            try:
+                info = await self.command(["pkgutil", "--pkg-info", item["name"]], 5, token)
+            except CommandCancelled:
+                raise
+            except CommandError:
+                return
+            item["version"] = pkg_info_version(info.stdout)
+
+        await asyncio.gather(*map(fill, found))
+
+    # ── processes / disk / uninstall ──
+    async def processes(self, token=None):
+        r = await self.command(["ps", "aux"], 10, token)
+        return [row for row in map(ps_row, r.stdout.splitlines()[1:]) if row is not None]
+
+    async def disk(self):
+        return await self.io(DiskWorker.collect)
+
+    async def uninstall(self, items, password, token=None, log=_ignore):
+        ok = fail = 0
+        pkgs = [it["name"] for it in items if it["kind"] == "System Pkg"]
+        if pkgs:
+            try:
+                await self.io(remove_receipt_files, pkgs, password, token, log)
+            except CommandCancelled:
+                pass
+        for item in items:
+            if token is not None and token.cancelled:
+                break
+            cmd = uninstall_command(item)
+            if not cmd:
+                log(f"  [SKIP] {item['name']}: not removable from here")
+                continue
+            log(f"  $ {cmd}")
+            shell_cmd, stdin = sudo_command(cmd, password)
+            try:
+                r = await self.command(shell_cmd, 120, token, input=stdin, check=False)
+            except CommandError as e:
+                log(f"  [ERR] {e}")
+                fail += 1
+                continue
+            if r.returncode == 0:
+                log(f"  [OK] {item['name']} removed")
+                ok += 1
+            else:
+                log(f"  [FAIL] {last_error_line(r.stderr)}")
+                fail += 1
+        return ok, fail
+
+
+class _QABCMeta(type(QObject), abc.ABCMeta):
+    """Metaclass for a QObject with abstract methods."""
+
+
+class AsyncJob(QObject, metaclass=_QABCMeta):
+    """QThread-shaped handle (start/cancel/isRunning/wait) for a coroutine on an AsyncEngine.
+
+    Signals are emitted from the bridge thread and reach the window queued,
+    exactly like a QThread worker's.
+    """
+
+    def __init__(self, engine):
+        super().__init__()
+        self.engine = engine
+        self.token = CancelToken()
+        self._future = None
+
+    @abc.abstractmethod
+    async def main(self):
+        """The job's coroutine; it emits the subclass's signals."""
+
+    def start(self):
+        self._future = self.engine.submit(self.main())
+        self._future.add_done_callback(self._report)
+
+    @staticmethod
+    def _report(future):
+        if not future.cancelled() and future.exception() is not None:
+            e = future.exception()
+            sys.excepthook(type(e), e, e.__traceback__)
+
+    def cancel(self):
+        self.token.cancel()
+
+    def isRunning(self):
+        return self._future is not None and not self._future.done()
+
+    def wait(self, msecs=None):
+        if self._future is not None:
+            try:
+                self._future.result(None if msecs is None else msecs / 1000)
+            except Exception:
+                pass
+        return not self.isRunning()
+
+
+class AsyncScanJob(AsyncJob):
+    progress = pyqtSignal(int, str)
+    warning = pyqtSignal(str)
+    source_done = pyqtSignal(str, int, str)
+    finished = pyqtSignal(list)
+
+    def __init__(self, engine):
+        super().__init__(engine)
+        self.deadline = engine.deadline
+
+    async def main(self):
+        items = await self.engine.scan(self.token, self.progress.emit, self.warning.emit,
+                                       self.source_done.emit)
+        if items is not None:
+            self.finished.emit(items)
+
+
+class AsyncProcessJob(AsyncJob):
+    warning = pyqtSignal(str)
+    finished = pyqtSignal(list)
+
+    async def main(self):
+        procs = []
+        try:
+            procs = await self.engine.processes(self.token)
+        except CommandError as e:
+            self.warning.emit(f"[WARN] {e}")
+        self.finished.emit(procs)
+
+
+class AsyncDiskJob(AsyncJob):
+    finished = pyqtSignal(dict)
+
+    async def main(self):
+        self.finished.emit(await self.engine.disk())
+
+
+class AsyncUninstallJob(AsyncJob):
+    log = pyqtSignal(str)
+    done = pyqtSignal(int, int)
+
+    def __init__(self, engine, items, password):
+        super().__init__(engine)
+        self.items = items
+        self.password = password
 
-    @staticmethod
-    def _dir_size_mb(path):
-        total = 0
-        try:
-            for dirpath, _, filenames in os.walk(path):
-                for f in filenames:
-                    fp = os.path.join(dirpath, f)
-                    try:
-                        total += os.path.getsize(fp)
-                    except OSError:
-                        pass
-        except Exception:
-            pass
-        return round(total / (1024 * 1024), 1)
+    async def main(self):
+        ok, fail = await self.engine.uninstall(self.items, self.password, self.token,
+                                               self.log.emit)
+        self.done.emit(ok, fail)
 
-    def _scan_applications(self, folder, kind):
-        items = []
-        if not os.path.isdir(folder):
-            return items
-        for name in sorted(os.listdir(folder)):
-            full = os.path.join(folder, name)
-            if name.endswith(".app") and os.path.isdir(full):
-                ver = self._get_app_version(full)
-                size = self._dir_size_mb(full)
-                items.append({
-                    "name": name.replace(".app", ""),
-                    "version": ver,
-                    "size_mb": size,
-                    "kind": kind,
-                    "path": full,
-                    "uninstall_cmd": f'rm -rf "{full}"',
-                })
-        return items
 
-    def _scan_brew_formulae(self):
-        items = []
-        try:
-            raw = subprocess.check_output(
-                ["brew", "list", "--formula", "--versions"],
-                text=True, timeout=30, stderr=subprocess.DEVNULL,
-            )
-            cellar = subprocess.check_output(
-                ["brew", "--cellar"], text=True, timeout=5
-            ).strip()
-            for line in raw.strip().splitlines():
-                parts = line.split()
-                if not parts:
-                    continue
-                name = parts[0]
-                ver = parts[1] if len(parts) > 1 else "-"
-                pkg_path = os.path.join(cellar, name)
-                size = self._dir_size_mb(pkg_path) if os.path.isdir(pkg_path) else 0
-                items.append({
-                    "name": name,
-                    "version": ver,
-                    "size_mb": size,
-                    "kind": "Brew Formula",
-                    "path": pkg_path,
-                    "uninstall_cmd": f"brew uninstall --formula {name}",
-                })
-        except Exception:
-            pass
-        return items
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  INVENTORY DAEMON
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# H4CK3R_DAEMON: the daemon's Unix socket path or "http://127.0.0.1:PORT"
+DAEMON_ADDRESS = os.environ.get("H4CK3R_DAEMON") or str(APP_HOME / "daemon.sock")
+DAEMON_PAGE_MAX = 5000
+DAEMON_TOKEN_FILE = APP_HOME / "daemon.token"
+LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "[::1]")
+HTTP_REASONS = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 403: "Forbidden",
+                404: "Not Found", 500: "Internal Server Error"}
+
+
+class RpcError(Exception):
+    """A JSON-RPC error; ``code`` follows the spec (-32601 unknown method, -32602 bad params)."""
+
+    def __init__(self, code, message):
+        self.code = code
+        super().__init__(message)
+
+
+def daemon_token(create=False):
+    """The per-user bearer token for the daemon's HTTP listener (None if there is none yet).
+
+    ``create`` writes a fresh one to DAEMON_TOKEN_FILE (mode 0600) when the file is missing.
+    """
+    try:
+        return DAEMON_TOKEN_FILE.read_text().strip() or None
+    except FileNotFoundError:
+        if not create:
+            return None
+    DAEMON_TOKEN_FILE.parent.mkdir(parents=True, exist_ok=True)
+    token = secrets.token_urlsafe(32)
+    try:
+        fd = os.open(DAEMON_TOKEN_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:  # another daemon won the race
+        return daemon_token()
+    with os.fdopen(fd, "w") as f:
+        f.write(token + "\n")
+    return token
+
+
+def _loopback_host(host):
+    """True for a Host header naming a loopback address, with or without a port."""
+    host = host.strip().lower()
+    if not host.startswith("["):
+        host = host.rpartition(":")[0] if host.count(":") == 1 else host
+    elif "]:" in host:
+        host = host[:host.index("]") + 1]
+    return host in LOOPBACK_HOSTS
+
+
+def _flag(value):
+    return str(value).lower() in ("1", "true", "yes", "on")
+
+
+class InventoryDaemon:
+    """Owns an AsyncEngine, the current inventory and its watchers; serves them over HTTP.
+
+    Methods (status, inventory, scan, processes, disk, diff, snapshots) are
+    reachable as JSON-RPC 2.0 on ``POST /rpc`` and as ``GET /v1/<method>?k=v``.
+    One scan runs at a time: scan() while one runs joins it.  processes() and
+    disk() results are shared by every caller within a short TTL.  A watcher
+    rescans when a source's stamp changes; a sampler feeds the usage store.
+    ``xp_app_manager.py daemon`` scans under the GOVERNOR; status() carries
+    its counters.  ``GET /metrics`` renders METRICS, which the scans and the
+    watcher's disk refresh keep current; with ``metrics_file`` it is also
+    written there every METRICS_WRITE_S seconds when it changed.  On an
+    ``http://`` address every request must carry ``Authorization: Bearer``
+    with daemon_token() and a loopback Host; the Unix socket relies on 0600.
+    """
+
+    def __init__(self, engine, watch_interval=60, usage_interval=USAGE_INTERVAL, log=_ignore,
+                 metrics_file=METRICS_FILE):
+        self.engine = engine
+        self.watch_interval = watch_interval
+        self.usage_interval = usage_interval
+        self.metrics_file = metrics_file
+        self.log = log
+        self.items = []
+        self.generation = 0  # completed scans; a client paging across a rescan restarts
+        self.scanned_at = None
+        self.progress = (0, "idle")
+        self.sources = {}  # key -> [items, state] of the running or last scan
+        self.stamps = {}
+        self.warnings = deque(maxlen=50)
+        self.usage = UsageStore().load()
+        self.usage_index = {}
+        self.requests = 0
+        self.started = time.time()
+        self._scan = None
+        self._shared = {}
+        self.token = None  # required on the HTTP listener only
+        self.methods = {
+            "status": self.rpc_status, "inventory": self.rpc_inventory, "scan": self.rpc_scan,
+            "processes": self.rpc_processes, "disk": self.rpc_disk, "diff": self.rpc_diff,
+            "snapshots": self.rpc_snapshots,
+        }
 
-    def _scan_brew_casks(self):
-        items = []
+    # ── methods ──
+    async def rpc_status(self):
+        return {"pid": os.getpid(), "uptime_s": round(time.time() - self.started),
+                "scanning": self.scanning, "progress": list(self.progress), "sources": self.sources,
+                "items": len(self.items), "generation": self.generation, "scanned_at": self.scanned_at,
+                "requests": self.requests, "warnings": list(self.warnings),
+                "governor": GOVERNOR.snapshot()}
+
+    async def rpc_inventory(self, kind="All", q="", offset=0, limit=500):
+        offset, limit = max(int(offset), 0), min(max(int(limit), 0), DAEMON_PAGE_MAX)
+        rows = filter_indices(self.items, kind, q)
+        return {"total": len(rows), "offset": offset, "generation": self.generation,
+                "scanned_at": self.scanned_at,
+                "items": [self.items[i].as_dict() for i in rows[offset:offset + limit]]}
+
+    async def rpc_scan(self, wait=False, fresh=False):
+        started = not self.scanning
+        if started:
+            self.sources, self.progress = {}, (0, "[SCAN] starting")
+            self._scan = asyncio.ensure_future(self._run_scan(_flag(fresh)))
+        if _flag(wait):
+            await asyncio.shield(self._scan)
+        return {"started": started, "scanning": self.scanning, "items": len(self.items)}
+
+    async def rpc_processes(self, q=""):
+        procs = await self._shared_call("processes", 2, self.engine.processes)
+        q = str(q).lower()
+        return [p for p in procs if q in p["command"].lower() or q in p["user"].lower()] if q else procs
+
+    async def rpc_disk(self):
+        return await self._shared_call("disk", 30, self.engine.disk)
+
+    async def rpc_diff(self, old="-2", new="-1"):
+        store = SnapshotStore()
         try:
-            raw = subprocess.check_output(
-                ["brew", "list", "--cask", "--versions"],
-                text=True, timeout=30, stderr=subprocess.DEVNULL,
-            )
-            for line in raw.strip().splitlines():
-                parts = line.split()
-                if not parts:
-                    continue
-                name = parts[0]
-                ver = parts[1] if len(parts) > 1 else "-"
-                items.append({
-                    "name": name,
-                    "version": ver,
-                    "size_mb": 0,
-                    "kind": "Brew Cask",
-                    "path": "",
-                    "uninstall_cmd": f"brew uninstall --cask {name}",
-                })
-        except Exception:
-            pass
-        return items
+            old_items = await self.engine.io(load_inventory, store.resolve(str(old)))
+            new_items = await self.engine.io(load_inventory, store.resolve(str(new)))
+        except (OSError, ValueError) as e:
+            raise RpcError(-32602, str(e))
+        return diff_inventories(old_items, new_items)
+
+    async def rpc_snapshots(self):
+        return [snap.name.replace(".json.gz", "") for snap in SnapshotStore().list()]
+
+    @property
+    def scanning(self):
+        return self._scan is not None and not self._scan.done()
+
+    async def call(self, method, params):
+        fn = self.methods.get(method)
+        if fn is None:
+            raise RpcError(-32601, f"unknown method {method!r}")
+        if not isinstance(params, dict):
+            raise RpcError(-32602, "params must be an object")
+        try:
+            inspect.signature(fn).bind(**params)
+        except TypeError as e:
+            raise RpcError(-32602, str(e))
+        self.requests += 1
+        try:
+            return await fn(**params)
+        except ValueError as e:
+            raise RpcError(-32602, str(e))
+        except CommandError as e:
+            raise RpcError(-32000, str(e))
+
+    # ── background work ──
+    async def _shared_call(self, name, ttl, factory):
+        """factory()'s result, shared by every caller within ``ttl`` seconds (errors are not)."""
+        at, fut = self._shared.get(name, (0.0, None))
+        fresh = fut is not None and (not fut.done() or (
+            time.monotonic() - at < ttl and not fut.cancelled() and fut.exception() is None))
+        METRICS.cache(f"daemon-{name}", hits=int(fresh), misses=int(not fresh))
+        if not fresh:
+            fut = asyncio.ensure_future(factory())
+            self._shared[name] = (time.monotonic(), fut)
+        return await asyncio.shield(fut)
+
+    def _warn(self, msg):
+        self.warnings.append(msg)
+        self.log(f"  {msg}")
+
+    async def _run_scan(self, fresh):
+        def progress(pct, msg):
+            self.progress = (pct, msg)
+
+        def source_done(key, count, state):
+            self.sources[key] = [count, state]
+
+        self.engine.checkpoints = None if fresh else ScanCheckpoints()
+        keys = list(self.stamps) or None
+        stamps = await self.engine.io(lambda: {k: source_stamp(k) for k in keys}) if keys else None
+        t0 = time.perf_counter()
+        try:
+            items = await self.engine.scan(CancelToken(), progress, self._warn, source_done)
+        except Exception as e:
+            self._warn(f"[ERR] scan: {e}")
+            return
+        if items is None:
+            return
+        self.items = items
+        self.generation += 1
+        self.scanned_at = datetime.now().astimezone().isoformat(timespec="seconds")
+        self.usage_index = usage_prefixes(items)
+        self.stamps = stamps or await self.engine.io(
+            lambda: {k: source_stamp(k) for k in self.sources})
+        self.log(f"  [DONE] {len(items)} targets in {time.perf_counter() - t0:.1f}s")
+        try:
+            await self.engine.io(SnapshotStore().save, items)
+        except OSError as e:
+            self._warn(f"[WARN] snapshot: {e}")
 
-    def _scan_pip(self):
-        items = []
+    async def _watch(self):
+        """Rescan when the directories a source lists change; refresh the disk metrics."""
+        while True:
+            try:
+                await self._shared_call("disk", 30, self.engine.disk)
+            except OSError as e:
+                self._warn(f"[WARN] disk: {e}")
+            await asyncio.sleep(self.watch_interval)
+            if self.scanning or not self.stamps:
+                continue
+            now = await self.engine.io(lambda: {k: source_stamp(k) for k in self.stamps})
+            changed = [k for k, stamp in now.items() if stamp is not None and stamp != self.stamps[k]]
+            if changed:
+                self.log(f"  [WATCH] changed: {', '.join(changed)} -> rescan")
+                await self.rpc_scan()
+
+    async def _sample_usage(self):
+        taken = 0
+        while True:
+            await asyncio.sleep(self.usage_interval)
+            if not self.usage_index:
+                continue
+            try:
+                procs = await self._shared_call("processes", 2, self.engine.processes)
+            except CommandError as e:
+                self._warn(f"[WARN] usage sample: {e}")
+                continue
+            owners = {usage_owner(p["command"], self.usage_index) for p in procs}
+            owners.discard(None)
+            self.usage.record(owners, interval=self.usage_interval)
+            taken += 1
+            if taken % 10 == 0:
+                try:
+                    await self.engine.io(self.usage.save)
+                except OSError as e:
+                    self._warn(f"[WARN] usage store: {e}")
+
+    async def _write_metrics(self):
+        written = None
+        while True:
+            if METRICS.version != written:
+                written = METRICS.version
+                try:
+                    await self.engine.io(METRICS.write_textfile, self.metrics_file)
+                except OSError as e:
+                    self._warn(f"[WARN] metrics file: {e}")
+            await asyncio.sleep(METRICS_WRITE_S)
+
+    def _load_snapshot(self):
+        snaps = SnapshotStore().list()
+        if snaps:
+            self.items = [InventoryItem.from_dict(d) for d in load_inventory(snaps[-1])]
+            self.scanned_at = snaps[-1].name.replace(".json.gz", "")
+            self.usage_index = usage_prefixes(self.items)
+            METRICS.inventory(self.items)
+
+    # ── HTTP ──
+    async def handle(self, reader, writer):
         try:
-            raw = subprocess.check_output(
-                ["pip3", "list", "--format=json"],
-                text=True, timeout=15, stderr=subprocess.DEVNULL,
-            )
-            pkgs = json.loads(raw)
-            for pkg in pkgs:
-                items.append({
-                    "name": pkg["name"],
-                    "version": pkg.get("version", "-"),
-                    "size_mb": 0,
-                    "kind": "pip Package",
-                    "path": "",
-                    "uninstall_cmd": f"pip3 uninstall -y --break-system-packages {pkg['name']}",
-                })
-        except Exception:
+            status, payload = await self._request(reader)
+        except (ValueError, TypeError, AttributeError, UnicodeDecodeError,
+                asyncio.IncompleteReadError, asyncio.TimeoutError):
+            status, payload = 400, {"error": "bad request"}
+        if isinstance(payload, str):
+            data, ctype = payload.encode(), "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            data = json.dumps(payload, separators=(",", ":"), default=str).encode()
+            ctype = "application/json"
+        try:
+            writer.write(f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+                         f"Content-Type: {ctype}\r\nContent-Length: {len(data)}\r\n"
+                         f"Connection: close\r\n\r\n".encode() + data)
+            await writer.drain()
+            writer.close()
+        except OSError:
             pass
-        return items
 
-    def _scan_pkgutil(self):
-        items = []
+    async def _request(self, reader):
+        method, target, _ = (await asyncio.wait_for(reader.readline(), 10)).decode("latin-1").split(" ", 2)
+        headers = {}
+        while True:
+            line = await asyncio.wait_for(reader.readline(), 10)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length") or 0)
+        if length > 1 << 20:
+            raise ValueError("request too large")
+        body = await asyncio.wait_for(reader.readexactly(length), 10) if length else b""
+        url = urllib.parse.urlsplit(target)
+        if self.token is not None:
+            # other local users, DNS-rebound pages and cross-site forms can all reach a TCP port
+            if not _loopback_host(headers.get("host", "")):
+                return 403, {"error": "Host must be a loopback address"}
+            scheme, _, given = headers.get("authorization", "").partition(" ")
+            if scheme.lower() != "bearer" or not hmac.compare_digest(given.strip().encode(),
+                                                                     self.token.encode()):
+                return 401, {"error": f"missing or wrong bearer token (see {DAEMON_TOKEN_FILE})"}
+
+        if url.path == "/metrics" and method == "GET":
+            return 200, METRICS.render()
+        if url.path == "/rpc" and method == "POST":
+            doc = json.loads(body)
+            if not isinstance(doc, dict) or not isinstance(doc.get("method"), str):
+                return 200, {"jsonrpc": "2.0", "id": None,
+                             "error": {"code": -32600, "message": "invalid request"}}
+            try:
+                result = await self.call(doc["method"], doc.get("params") or {})
+                return 200, {"jsonrpc": "2.0", "id": doc.get("id"), "result": result}
+            except RpcError as e:
+                return 200, {"jsonrpc": "2.0", "id": doc.get("id"),
+                             "error": {"code": e.code, "message": str(e)}}
+        if url.path.startswith("/v1/") and method in ("GET", "POST"):
+            params = {k: v[-1] for k, v in urllib.parse.parse_qs(url.query).items()}
+            if body:
+                extra = json.loads(body)
+                if not isinstance(extra, dict):
+                    return 400, {"error": "body must be a JSON object"}
+                params.update(extra)
+            try:
+                return 200, await self.call(url.path[4:], params)
+            except RpcError as e:
+                return (404 if e.code == -32601 else 400 if e.code == -32602 else 500), \
+                    {"error": str(e)}
+        return 404, {"error": f"no route {method} {url.path}"}
+
+    async def serve(self, address=DAEMON_ADDRESS, scan=True):
+        if address.startswith("http://"):
+            url = urllib.parse.urlsplit(address)
+            self.token = await self.engine.io(daemon_token, True)
+            server = await asyncio.start_server(self.handle, url.hostname or "127.0.0.1", url.port or 8765)
+        else:
+            if os.path.exists(address):
+                if DaemonClient(address, timeout=2).alive():
+                    raise OSError(f"a daemon is already listening on {address}")
+                os.unlink(address)  # stale socket of a dead daemon
+            Path(address).parent.mkdir(parents=True, exist_ok=True)
+            server = await asyncio.start_unix_server(self.handle, path=address)
+            os.chmod(address, 0o600)
+        await self.engine.io(self._load_snapshot)
+        self.log(f"  [DAEMON] pid {os.getpid()} on {address}; {len(self.items)} targets from snapshot")
+        tasks = [asyncio.ensure_future(self._watch())]
+        if self.usage_interval > 0:
+            tasks.append(asyncio.ensure_future(self._sample_usage()))
+        if self.metrics_file:
+            tasks.append(asyncio.ensure_future(self._write_metrics()))
+        if scan:
+            await self.rpc_scan()
+        # SIGTERM (launchd, kill) unwinds like Ctrl-C so the socket is removed
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
         try:
-            raw = subprocess.check_output(
-                ["pkgutil", "--pkgs"], text=True, timeout=15
-            )
-            for pkg in sorted(raw.strip().splitlines()):
-                if not pkg:
-                    continue
-                ver = "-"
+            async with server:
+                await server.serve_forever()
+        finally:
+            for task in tasks:
+                task.cancel()
+            if self.usage.last_sample:
+                self.usage.save()
+            if not address.startswith("http://"):
                 try:
-                    info = subprocess.check_output(
-                        ["pkgutil", "--pkg-info", pkg],
-                        text=True, timeout=5, stderr=subprocess.DEVNULL,
-                    )
-                    for ln in info.splitlines():
-                        if ln.startswith("version:"):
-                            ver = ln.split(":", 1)[1].strip()
-                            break
-                except Exception:
+                    os.unlink(address)
+                except OSError:
                     pass
-                items.append({
-                    "name": pkg,
-                    "version": ver,
-                    "size_mb": 0,
-                    "kind": "System Pkg",
-                    "path": "",
-                    "uninstall_cmd": f"pkgutil --forget {pkg}",
-                })
-        except Exception:
-            pass
-        return items
 
 
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-#  PROCESS SCANNER
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-class ProcessWorker(QThread):
-    finished = pyqtSignal(list)
+class DaemonClient:
+    """Blocking JSON-RPC client for InventoryDaemon, over its Unix socket or a localhost URL."""
 
-    def run(self):
-        procs = []
+    def __init__(self, address=None, timeout=30):
+        self.address = address or DAEMON_ADDRESS
+        self.timeout = timeout
+
+    def _connection(self):
+        if self.address.startswith("http://"):
+            url = urllib.parse.urlsplit(self.address)
+            return http.client.HTTPConnection(url.hostname, url.port or 8765, timeout=self.timeout)
+        conn = http.client.HTTPConnection("localhost", timeout=self.timeout)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
         try:
-            raw = subprocess.check_output(
-                ["ps", "aux"], text=True, timeout=10,
-            )
-            for line in raw.strip().splitlines()[1:]:
-                parts = line.split(None, 10)
-                if len(parts) < 11:
-                    continue
-                procs.append({
-                    "user": parts[0],
-                    "pid": parts[1],
-                    "cpu": parts[2],
-                    "mem": parts[3],
-                    "command": parts[10][:120],
-                })
-        except Exception:
-            pass
-        self.finished.emit(procs)
+            sock.connect(self.address)
+        except OSError:
+            sock.close()
+            raise
+        conn.sock = sock
+        return conn
+
+    def call(self, method, **params):
+        """Result of ``method``; RpcError for a method error, OSError if there is no daemon
+        (PermissionError if it refused the token)."""
+        conn = self._connection()
+        headers = {"Content-Type": "application/json"}
+        if self.address.startswith("http://"):
+            headers["Authorization"] = f"Bearer {daemon_token() or ''}"
+        try:
+            conn.request("POST", "/rpc", json.dumps(
+                {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}), headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        finally:
+            conn.close()
+        if resp.status in (401, 403):
+            raise PermissionError(f"daemon refused the request: {json.loads(body)['error']}")
+        doc = json.loads(body)
+        if "error" in doc:
+            raise RpcError(doc["error"]["code"], doc["error"]["message"])
+        return doc["result"]
+
+    def alive(self):
+        try:
+            self.call("status")
+            return True
+        except (OSError, ValueError, RpcError):
+            return False
+
+    def inventory(self, kind="All", q=""):
+        """Every matching item (dicts), paged; restarts if a rescan lands mid-way."""
+        while True:
+            items, offset, generation = [], 0, None
+            while True:
+                page = self.call("inventory", kind=kind, q=q, offset=offset, limit=DAEMON_PAGE_MAX)
+                if generation is not None and page["generation"] != generation:
+                    break
+                generation = page["generation"]
+                items += page["items"]
+                offset += len(page["items"])
+                if not page["items"] or offset >= page["total"]:
+                    return items
+
+
+class DaemonScanWorker(QThread):
+    """[SCAN ALL] through a running daemon: starts or joins its scan, relays progress, fetches the result.
+
+    Cancelling only detaches this window; the daemon's scan carries on for its other clients.
+    """
+    progress = pyqtSignal(int, str)
+    warning = pyqtSignal(str)
+    source_done = pyqtSignal(str, int, str)
+    finished = pyqtSignal(list)
 
+    def __init__(self, client):
+        super().__init__()
+        self.client = client
+        self.token = CancelToken()
 
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-#  DISK USAGE WORKER
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-class DiskWorker(QThread):
-    finished = pyqtSignal(dict)
+    def cancel(self):
+        self.token.cancel()
 
     def run(self):
-        info = {}
         try:
-            usage = shutil.disk_usage("/")
-            info["total_gb"] = round(usage.total / (1024**3), 1)
-            info["used_gb"] = round(usage.used / (1024**3), 1)
-            info["free_gb"] = round(usage.free / (1024**3), 1)
-            info["percent"] = round(usage.used / usage.total * 100, 1)
-        except Exception:
-            info = {"total_gb": 0, "used_gb": 0, "free_gb": 0, "percent": 0}
-        self.finished.emit(info)
+            self.client.call("scan")
+            reported = set()
+            while not self.token.cancelled:
+                status = self.client.call("status")
+                for key, (count, state) in status["sources"].items():
+                    if key not in reported:
+                        reported.add(key)
+                        self.source_done.emit(key, count, state)
+                self.progress.emit(*status["progress"])
+                if not status["scanning"]:
+                    break
+                time.sleep(0.5)
+            if self.token.cancelled:
+                return
+            items = [InventoryItem.from_dict(d) for d in self.client.inventory()]
+        except (OSError, ValueError, RpcError) as e:
+            self.warning.emit(f"[WARN] daemon: {e}")
+            self.progress.emit(0, "[ERR] daemon unreachable")
+            return
+        self.finished.emit(items)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-#  UNINSTALL WORKER
+#  TERMINAL LOG SINK
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-class UninstallWorker(QThread):
-    log = pyqtSignal(str)
-    done = pyqtSignal(int, int)
-
-    def __init__(self, items, password):
-        super().__init__()
-        self.items = items
-        self.password = password
-
-    def run(self):
-        ok = fail = 0
-        for item in self.items:
-            cmd = item["uninstall_cmd"]
-            self.log.emit(f"  $ {cmd}")
-            try:
-                needs_sudo = cmd.startswith("rm -rf") or cmd.startswith("pkgutil")
-                if needs_sudo:
-                    full_cmd = f"echo '{self.password}' | sudo -S {cmd}"
-                else:
-                    full_cmd = cmd
-                r = subprocess.run(
-                    full_cmd, shell=True, capture_output=True,
-                    text=True, timeout=120,
-                )
-                if r.returncode == 0:
-                    self.log.emit(f"  [OK] {item['name']} removed")
-                    ok += 1
-                else:
-                    err = r.stderr.strip().split('\n')[-1] if r.stderr.strip() else "unknown error"
-                    self.log.emit(f"  [FAIL] {err}")
-                    fail += 1
-            except Exception as e:
-                self.log.emit(f"  [ERR] {e}")
-                fail += 1
-        self.done.emit(ok, fail)
+LOG_LEVELS = ("DEBUG", "INFO", "WARN", "ERROR")
+LOG_SOURCES = ("app", "scan", "disk", "export", "uninstall", "process")
+
+
+def infer_log_level(msg):
+    if "[FAIL]" in msg or "[ERR]" in msg:
+        return "ERROR"
+    if "[WARN]" in msg or "[!]" in msg:
+        return "WARN"
+    return "INFO"
+
+
+class _TupleQueueListener(logging.handlers.QueueListener):
+    """Builds the LogRecord on the listener thread; the UI thread only enqueues tuples."""
+
+    def prepare(self, rec):
+        created, level, source, msg = rec
+        return logging.makeLogRecord({
+            "created": created, "msecs": (created % 1) * 1000, "levelname": level,
+            "levelno": logging.WARNING if level == "WARN" else getattr(logging, level),
+            "source": source, "msg": msg,
+        })
+
+
+class LogSink(QObject):
+    """Bounded, batched sink behind the [TERMINAL] view.
+
+    Every line goes into a ring buffer and a pending batch; a timer flushes
+    the batch into the view with one cursor edit.  The view keeps at most
+    MAX_BLOCKS lines; changing the level/source filter re-renders from the
+    ring.  An optional rotating log file is written by a QueueListener
+    thread, so disk I/O never runs on the event loop.
+    """
+    RING_SIZE = 20000
+    MAX_BLOCKS = 5000
+    FLUSH_MS = 100
+    FILE_MAX_BYTES = 5 * 1024 * 1024
+    FILE_BACKUPS = 3
+
+    def __init__(self, view=None, parent=None):
+        super().__init__(parent)
+        self.view = None
+        self.ring = deque(maxlen=self.RING_SIZE)
+        self.pending = []
+        self.min_level = LOG_LEVELS.index("INFO")
+        self.source = None
+        self.file_queue = None
+        self.file_listener = None
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)
+        if view is not None:
+            self.attach(view)
+
+    def attach(self, view):
+        """Start rendering into ``view``; lines logged before now come from the ring."""
+        self.view = view
+        view.document().setMaximumBlockCount(self.MAX_BLOCKS)
+        self.set_filter(LOG_LEVELS[self.min_level], self.source)
+
+    def write(self, msg, level=None, source="app"):
+        level = level or infer_log_level(msg)
+        rec = (LOG_LEVELS.index(level), source, msg)
+        self.ring.append(rec)
+        if self.file_queue is not None:
+            self.file_queue.put((time.time(), level, source, msg))
+        if self.view is not None and self._visible(rec):
+            self.pending.append(msg)
+            if not self.timer.isActive():
+                self.timer.start(self.FLUSH_MS)
+
+    def _visible(self, rec):
+        return rec[0] >= self.min_level and (self.source is None or rec[1] == self.source)
+
+    def flush(self):
+        if not self.pending or self.view is None:
+            return
+        lines = self.pending[-self.MAX_BLOCKS:]
+        self.pending = []
+        self.view.appendPlainText("\n".join(lines))
+        bar = self.view.verticalScrollBar()
+        bar.setValue(bar.maximum())
+
+    def set_filter(self, level=None, source=None):
+        self.min_level = LOG_LEVELS.index(level or "DEBUG")
+        self.source = source
+        self.pending = []
+        if self.view is None:
+            return
+        visible = [rec[2] for rec in self.ring if self._visible(rec)]
+        self.view.setPlainText("\n".join(visible[-self.MAX_BLOCKS:]))
+        self.view.moveCursor(QTextCursor.MoveOperation.End)
+
+    def clear(self):
+        self.ring.clear()
+        self.pending = []
+        if self.view is not None:
+            self.view.clear()
+
+    def enable_file(self, path):
+        """Start (or with path=None stop) the rotating on-disk log."""
+        if self.file_listener is not None:
+            self.file_listener.stop()
+            for handler in self.file_listener.handlers:
+                handler.close()
+            self.file_listener = self.file_queue = None
+        if not path:
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=self.FILE_MAX_BYTES, backupCount=self.FILE_BACKUPS, encoding="utf-8")
+        handler.setFormatter(logging.Formatter(
+            "%(asctime)s %(levelname)-7s %(source)-9s %(message)s"))
+        self.file_queue = queue.SimpleQueue()
+        self.file_listener = _TupleQueueListener(self.file_queue, handler)
+        self.file_listener.start()
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 #  CONFIRM DIALOG
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class HackerConfirmDialog(QDialog):
-    def __init__(self, items, parent=None):
+    """Lists the targets; ``extras`` (Library leftovers of the selected apps) are opt-out."""
+
+    def __init__(self, items, parent=None, extras=()):
         super().__init__(parent)
         self.setWindowTitle("[!] CONFIRM UNINSTALL")
         self.setFixedSize(540, 380)
@@ -806,8 +6080,22 @@ class HackerConfirmDialog(QDialog):
         txt = QTextEdit()
         txt.setReadOnly(True)
         for it in items:
-            txt.append(f"  > {it['name']}  [{it['kind']}]")
+            if uninstall_command(it):
+                txt.append(f"  > {it['name']}  [{it['kind']}]")
+            else:
+                txt.append(f"  - {it['name']}  [{it['kind']}]  not removable here, skipped")
+        self.extras = list(extras)
+        for it in self.extras:
+            for path in it["meta"]["paths"]:
+                txt.append(f"  + {path}  [Leftover of {it['name']}]")
         layout.addWidget(txt, 1)
+        self.extras_chk = None
+        if self.extras:
+            mb = sum(it["size_mb"] for it in self.extras)
+            self.extras_chk = QCheckBox(f"Also remove {sum(len(it['meta']['paths']) for it in self.extras)}"
+                                        f" Library leftover(s), {mb:.1f}MB")
+            self.extras_chk.setChecked(True)
+            layout.addWidget(self.extras_chk)
         layout.addSpacing(8)
 
         btn_row = QHBoxLayout()
@@ -825,6 +6113,9 @@ class HackerConfirmDialog(QDialog):
         self.result_action = True
         self.accept()
 
+    def chosen_extras(self):
+        return self.extras if self.extras_chk is not None and self.extras_chk.isChecked() else []
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 #  PASSWORD DIALOG
@@ -867,6 +6158,237 @@ class HackerPasswordDialog(QDialog):
             self.accept()
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  TREEMAP VIEW
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+def _fmt_bytes(n):
+    for unit in ("B", "K", "M", "G"):
+        if n < 1024:
+            return f"{n:.0f}{unit}" if unit == "B" else f"{n:.1f}{unit}"
+        n /= 1024
+    return f"{n:.1f}T"
+
+
+class TreemapWidget(QWidget):
+    """Paints a DiskNode as nested squarified tiles; click a tile to drill down."""
+    drill = pyqtSignal(str)
+    DEPTH_COLORS = [NEON_GREEN_DARK, "#003a3a", "#2a004d", "#3a2a00"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.node = None
+        self.hits = []
+        self.setMinimumSize(600, 400)
+        self.setMouseTracking(True)
+
+    def set_node(self, node):
+        self.node = node
+        self.update()
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.fillRect(self.rect(), QColor(BG_DARKEST))
+        self.hits = []
+        if self.node is not None and self.node.size > 0:
+            p.setFont(QFont("Menlo", 9))
+            self._paint_node(p, self.node, 0.0, 0.0,
+                             float(self.width()), float(self.height()), 0)
+        p.end()
+
+    def _paint_node(self, p, node, x, y, w, h, depth):
+        tiles = node.tiles()
+        rects = squarify([t[1] for t in tiles], x, y, w, h)
+        border = QColor(NEON_GREEN)
+        fill = QColor(self.DEPTH_COLORS[depth % len(self.DEPTH_COLORS)])
+        for (label, size, child), (rx, ry, rw, rh) in zip(tiles, rects):
+            if rw < 2 or rh < 2:
+                continue
+            rect = QRect(int(rx), int(ry), int(rw), int(rh))
+            p.setPen(QPen(border, 1))
+            p.setBrush(fill if child is not None else QColor(BG_PANEL))
+            p.drawRect(rect.adjusted(0, 0, -1, -1))
+            if child is not None:
+                self.hits.append((rect, child))
+            if rw > 40 and rh > 14:
+                p.setPen(QColor("#ffffff") if depth == 0 else QColor(NEON_GREEN))
+                p.drawText(rect.adjusted(3, 1, -3, 0),
+                           Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
+                           f"{label}  {_fmt_bytes(size)}")
+            if (child is not None and child.children
+                    and depth + 1 < TREEMAP_VISIBLE_DEPTH and rw > 24 and rh > 30):
+                self._paint_node(p, child, rx + 2, ry + 15, rw - 4, rh - 17, depth + 1)
+
+    def _hit(self, pos):
+        # deepest tile wins — hits are appended parent first
+        for rect, node in reversed(self.hits):
+            if rect.contains(pos):
+                return node
+        return None
+
+    def mouseMoveEvent(self, event):
+        node = self._hit(event.position().toPoint())
+        self.setToolTip(f"{node.path}\n{_fmt_bytes(node.size)}" if node else "")
+
+    def mousePressEvent(self, event):
+        node = self._hit(event.position().toPoint())
+        if node is not None and event.button() == Qt.MouseButton.LeftButton:
+            # drill to the top-level tile under the cursor
+            while node.parent is not None and node.parent is not self.node:
+                node = node.parent
+            self.drill.emit(node.path)
+
+
+class HackerTreemapDialog(QDialog):
+    """Treemap browser.  Measured subtrees are kept in ``measured`` so
+    drilling into (or back out to) an already-walked path needs no rescan."""
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("[TREEMAP] disk usage")
+        self.resize(1000, 700)
+        self.measured = []
+        self.worker = None
+        self.path = path
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        top = QHBoxLayout()
+        self.up_btn = QPushButton("  [..]  ")
+        self.up_btn.clicked.connect(self._go_up)
+        top.addWidget(self.up_btn)
+        self.path_label = QLabel(path)
+        self.path_label.setObjectName("sysInfoLabel")
+        top.addWidget(self.path_label, 1)
+        self.rescan_btn = QPushButton("  [RESCAN]  ")
+        self.rescan_btn.setObjectName("infoBtn")
+        self.rescan_btn.clicked.connect(lambda: self.open_path(self.path, force=True))
+        top.addWidget(self.rescan_btn)
+        layout.addLayout(top)
+
+        self.view = TreemapWidget()
+        self.view.drill.connect(self.open_path)
+        layout.addWidget(self.view, 1)
+
+        self.status = QLabel("")
+        self.status.setObjectName("statusLabel")
+        layout.addWidget(self.status)
+
+        self.open_path(path)
+
+    def _lookup(self, path):
+        for root in self.measured:
+            node = root.find(path)
+            if node is not None and node.depth_known >= TREEMAP_VISIBLE_DEPTH - 1:
+                return node
+        return None
+
+    def open_path(self, path, force=False):
+        self.path = path
+        self.path_label.setText(path)
+        node = None if force else self._lookup(path)
+        if node is not None:
+            self._stop_worker()
+            self.view.set_node(node)
+            self.status.setText(f"[CACHED] {_fmt_bytes(node.size)}")
+            return
+        self._stop_worker()
+        self.view.set_node(None)
+        self.status.setText("[SCANNING] ...")
+        self.worker = TreeScanWorker(path)
+        self.worker.partial.connect(self._on_partial)
+        self.worker.finished.connect(self._on_done)
+        self.worker.start()
+
+    def _stop_worker(self):
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.partial.disconnect()
+            self.worker.finished.disconnect()
+            self.worker.requestInterruption()
+            self.worker.wait()
+        self.worker = None
+
+    def _on_partial(self, node):
+        self.view.set_node(node)
+        self.status.setText(f"[SCANNING] {_fmt_bytes(node.size)} so far ...")
+
+    def _on_done(self, root):
+        self.measured = [r for r in self.measured if root.find(r.path) is None]
+        self.measured.append(root)
+        self.view.set_node(root)
+        self.status.setText(f"[DONE] {_fmt_bytes(root.size)}")
+
+    def _go_up(self):
+        parent = os.path.dirname(self.path.rstrip(os.sep))
+        if parent and parent != self.path:
+            self.open_path(parent)
+
+    def closeEvent(self, event):
+        self._stop_worker()
+        super().closeEvent(event)
+
+    def reject(self):
+        self._stop_worker()
+        super().reject()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  SNAPSHOT DIFF DIALOG
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class HackerDiffDialog(QDialog):
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("[DIFF] snapshot comparison")
+        self.resize(820, 560)
+        self.store = store
+        snaps = store.list()
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(16, 16, 16, 16)
+        row = QHBoxLayout()
+        self.old_combo = QComboBox()
+        self.new_combo = QComboBox()
+        for snap in snaps:
+            label = snap.name.replace(".json.gz", "")
+            self.old_combo.addItem(label, str(snap))
+            self.new_combo.addItem(label, str(snap))
+        if len(snaps) > 1:
+            self.old_combo.setCurrentIndex(len(snaps) - 2)
+        self.new_combo.setCurrentIndex(len(snaps) - 1)
+        for lbl_text, combo in (("OLD:", self.old_combo), ("NEW:", self.new_combo)):
+            lbl = QLabel(lbl_text)
+            lbl.setObjectName("dimLabel")
+            row.addWidget(lbl)
+            row.addWidget(combo, 1)
+        diff_btn = QPushButton("  [DIFF]  ")
+        diff_btn.setObjectName("scanBtn")
+        diff_btn.clicked.connect(self._run_diff)
+        row.addWidget(diff_btn)
+        layout.addLayout(row)
+
+        self.out = QTextEdit()
+        self.out.setReadOnly(True)
+        layout.addWidget(self.out, 1)
+
+        if len(snaps) < 2:
+            self.out.setText("[!] Need at least two completed scans to diff.")
+        else:
+            self._run_diff()
+
+    def _run_diff(self):
+        old_path, new_path = self.old_combo.currentData(), self.new_combo.currentData()
+        if not old_path or not new_path:
+            return
+        t0 = time.perf_counter()
+        try:
+            diff = diff_inventories(load_inventory(old_path), load_inventory(new_path))
+        except Exception as e:
+            self.out.setText(f"[ERR] {e}")
+            return
+        lines = format_diff(diff)
+        lines.append(f"  [{(time.perf_counter() - t0) * 1000:.0f} ms]")
+        self.out.setPlainText("\n".join(lines))
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 #  MAIN WINDOW
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -880,12 +6402,38 @@ ASCII_BANNER = r"""
 """
 
 
+class SortKeyItem(QTableWidgetItem):
+    """Table cell that sorts by its UserRole value instead of its text."""
+
+    def __lt__(self, other):
+        mine, theirs = self.data(Qt.ItemDataRole.UserRole), other.data(Qt.ItemDataRole.UserRole)
+        if mine is None or theirs is None:
+            return super().__lt__(other)
+        return mine < theirs
+
+
+def usage_cells(stats):
+    """(text, sort key) for the UNUSED and MB/H columns; never-used items sort above the rest."""
+    idle, never, per_hour = stats
+    if idle is None:
+        return ("-", -1.0), ("-", -1.0)
+    unused = (f"{idle:.0f}d+", idle + 1e6) if never else (f"{idle:.0f}d", idle)
+    if per_hour is None:
+        return unused, ("never", float("inf"))
+    return unused, (f"{per_hour:.1f}", per_hour)
+
+
 class HackerAppManager(QMainWindow):
-    def __init__(self):
+    def __init__(self, boot=None):
         super().__init__()
         self.all_items = []
-        self.filtered_items = []
+        self.filtered_rows = array("i")  # positions in all_items
         self.processes = []
+        self.library_index = LibraryIndex()
+        self.library_entries = []  # LibraryIndex entries from the last [LEFTOVERS] run
+        self.outdated = {}  # (kind, name, version) -> newer version, from [OUTDATED]
+        self.usage = UsageStore().load()
+        self.usage_sampler = None
 
         self.setWindowTitle("H4CK3R App Manager")
         self.setMinimumSize(1100, 720)
@@ -923,10 +6471,9 @@ class HackerAppManager(QMainWindow):
 
         self.sys_info_labels = []
         mac_ver = platform.mac_ver()[0]
-        cpu_brand = platform.processor() or "Apple Silicon"
         infos = [
             f"OS: macOS {mac_ver}",
-            f"CPU: {cpu_brand}",
+            "CPU: ...",
             f"Host: {platform.node()}",
             f"User: {os.getenv('USER', 'root')}",
             f"Time: {datetime.now().strftime('%H:%M:%S')}",
@@ -949,11 +6496,68 @@ class HackerAppManager(QMainWindow):
         self.tabs = QTabWidget()
         root.addWidget(self.tabs, 1)
 
-        # ═══ TAB 1: Applications & Packages ═══
-        tab_apps = QWidget()
-        tab_apps_layout = QVBoxLayout(tab_apps)
-        tab_apps_layout.setContentsMargins(8, 8, 8, 8)
-        tab_apps_layout.setSpacing(6)
+        # Pages are empty until first activation; see _ensure_tab
+        self._tab_builders = [
+            (self._build_packages_tab, "  [PACKAGES]  "),
+            (self._build_processes_tab, "  [PROCESSES]  "),
+            (self._build_terminal_tab, "  [TERMINAL]  "),
+            (self._build_perf_tab, "  [PERF]  "),
+        ]
+        self._built_tabs = set()
+        for _, label in self._tab_builders:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(8, 8, 8, 8)
+            page_layout.setSpacing(6)
+            self.tabs.addTab(page, label)
+        self.tabs.currentChanged.connect(self._ensure_tab)
+
+        # ── Status bar ──
+        status_bar = QFrame()
+        status_bar.setObjectName("statusBar")
+        sb = QHBoxLayout(status_bar)
+        sb.setContentsMargins(10, 4, 10, 4)
+        self.status_label = QLabel("[READY]")
+        self.status_label.setObjectName("statusLabel")
+        sb.addWidget(self.status_label, 1)
+        self.count_label = QLabel("0 targets")
+        self.count_label.setObjectName("statusLabel")
+        self.count_label.setStyleSheet(f"color: {NEON_CYAN};")
+        sb.addWidget(self.count_label)
+        self.low_power_chk = QCheckBox("LOW-FPS")
+        self.low_power_chk.setToolTip("Slow the matrix rain down to save battery")
+        self.low_power_chk.toggled.connect(self.matrix.set_low_power)
+        sb.addWidget(self.low_power_chk)
+        root.addWidget(status_bar)
+
+        # ── Terminal log (view attached when the tab is built) ──
+        self.log_sink = LogSink(None, self)
+        self._log_boot_sequence()
+
+        # ── Staged boot: shell now, tabs after first paint, timers later ──
+        self.boot = boot or StartupProfile()
+        self.boot.mark("shell")
+        self._boot_pending = {"deferred", "preload"}
+        self._first_paint_seen = False
+        self.disk_worker = None
+        self.known_volumes = set()
+        self.worker = None
+        self.uninst_worker = None
+        self.outdated_worker = None
+        self._scanning = False  # a scan will replace all_items
+        self._retired_workers = []
+        self.checkpoints = ScanCheckpoints()
+        self._partial_sources = []
+        self._failed_sources = []
+        # H4CK3R_ENGINE=async swaps the QThread workers for AsyncEngine jobs
+        self.engine = AsyncEngine(checkpoints=self.checkpoints) if ENGINE == "async" else None
+        # a running `daemon` owns scanning; the preload drops this if it does not answer
+        self.daemon = (DaemonClient() if DAEMON_ADDRESS.startswith("http://")
+                       or os.path.exists(DAEMON_ADDRESS) else None)
+
+    # ═══ TAB 1: Applications & Packages ═══
+    def _build_packages_tab(self, tab_apps):
+        tab_apps_layout = tab_apps.layout()
 
         # Toolbar
         toolbar = QFrame()
@@ -973,7 +6577,8 @@ class HackerAppManager(QMainWindow):
         self.filter_combo = QComboBox()
         self.filter_combo.addItems([
             "All", "Application", "User App",
-            "Brew Formula", "Brew Cask", "pip Package", "System Pkg"
+            "Brew Formula", "Brew Cask", "pip Package", "System Pkg",
+            *(src.kind for src in PACKAGE_SOURCES), "Dev Cache", "Leftover"
         ])
         self.filter_combo.currentTextChanged.connect(self.apply_filter)
         tb.addWidget(self.filter_combo)
@@ -998,12 +6603,63 @@ class HackerAppManager(QMainWindow):
         tb.addWidget(self.select_none_btn)
 
         tb.addSpacing(10)
+        self.export_fmt = QComboBox()
+        for ext, writer in EXPORT_WRITERS.items():
+            self.export_fmt.addItem(writer.label, ext)
+        self.export_fmt.setCurrentIndex(self.export_fmt.findData("jsonl"))
+        self.export_fmt.setMinimumWidth(110)
+        tb.addWidget(self.export_fmt)
+        self.export_gz = QCheckBox("gz")
+        tb.addWidget(self.export_gz)
         self.export_btn = QPushButton("  [EXPORT]  ")
         self.export_btn.setObjectName("exportBtn")
         self.export_btn.clicked.connect(self.export_list)
         self.export_btn.setEnabled(False)
         tb.addWidget(self.export_btn)
 
+        self.space_btn = QPushButton("  [SPACE]  ")
+        self.space_btn.setObjectName("infoBtn")
+        self.space_btn.clicked.connect(self.analyze_space)
+        tb.addWidget(self.space_btn)
+
+        self.outdated_btn = QPushButton("  [OUTDATED]  ")
+        self.outdated_btn.setObjectName("infoBtn")
+        self.outdated_btn.setToolTip("Flag formulae, casks and pip packages with newer versions in the "
+                                     "local package index.\nShift-click to refresh the index first.")
+        self.outdated_btn.clicked.connect(self.check_outdated)
+        tb.addWidget(self.outdated_btn)
+
+        self.slim_btn = QPushButton("  [SLIM]  ")
+        self.slim_btn.setObjectName("infoBtn")
+        self.slim_btn.setToolTip("Bytes per architecture in app bundles and Cellar kegs, and what "
+                                 f"dropping all but {host_arch()} would free")
+        self.slim_btn.clicked.connect(self.analyze_slim)
+        tb.addWidget(self.slim_btn)
+
+        self.leftover_btn = QPushButton("  [LEFTOVERS]  ")
+        self.leftover_btn.setObjectName("infoBtn")
+        self.leftover_btn.setToolTip("Find ~/Library data of apps that are no longer installed "
+                                     "(after a completed scan)")
+        self.leftover_btn.setEnabled(False)  # an empty or cached inventory would orphan everything
+        self.leftover_btn.clicked.connect(self.find_leftovers)
+        tb.addWidget(self.leftover_btn)
+
+        self.prune_btn = QPushButton("  [PRUNE]  ")
+        self.prune_btn.setObjectName("infoBtn")
+        self.prune_btn.setToolTip("Delete developer-cache data older than N days")
+        self.prune_btn.clicked.connect(self.prune_caches)
+        tb.addWidget(self.prune_btn)
+
+        self.treemap_btn = QPushButton("  [TREEMAP]  ")
+        self.treemap_btn.setObjectName("infoBtn")
+        self.treemap_btn.clicked.connect(self.open_treemap)
+        tb.addWidget(self.treemap_btn)
+
+        self.diff_btn = QPushButton("  [DIFF]  ")
+        self.diff_btn.setObjectName("infoBtn")
+        self.diff_btn.clicked.connect(self.open_diff)
+        tb.addWidget(self.diff_btn)
+
         self.delete_btn = QPushButton("  [UNINSTALL]  ")
         self.delete_btn.setObjectName("deleteBtn")
         self.delete_btn.clicked.connect(self.uninstall_selected)
@@ -1041,18 +6697,24 @@ class HackerAppManager(QMainWindow):
 
         # Table
         self.table = QTableWidget()
-        self.table.setColumnCount(6)
+        self.table.setColumnCount(8)
         self.table.setHorizontalHeaderLabels([
-            " SEL", " NAME", " VER", " SIZE", " TYPE", " PATH"
+            " SEL", " NAME", " VER", " SIZE", " UNUSED", " MB/H", " TYPE", " PATH"
         ])
         self.table.horizontalHeader().setSectionResizeMode(
             1, QHeaderView.ResizeMode.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(
-            5, QHeaderView.ResizeMode.Stretch)
+            7, QHeaderView.ResizeMode.Stretch)
         self.table.setColumnWidth(0, 42)
         self.table.setColumnWidth(2, 100)
         self.table.setColumnWidth(3, 80)
-        self.table.setColumnWidth(4, 120)
+        self.table.setColumnWidth(4, 70)
+        self.table.setColumnWidth(5, 70)
+        self.table.setColumnWidth(6, 120)
+        self.table.horizontalHeaderItem(4).setToolTip(
+            "Days since last seen running (or Spotlight's last-used date); "
+            "'+' = never seen since tracking began")
+        self.table.horizontalHeaderItem(5).setToolTip("Size in MB per hour seen running")
         self.table.verticalHeader().setVisible(False)
         self.table.setSelectionBehavior(
             QAbstractItemView.SelectionBehavior.SelectRows)
@@ -1062,13 +6724,9 @@ class HackerAppManager(QMainWindow):
         self.table.setAlternatingRowColors(True)
         tab_apps_layout.addWidget(self.table, 1)
 
-        self.tabs.addTab(tab_apps, "  [PACKAGES]  ")
-
-        # ═══ TAB 2: Process Manager ═══
-        tab_proc = QWidget()
-        tab_proc_layout = QVBoxLayout(tab_proc)
-        tab_proc_layout.setContentsMargins(8, 8, 8, 8)
-        tab_proc_layout.setSpacing(6)
+    # ═══ TAB 2: Process Manager ═══
+    def _build_processes_tab(self, tab_proc):
+        tab_proc_layout = tab_proc.layout()
 
         proc_toolbar = QFrame()
         proc_toolbar.setObjectName("toolBar")
@@ -1117,42 +6775,269 @@ class HackerAppManager(QMainWindow):
         self.proc_table.setAlternatingRowColors(True)
         tab_proc_layout.addWidget(self.proc_table, 1)
 
-        self.tabs.addTab(tab_proc, "  [PROCESSES]  ")
-
-        # ═══ TAB 3: Terminal / Log ═══
-        tab_log = QWidget()
-        tab_log_layout = QVBoxLayout(tab_log)
-        tab_log_layout.setContentsMargins(8, 8, 8, 8)
-
-        self.log_area = QTextEdit()
+    # ═══ TAB 3: Terminal / Log ═══
+    def _build_terminal_tab(self, tab_log):
+        tab_log_layout = tab_log.layout()
+
+        log_toolbar = QFrame()
+        log_toolbar.setObjectName("toolBar")
+        ltb = QHBoxLayout(log_toolbar)
+        ltb.setContentsMargins(8, 6, 8, 6)
+        lbl4 = QLabel("LEVEL:")
+        lbl4.setObjectName("dimLabel")
+        ltb.addWidget(lbl4)
+        self.log_level_combo = QComboBox()
+        self.log_level_combo.addItems(LOG_LEVELS)
+        self.log_level_combo.setCurrentText("INFO")
+        ltb.addWidget(self.log_level_combo)
+        ltb.addSpacing(6)
+        lbl5 = QLabel("SOURCE:")
+        lbl5.setObjectName("dimLabel")
+        ltb.addWidget(lbl5)
+        self.log_source_combo = QComboBox()
+        self.log_source_combo.addItems(("all",) + LOG_SOURCES)
+        ltb.addWidget(self.log_source_combo)
+        ltb.addStretch()
+        self.log_file_chk = QCheckBox("LOG TO FILE")
+        self.log_file_chk.setToolTip(str(APP_HOME / "logs" / "terminal.log"))
+        self.log_file_chk.toggled.connect(self._toggle_log_file)
+        ltb.addWidget(self.log_file_chk)
+        clear_btn = QPushButton("  [CLEAR]  ")
+        ltb.addWidget(clear_btn)
+        tab_log_layout.addWidget(log_toolbar)
+
+        self.log_area = QPlainTextEdit()
         self.log_area.setReadOnly(True)
         self.log_area.setFont(QFont("Menlo", 12))
-        self._log_boot_sequence()
+        self.log_level_combo.currentTextChanged.connect(self._apply_log_filter)
+        self.log_source_combo.currentTextChanged.connect(self._apply_log_filter)
+        clear_btn.clicked.connect(self.log_sink.clear)
         tab_log_layout.addWidget(self.log_area)
+        self.log_sink.attach(self.log_area)
+
+    # ═══ TAB 4: Performance traces ═══
+    def _build_perf_tab(self, tab_perf):
+        tab_perf_layout = tab_perf.layout()
+
+        perf_toolbar = QFrame()
+        perf_toolbar.setObjectName("toolBar")
+        ftb = QHBoxLayout(perf_toolbar)
+        ftb.setContentsMargins(8, 6, 8, 6)
+        self.trace_chk = QCheckBox("TRACE")
+        self.trace_chk.setChecked(TRACER.enabled)
+        self.trace_chk.setToolTip("Record spans for scans, subprocesses, size walks, "
+                                  "table refreshes and uninstalls")
+        self.trace_chk.toggled.connect(self._toggle_trace)
+        ftb.addWidget(self.trace_chk)
+        self.govern_chk = QCheckBox("GOVERN")
+        self.govern_chk.setChecked(GOVERNOR.enabled)
+        self.govern_chk.setToolTip("Scan at background priority, rate-limited, pausing under "
+                                   "load or on low battery (APP_HOME/governor.json)")
+        self.govern_chk.toggled.connect(self._toggle_govern)
+        ftb.addWidget(self.govern_chk)
+        self.govern_label = QLabel("")
+        self.govern_label.setStyleSheet(f"color: {TEXT_MID};")
+        ftb.addWidget(self.govern_label)
+        ftb.addStretch()
+        perf_clear_btn = QPushButton("  [CLEAR]  ")
+        perf_clear_btn.clicked.connect(self._clear_trace)
+        ftb.addWidget(perf_clear_btn)
+        trace_export_btn = QPushButton("  [EXPORT TRACE]  ")
+        trace_export_btn.setObjectName("exportBtn")
+        trace_export_btn.clicked.connect(self.export_trace)
+        ftb.addWidget(trace_export_btn)
+        tab_perf_layout.addWidget(perf_toolbar)
+
+        self.perf_table = QTableWidget()
+        self.perf_table.setColumnCount(8)
+        self.perf_table.setHorizontalHeaderLabels([
+            " SPAN", " CAT", " COUNT", " WALL ms", " CPU ms", " MAX ms", " BYTES", " SUBPROC"
+        ])
+        self.perf_table.horizontalHeader().setSectionResizeMode(
+            0, QHeaderView.ResizeMode.Stretch)
+        self.perf_table.verticalHeader().setVisible(False)
+        self.perf_table.setEditTriggers(
+            QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.perf_table.setAlternatingRowColors(True)
+        tab_perf_layout.addWidget(self.perf_table, 1)
+
+        # command metrics are always on: RUNNER records them regardless of TRACE
+        self.cmd_table = QTableWidget()
+        self.cmd_table.setColumnCount(7)
+        self.cmd_table.setHorizontalHeaderLabels([
+            " COMMAND", " RUNS", " FAILED", " TIMEOUT", " CANCELLED", " WALL ms", " MAX ms"
+        ])
+        self.cmd_table.horizontalHeader().setSectionResizeMode(
+            0, QHeaderView.ResizeMode.Stretch)
+        self.cmd_table.verticalHeader().setVisible(False)
+        self.cmd_table.setEditTriggers(
+            QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.cmd_table.setAlternatingRowColors(True)
+        self.cmd_table.setMaximumHeight(180)
+        tab_perf_layout.addWidget(self.cmd_table)
+
+        self.perf_timer = QTimer(self)
+        self.perf_timer.timeout.connect(self._refresh_perf)
+        self.perf_timer.start(1000)
+        self._refresh_perf()
+
+    def _toggle_trace(self, enabled):
+        TRACER.enabled = enabled
+        self._log(f"root@h4ck3r:~# trace {'on' if enabled else 'off'}")
+
+    def _toggle_govern(self, enabled):
+        GOVERNOR.configure(enabled)
+        self._log(f"root@h4ck3r:~# govern {'on' if enabled else 'off'}")
+
+    def _clear_trace(self):
+        TRACER.clear()
+        RUNNER.clear()
+        GOVERNOR.clear()
+        self._refresh_perf()
+
+    def _refresh_perf(self):
+        if self.tabs.currentWidget() is not self.perf_table.parentWidget():
+            return
+        gov = GOVERNOR.snapshot()
+        self.govern_label.setText(
+            f"  {gov['state'].upper()}  files {gov['files']}  throttled {gov['throttled_s']}s  "
+            f"paused {gov['paused_s']}s  load {gov['load']}"
+            + ("  [BATTERY]" if gov["on_battery"] else "") if gov["enabled"] else "")
+        self.govern_label.setToolTip("\n".join(
+            f"{key}: {st['files']} files, {st['throttled_s']}s throttled, "
+            f"{st['paused_s']}s paused, {st['procs']} commands running"
+            for key, st in gov["sources"].items()))
+        rows = TRACER.summary()
+        self.perf_table.setSortingEnabled(False)
+        self.perf_table.setRowCount(len(rows))
+        for row, (name, st) in enumerate(rows):
+            values = [
+                (name, None), (st["cat"], None), (str(st["count"]), st["count"]),
+                (f"{st['wall'] * 1000:.1f}", st["wall"]), (f"{st['cpu'] * 1000:.1f}", st["cpu"]),
+                (f"{st['max'] * 1000:.1f}", st["max"]),
+                (_fmt_bytes(st["bytes"]) if st["bytes"] else "-", st["bytes"]),
+                (str(st["subprocesses"]), st["subprocesses"]),
+            ]
+            for col, (text, num) in enumerate(values):
+                cell = SortKeyItem(text)
+                cell.setForeground(QColor(NEON_GREEN))
+                if num is not None:
+                    cell.setData(Qt.ItemDataRole.UserRole, float(num))
+                self.perf_table.setItem(row, col, cell)
+        self.perf_table.setSortingEnabled(True)
+
+        commands = RUNNER.summary()
+        self.cmd_table.setRowCount(len(commands))
+        for row, (name, st) in enumerate(commands):
+            values = [name, str(st["count"]), str(st["failed"]), str(st["timeout"]),
+                      str(st["cancelled"]), f"{st['wall'] * 1000:.1f}", f"{st['max'] * 1000:.1f}"]
+            for col, text in enumerate(values):
+                cell = QTableWidgetItem(text)
+                bad = col in (2, 3) and text != "0"
+                cell.setForeground(QColor(NEON_RED if bad else NEON_GREEN))
+                self.cmd_table.setItem(row, col, cell)
+
+    def export_trace(self):
+        out_path = os.path.expanduser("~/Desktop/h4ck3r_trace.json")
+        try:
+            TRACER.save_chrome_trace(out_path)
+        except OSError as e:
+            self._log(f"  [FAIL] trace export: {e}")
+            return
+        self._log(f"root@h4ck3r:~# trace exported to {out_path} ({len(TRACER.events)} spans)")
+        self.status_label.setText(f"[PERF] Trace saved to {out_path}")
 
-        self.tabs.addTab(tab_log, "  [TERMINAL]  ")
-
-        # ── Status bar ──
-        status_bar = QFrame()
-        status_bar.setObjectName("statusBar")
-        sb = QHBoxLayout(status_bar)
-        sb.setContentsMargins(10, 4, 10, 4)
-        self.status_label = QLabel("[READY]")
-        self.status_label.setObjectName("statusLabel")
-        sb.addWidget(self.status_label, 1)
-        self.count_label = QLabel("0 targets")
-        self.count_label.setObjectName("statusLabel")
-        self.count_label.setStyleSheet(f"color: {NEON_CYAN};")
-        sb.addWidget(self.count_label)
-        root.addWidget(status_bar)
+    # ── staged boot ──
+    def _ensure_tab(self, index):
+        if index in self._built_tabs or not 0 <= index < len(self._tab_builders):
+            return
+        self._built_tabs.add(index)
+        builder, _ = self._tab_builders[index]
+        builder(self.tabs.widget(index))
 
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._first_paint_seen:
+            self._first_paint_seen = True
+            self.boot.mark("first-paint")
+            QTimer.singleShot(0, self._boot_interactive)
+
+    def _boot_interactive(self):
+        self._ensure_tab(self.tabs.currentIndex())
+        self.boot.mark("tabs")
+        self.preload_worker = SnapshotLoadWorker(self.daemon)
+        self.preload_worker.finished.connect(self._on_preload_done)
+        self.preload_worker.start()
+        QTimer.singleShot(0, lambda: self.boot.mark("interactive"))
+        QTimer.singleShot(250, self._boot_deferred)
+
+    def _boot_deferred(self):
         # ── Clock timer ──
         self.clock_timer = QTimer(self)
         self.clock_timer.timeout.connect(self._update_clock)
         self.clock_timer.start(1000)
 
-        # ── Boot disk scan ──
+        # ── Boot disk scan + cheap periodic refresh ──
         self._scan_disk()
+        self.disk_timer = QTimer(self)
+        self.disk_timer.timeout.connect(self._scan_disk)
+        self.disk_timer.start(30000)
+
+        # ── Usage sampler: which bundles and kegs are seen running ──
+        if USAGE_INTERVAL > 0 and self.daemon is None:  # else the daemon samples
+            self.usage_sampler = UsageSampler(self.usage)
+            self.usage_sampler.set_items(self.all_items)
+            self.usage_sampler.warning.connect(lambda msg: self._log(f"  {msg}", source="process"))
+            self.usage_sampler.start()
+
+        # ── Metrics textfile (the daemon writes its own when one serves this window) ──
+        if METRICS_FILE:
+            self._metrics_written = None
+            self.metrics_timer = QTimer(self)
+            self.metrics_timer.timeout.connect(self._write_metrics)
+            self.metrics_timer.start(METRICS_WRITE_S * 1000)
+
+        # platform.processor() forks uname on macOS — keep it off the first paint
+        self.sys_info_labels[1].setText(f"CPU: {platform.processor() or 'Apple Silicon'}")
+        self.matrix.start()
+        self.boot.mark("deferred")
+        self._boot_stage_done("deferred")
+
+    def _on_preload_done(self, items, label):
+        self.daemon = self.preload_worker.client
+        if items and not self.all_items and self.worker is None:
+            self.all_items = items
+            METRICS.inventory(items)
+            if self.usage_sampler is not None:
+                self.usage_sampler.set_items(items)
+            self.apply_filter()
+            self.export_btn.setEnabled(True)
+            self._update_stats()
+            self.progress.setFormat(f"[CACHED] {label} — run scan to refresh")
+            self._log(f"  [CACHED] {len(items)} targets from {label}", source="scan")
+        self.boot.mark("snapshot-preload")
+        self._boot_stage_done("preload")
+
+    def _write_metrics(self):
+        if self.daemon is not None or METRICS.version == self._metrics_written:
+            return
+        self._metrics_written = METRICS.version
+        try:
+            METRICS.write_textfile(METRICS_FILE)  # a few KB; no worker needed
+        except OSError as e:
+            self._log(f"  [WARN] metrics file: {e}")
+
+    def _boot_stage_done(self, stage):
+        self._boot_pending.discard(stage)
+        if self._boot_pending:
+            return
+        self._log("root@h4ck3r:~# boot timings (ms since launch)")
+        for name, ms in self.boot.stages:
+            self._log(f"  [BOOT] {name:<18} {ms:>8.1f}")
+        try:
+            self.boot.save(APP_HOME / "startup.jsonl")
+        except OSError:
+            pass
 
     # ── log boot sequence ──
     def _log_boot_sequence(self):
@@ -1176,11 +7061,42 @@ class HackerAppManager(QMainWindow):
             "",
         ]
         for line in lines:
-            self.log_area.append(line)
+            self.log_sink.write(line)
+        self.log_sink.flush()
+
+    def _log(self, msg, level=None, source="app"):
+        self.log_sink.write(msg, level, source)
 
-    def _log(self, msg):
-        self.log_area.append(msg)
-        self.log_area.moveCursor(QTextCursor.MoveOperation.End)
+    def _apply_log_filter(self):
+        source = self.log_source_combo.currentText()
+        self.log_sink.set_filter(self.log_level_combo.currentText(),
+                                 None if source == "all" else source)
+
+    def _toggle_log_file(self, enabled):
+        path = str(APP_HOME / "logs" / "terminal.log") if enabled else None
+        try:
+            self.log_sink.enable_file(path)
+        except OSError as e:
+            self._log(f"  [FAIL] log file: {e}")
+            return
+        if path:
+            self._log(f"root@h4ck3r:~# tee -a {path}")
+
+    def closeEvent(self, event):
+        self._cancel_scan()
+        if self.uninst_worker is not None:
+            self.uninst_worker.cancel()
+        if self.usage_sampler is not None:
+            self.usage_sampler.stop()
+        RUNNER.cancel_all()
+        for worker in self._retired_workers + [self.uninst_worker]:
+            if worker is not None:
+                worker.wait(2000)
+        if self.engine is not None:
+            self.engine.close()
+        self.log_sink.flush()
+        self.log_sink.enable_file(None)
+        super().closeEvent(event)
 
     # ── clock ──
     def _update_clock(self):
@@ -1190,48 +7106,301 @@ class HackerAppManager(QMainWindow):
 
     # ── disk scan ──
     def _scan_disk(self):
-        self.disk_worker = DiskWorker()
+        if self.disk_worker and self.disk_worker.isRunning():
+            return
+        self.disk_worker = AsyncDiskJob(self.engine) if self.engine else DiskWorker()
         self.disk_worker.finished.connect(self._on_disk_done)
         self.disk_worker.start()
 
     def _on_disk_done(self, info):
+        volumes = info.get("volumes", [])
+        extra = f"  +{len(volumes) - 1} vol" if len(volumes) > 1 else ""
         self.disk_label.setText(
-            f"Disk: {info['used_gb']}G / {info['total_gb']}G  ({info['percent']}%)"
+            f"Disk: {info['used_gb']}G / {info['total_gb']}G  ({info['percent']}%){extra}"
         )
+        self.disk_label.setToolTip("\n".join(
+            f"{v['mount']}: {v['used_gb']}G / {v['total_gb']}G  "
+            f"({v['percent']}%, {v['free_gb']}G free)"
+            for v in volumes
+        ))
         pct = info["percent"]
         color = NEON_GREEN if pct < 70 else NEON_ORANGE if pct < 90 else NEON_RED
         self.disk_label.setStyleSheet(f"color: {color}; font-size: 11px;")
 
+        mounts = {v["mount"] for v in volumes}
+        for v in volumes:
+            if v["mount"] not in self.known_volumes:
+                self._log(f"  [DISK] {v['mount']}  {v['used_gb']}G / {v['total_gb']}G "
+                          f"({v['percent']}%)", source="disk")
+        for gone in sorted(self.known_volumes - mounts):
+            self._log(f"  [DISK] {gone} unmounted", source="disk")
+        self.known_volumes = mounts
+
+    # ── space breakdown ──
+    def analyze_space(self):
+        self.space_btn.setEnabled(False)
+        self._log("root@h4ck3r:~# du --where-did-my-space-go ...", source="disk")
+        self.space_worker = SpaceWorker(list(self.all_items))
+        self.space_worker.progress.connect(self._on_progress)
+        self.space_worker.finished.connect(self._on_space_done)
+        self.space_worker.start()
+
+    # ── outdated packages ──
+    def check_outdated(self):
+        refresh = bool(QApplication.keyboardModifiers() & Qt.KeyboardModifier.ShiftModifier)
+        if not refresh and not PackageIndex().path.exists():
+            refresh = QMessageBox.question(
+                self, "[OUTDATED]", "No local package index yet. Fetch it now?\n"
+                "(Homebrew's API cache if present, else formulae.brew.sh; PyPI for pip packages)"
+            ) == QMessageBox.StandardButton.Yes
+            if not refresh:
+                return
+        if self._scanning:
+            return
+        self.outdated_btn.setEnabled(False)
+        self._log(f"root@h4ck3r:~# outdated{' --refresh' if refresh else ''} ...", source="scan")
+        self.outdated_worker = OutdatedWorker(list(self.all_items), refresh)
+        self.outdated_worker.progress.connect(self._on_progress)
+        self.outdated_worker.warning.connect(lambda msg: self._log(f"  {msg}", source="scan"))
+        self.outdated_worker.finished.connect(self._on_outdated_done)
+        self.outdated_worker.start()
+
+    def _on_outdated_done(self, outdated):
+        # positions are into the worker's copy: all_items may have been replaced since
+        items = self.sender().items
+        self.outdated_btn.setEnabled(not self._scanning)
+        self.outdated = {(items[p]["kind"], items[p]["name"], items[p]["version"]): latest
+                         for p, latest in outdated.items()}
+        for (kind, name, version), latest in sorted(self.outdated.items()):
+            self._log(f"  {kind:<13} {name:<32} {version} -> {latest}", source="scan")
+        self._log(f"  [OUTDATED] {len(outdated)} packages have newer versions\n", source="scan")
+        self.apply_filter()
+        self.status_label.setText(f"[OUTDATED] {len(outdated)} packages")
+
+    # ── universal binaries ──
+    def analyze_slim(self):
+        self.slim_btn.setEnabled(False)
+        self._log("root@h4ck3r:~# lipo -info --all-bundles ...", source="disk")
+        self.slim_worker = SlimWorker(list(self.all_items))
+        self.slim_worker.progress.connect(self._on_progress)
+        self.slim_worker.finished.connect(self._on_slim_done)
+        self.slim_worker.start()
+
+    def _on_slim_done(self, rows):
+        self.slim_btn.setEnabled(True)
+        fat = [r for r in rows if r["reclaimable"]]
+        for r in fat[:25]:
+            archs = " ".join(f"{a}={_fmt_bytes(n)}" for a, n in sorted(r["by_arch"].items()))
+            self._log(f"  {_fmt_bytes(r['reclaimable']):>10}  {os.path.basename(r['path']):<32} "
+                      f"{r['fat_files']}/{r['macho_files']} fat  {archs}", source="disk")
+        total = sum(r["reclaimable"] for r in rows)
+        self._log(f"  [SLIM] {len(fat)} of {len(rows)} bundles carry extra slices; "
+                  f"{_fmt_bytes(total)} reclaimable keeping {host_arch()} "
+                  f"({self.slim_worker.analyzer.parsed} files read)\n", source="disk")
+        self.status_label.setText(f"[SLIM] {_fmt_bytes(total)} reclaimable")
+
+    # ── leftovers ──
+    def find_leftovers(self):
+        self.leftover_btn.setEnabled(False)
+        self._log("root@h4ck3r:~# find ~/Library -orphaned ...", source="disk")
+        apps = [it for it in self.all_items if it["kind"] != "Leftover"]
+        self.leftover_worker = LeftoverWorker(apps, self.library_index)
+        self.leftover_worker.progress.connect(self._on_progress)
+        self.leftover_worker.finished.connect(self._on_leftovers_done)
+        self.leftover_worker.failed.connect(self._on_leftovers_failed)
+        self.leftover_worker.start()
+
+    def _on_leftovers_failed(self, msg):
+        self.leftover_btn.setEnabled(True)
+        self._log(f"  [ERR] leftovers: {msg}\n", source="disk")
+        self.status_label.setText("[LEFTOVERS] refused: rescan first")
+
+    def _on_leftovers_done(self, groups, entries):
+        self.leftover_btn.setEnabled(True)
+        self.library_entries = entries
+        total = sum(g["bytes"] for g in groups)
+        self._log(f"  [LEFTOVERS] {len(entries)} Library entries, "
+                  f"{self.library_index.walked} dirs re-walked", source="disk")
+        for g in groups:
+            self._log(f"  {_fmt_bytes(g['bytes']):>10}  {g['key']}  ({len(g['paths'])} paths)",
+                      source="disk")
+        self._log(f"  [LEFTOVERS] {len(groups)} orphan groups, {_fmt_bytes(total)} reclaimable\n",
+                  source="disk")
+        # orphan groups become "Leftover" rows, checkable and removable like the rest
+        self.all_items[:] = [it for it in self.all_items if it["kind"] != "Leftover"]
+        self.all_items += [leftover_item(g["key"], g["paths"], g["bytes"]) for g in groups]
+        self.apply_filter()
+        self._update_stats()
+        self.status_label.setText(f"[LEFTOVERS] {len(groups)} groups, {_fmt_bytes(total)} "
+                                  f"reclaimable — filter TYPE: Leftover")
+
+    # ── dev cache pruning ──
+    def prune_caches(self):
+        caches = [it for it in self._get_checked_items() if it["kind"] == "Dev Cache"] \
+            or [it for it in self.all_items if it["kind"] == "Dev Cache"]
+        if not caches:
+            QMessageBox.warning(self, "[!] No Caches", "Run a scan first: no Dev Cache rows.")
+            return
+        days, ok = QInputDialog.getInt(self, "[PRUNE]", "Delete cache data older than (days):",
+                                       30, 1, 3650)
+        if not ok:
+            return
+        names = ", ".join(it["name"] for it in caches)
+        if QMessageBox.question(self, "[!] CONFIRM PRUNE",
+                                f"Delete everything not used in {days} days from:\n{names}?"
+                                ) != QMessageBox.StandardButton.Yes:
+            return
+        self.prune_btn.setEnabled(False)
+        self._log(f"root@h4ck3r:~# prune --older-than {days}d ({len(caches)} caches)",
+                  source="uninstall")
+        self.prune_worker = PruneWorker(caches, days)
+        self.prune_worker.progress.connect(self._on_progress)
+        self.prune_worker.log.connect(lambda msg: self._log(msg, source="uninstall"))
+        self.prune_worker.done.connect(self._on_prune_done)
+        self.prune_worker.start()
+
+    def _on_prune_done(self, results):
+        self.prune_btn.setEnabled(True)
+        for item, _, freed in results:
+            item["size_mb"] = round(max(item["size_mb"] - freed / (1024 * 1024), 0), 1)
+        total = sum(freed for _, _, freed in results)
+        self.apply_filter()
+        self._update_stats()
+        self.status_label.setText(f"[PRUNE] {_fmt_bytes(total)} freed")
+
+    def _uninstall_extras(self, items):
+        """Leftover rows for the Library data of the selected apps, from the last index."""
+        chosen = {p for it in items if it["kind"] == "Leftover" for p in it["meta"]["paths"]}
+        extras = []
+        for it in items:
+            if it["kind"] not in ("Application", "User App"):
+                continue
+            found = [e for e in app_leftovers(self.library_entries, it) if e["path"] not in chosen]
+            if found:
+                chosen.update(e["path"] for e in found)
+                extras.append(leftover_item(it["name"], [e["path"] for e in found],
+                                            sum(e["bytes"] for e in found)))
+        return extras
+
+    def open_treemap(self):
+        row = self.table.currentRow()
+        path = ""
+        if 0 <= row < self.table.rowCount():
+            cell = self.table.item(row, 7)
+            path = cell.text() if cell else ""
+        if not os.path.isdir(path):
+            path = "/Applications" if os.path.isdir("/Applications") else str(Path.home())
+        self._log(f"root@h4ck3r:~# treemap {path}")
+        HackerTreemapDialog(path, self).exec()
+
+    def _on_space_done(self, rows):
+        self.space_btn.setEnabled(True)
+        total = sum(r["size_mb"] for r in rows) or 1
+        for r in rows:
+            bar = "█" * int(r["size_mb"] * 30 / total)
+            self._log(f"  {r['category']:<18} {r['size_mb'] / 1024:>8.1f}G  {bar:<30}  "
+                      f"[{r['cached']} cached / {r['walked']} walked]", source="disk")
+        self._log("", source="disk")
+        self.status_label.setText("[SPACE] Breakdown written to terminal")
+        self.tabs.setCurrentIndex(2)
+
     # ── app scanning ──
     def start_scan(self):
-        self.scan_btn.setEnabled(False)
-        self.scan_btn.setText("  [SCANNING...]  ")
+        # clicking again while a scan runs restarts it
+        self._cancel_scan()
+        self.scan_btn.setText("  [RESTART SCAN]  ")
         self.table.setRowCount(0)
         self.all_items.clear()
+        self.outdated = {}
         self.progress.setFormat("[SCANNING] Enumerating all targets...")
-        self._log("root@h4ck3r:~# Initiating full system scan...")
-
-        self.worker = ScanWorker()
-        self.worker.progress.connect(self._on_progress)
+        self._log("root@h4ck3r:~# Initiating full system scan...", source="scan")
+        self.leftover_btn.setEnabled(False)
+        self.outdated_btn.setEnabled(False)
+        self._scanning = True
+
+        self._partial_sources = []
+        self._failed_sources = []
+        if self.daemon is not None:
+            self.worker = DaemonScanWorker(self.daemon)
+        elif self.engine:
+            self.worker = AsyncScanJob(self.engine)
+        else:
+            self.worker = ScanWorker(self.checkpoints)
+        self.worker.progress.connect(self._on_scan_progress)
+        self.worker.warning.connect(lambda msg: self._log(f"  {msg}", source="scan"))
+        self.worker.source_done.connect(self._on_source_done)
         self.worker.finished.connect(self._on_scan_done)
         self.worker.start()
 
+    def _cancel_scan(self):
+        """Cancel the running scan; it is kept referenced until its thread exits."""
+        self._retired_workers = [w for w in self._retired_workers if w.isRunning()]
+        if self.worker is not None and self.worker.isRunning():
+            for sig in (self.worker.progress, self.worker.warning,
+                        self.worker.source_done, self.worker.finished):
+                sig.disconnect()
+            self.worker.cancel()
+            self._retired_workers.append(self.worker)
+            self._log("  [ABORT] running scan cancelled", source="scan")
+        self.worker = None
+
+    def _on_scan_progress(self, pct, msg):
+        if self.sender() is not self.worker:
+            return  # late progress from a cancelled scan
+        self._on_progress(pct, msg)
+
     def _on_progress(self, pct, msg):
         self.progress.setValue(pct)
         self.progress.setFormat(msg)
         self.status_label.setText(msg)
-        self._log(f"  {msg}")
+        self._log(f"  {msg}", source="scan")
+
+    def _on_source_done(self, key, count, state):
+        if self.sender() is not self.worker:
+            return
+        if state == "resumed":
+            self._log(f"  [RESUME] {key}: {count} targets from checkpoint", source="scan")
+        elif state == "partial":
+            self._partial_sources.append(key)
+            self._log(f"  [WARN] {key}: deadline ({self.worker.deadline:.0f}s) hit, "
+                      f"{count} targets marked [PARTIAL]", source="scan")
+        elif state == "failed":
+            self._failed_sources.append(key)
 
     def _on_scan_done(self, items):
+        if self.sender() is not self.worker:
+            return  # late result from a cancelled scan
         self.all_items = items
+        self.outdated = {}
+        self._scanning = False
+        if self.usage_sampler is not None:
+            self.usage_sampler.set_items(items)
         self.apply_filter()
-        self.scan_btn.setEnabled(True)
         self.scan_btn.setText("  [SCAN ALL]  ")
+        self.outdated_btn.setEnabled(self.outdated_worker is None or not self.outdated_worker.isRunning())
         self.delete_btn.setEnabled(True)
         self.export_btn.setEnabled(True)
         self.count_label.setText(f"{len(items)} targets")
-        self._log(f"  [DONE] {len(items)} targets acquired\n")
+        self._log(f"  [DONE] {len(items)} targets acquired\n", source="scan")
+        if self._partial_sources:
+            self.status_label.setText(f"[PARTIAL] incomplete: {', '.join(self._partial_sources)}")
+        # leftovers need every installed app: not after a partial or failed app source,
+        # nor when no app was found at all (every ~/Library ID would look orphaned)
+        self.leftover_btn.setEnabled(
+            not {"applications", "user-applications"} & set(self._partial_sources + self._failed_sources)
+            and any(it["kind"] in APP_KINDS for it in items))
         self._update_stats()
+        if items and not isinstance(self.worker, DaemonScanWorker):  # the daemon snapshots its own
+            self.snapshot_worker = SnapshotWorker(list(items))
+            self.snapshot_worker.finished.connect(self._on_snapshot_saved)
+            self.snapshot_worker.start()
+
+    def _on_snapshot_saved(self, path):
+        if path:
+            self._log(f"  [SNAPSHOT] {path}", source="scan")
+
+    def open_diff(self):
+        HackerDiffDialog(SnapshotStore(), self).exec()
 
     def _update_stats(self):
         counts = {}
@@ -1255,74 +7424,91 @@ class HackerAppManager(QMainWindow):
 
     # ── filtering ──
     def apply_filter(self):
-        kind = self.filter_combo.currentText()
-        query = self.search_input.text().lower()
-        self.filtered_items = [
-            it for it in self.all_items
-            if (kind == "All" or it["kind"] == kind)
-            and (not query or query in it["name"].lower())
-        ]
+        self.filtered_rows = filter_indices(
+            self.all_items, self.filter_combo.currentText(), self.search_input.text())
         self._populate_table()
 
     def _populate_table(self):
-        self.table.setSortingEnabled(False)
-        self.table.setRowCount(len(self.filtered_items))
-        KIND_COLORS = {
-            "Application":   QColor(ROW_APP),
-            "User App":      QColor(ROW_APP),
-            "Brew Formula":  QColor(ROW_BREW_FORM),
-            "Brew Cask":     QColor(ROW_BREW_CASK),
-            "System Pkg":    QColor(ROW_SYSTEM),
-            "pip Package":   QColor(ROW_PIP),
-        }
-        KIND_TEXT = {
-            "Application":   QColor(NEON_GREEN),
-            "User App":      QColor(NEON_GREEN),
-            "Brew Formula":  QColor(NEON_YELLOW),
-            "Brew Cask":     QColor(NEON_CYAN),
-            "System Pkg":    QColor(NEON_RED),
-            "pip Package":   QColor(NEON_PURPLE),
-        }
-        for row, item in enumerate(self.filtered_items):
-            chk = QCheckBox()
-            chk.setStyleSheet(f"""
-                QCheckBox::indicator {{
-                    width: 14px; height: 14px;
-                    border: 1px solid {NEON_GREEN_DARK};
-                    background: {BG_DARKEST};
-                }}
-                QCheckBox::indicator:checked {{
-                    background: {NEON_GREEN};
-                }}
-            """)
-            chk_widget = QWidget()
-            chk_widget.setStyleSheet(f"background: transparent;")
-            chk_layout = QHBoxLayout(chk_widget)
-            chk_layout.addWidget(chk)
-            chk_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            chk_layout.setContentsMargins(0, 0, 0, 0)
-            self.table.setCellWidget(row, 0, chk_widget)
-
-            bg = KIND_COLORS.get(item["kind"], QColor(BG_TABLE))
-            fg = KIND_TEXT.get(item["kind"], QColor(NEON_GREEN))
-
-            for col, val in enumerate([
-                "", item["name"], item["version"],
-                f"{item['size_mb']}M" if item["size_mb"] else "-",
-                item["kind"],
-                item.get("path") or item["name"],
-            ]):
-                if col == 0:
-                    continue
-                cell = QTableWidgetItem(val)
-                cell.setBackground(bg)
-                cell.setForeground(fg)
-                self.table.setItem(row, col, cell)
-
-        self.table.setSortingEnabled(True)
-        self.count_label.setText(
-            f"{len(self.filtered_items)}/{len(self.all_items)} targets"
-        )
+        with TRACER.span("populate_table", "ui", rows=len(self.filtered_rows)):
+            self.table.setSortingEnabled(False)
+            self.table.setRowCount(len(self.filtered_rows))
+            KIND_COLORS = {
+                "Application":   QColor(ROW_APP),
+                "User App":      QColor(ROW_APP),
+                "Brew Formula":  QColor(ROW_BREW_FORM),
+                "Brew Cask":     QColor(ROW_BREW_CASK),
+                "System Pkg":    QColor(ROW_SYSTEM),
+                "pip Package":   QColor(ROW_PIP),
+                "Dev Cache":     QColor(ROW_PROCESS),
+                "Leftover":      QColor(ROW_SYSTEM),
+                **{src.kind: QColor(src.colors[0]) for src in PACKAGE_SOURCES},
+            }
+            KIND_TEXT = {
+                "Application":   QColor(NEON_GREEN),
+                "User App":      QColor(NEON_GREEN),
+                "Brew Formula":  QColor(NEON_YELLOW),
+                "Brew Cask":     QColor(NEON_CYAN),
+                "System Pkg":    QColor(NEON_RED),
+                "pip Package":   QColor(NEON_PURPLE),
+                "Dev Cache":     QColor(NEON_CYAN),
+                "Leftover":      QColor(NEON_ORANGE),
+                **{src.kind: QColor(src.colors[1]) for src in PACKAGE_SOURCES},
+            }
+            now = time.time()
+            for row, idx in enumerate(self.filtered_rows):
+                item = self.all_items[idx]
+                chk = QCheckBox()
+                chk.setStyleSheet(f"""
+                    QCheckBox::indicator {{
+                        width: 14px; height: 14px;
+                        border: 1px solid {NEON_GREEN_DARK};
+                        background: {BG_DARKEST};
+                    }}
+                    QCheckBox::indicator:checked {{
+                        background: {NEON_GREEN};
+                    }}
+                """)
+                chk_widget = QWidget()
+                chk_widget.setStyleSheet(f"background: transparent;")
+                chk_layout = QHBoxLayout(chk_widget)
+                chk_layout.addWidget(chk)
+                chk_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                chk_layout.setContentsMargins(0, 0, 0, 0)
+                self.table.setCellWidget(row, 0, chk_widget)
+
+                bg = KIND_COLORS.get(item["kind"], QColor(BG_TABLE))
+                fg = KIND_TEXT.get(item["kind"], QColor(NEON_GREEN))
+                latest = self.outdated.get((item["kind"], item["name"], item["version"]))
+                unused, per_hour = usage_cells(self.usage.stats(item, now))
+
+                for col, val in enumerate([
+                    "", item["name"],
+                    f"{item['version']} -> {latest}" if latest else item["version"],
+                    f"{item['size_mb']}M" if item["size_mb"] else "-",
+                    unused, per_hour,
+                    f"{item['kind']} [PARTIAL]" if item.get("partial") else item["kind"],
+                    item.get("path") or item["name"],
+                ]):
+                    if col == 0:
+                        continue
+                    if col in (4, 5):
+                        cell = SortKeyItem(val[0])
+                        cell.setData(Qt.ItemDataRole.UserRole, val[1])
+                    else:
+                        cell = QTableWidgetItem(val)
+                    cell.setBackground(bg)
+                    cell.setForeground(QColor(NEON_ORANGE) if col == 2 and latest else fg)
+                    if col == 1:
+                        # survives re-sorting, unlike the row number
+                        cell.setData(Qt.ItemDataRole.UserRole, idx)
+                        if item.meta:
+                            cell.setToolTip(bundle_meta_text(item.meta))
+                    self.table.setItem(row, col, cell)
+
+            self.table.setSortingEnabled(True)
+            self.count_label.setText(
+                f"{len(self.filtered_rows)}/{len(self.all_items)} targets"
+            )
 
     # ── select all / none ──
     def select_all(self):
@@ -1345,18 +7531,28 @@ class HackerAppManager(QMainWindow):
     def export_list(self):
         if not self.all_items:
             return
-        out_path = os.path.expanduser("~/Desktop/h4ck3r_export.txt")
-        with open(out_path, "w") as f:
-            f.write(f"# H4CK3R App Manager — Export\n")
-            f.write(f"# Date: {datetime.now().isoformat()}\n")
-            f.write(f"# Total: {len(self.all_items)} items\n")
-            f.write(f"{'='*80}\n\n")
-            for it in self.all_items:
-                f.write(f"[{it['kind']:<14}]  {it['name']:<40}  v{it['version']:<12}  "
-                        f"{it['size_mb']}MB\n")
-        self._log(f"root@h4ck3r:~# Exported to {out_path}")
+        fmt = self.export_fmt.currentData()
+        compress = self.export_gz.isChecked()
+        out_path = default_export_path(fmt, compress)
+        self.export_btn.setEnabled(False)
+        self._log(f"root@h4ck3r:~# export --format={fmt}{' --gzip' if compress else ''} {out_path}",
+                  source="export")
+        self.export_worker = ExportWorker(list(self.all_items), out_path, fmt, compress)
+        self.export_worker.progress.connect(self._on_progress)
+        self.export_worker.finished.connect(self._on_export_done)
+        self.export_worker.failed.connect(self._on_export_failed)
+        self.export_worker.start()
+
+    def _on_export_done(self, out_path, count):
+        self.export_btn.setEnabled(True)
+        self._log(f"  [OK] {count} records exported to {out_path}", source="export")
         self.status_label.setText(f"[EXPORT] Saved to {out_path}")
 
+    def _on_export_failed(self, err):
+        self.export_btn.setEnabled(True)
+        self._log(f"  [FAIL] export: {err}", source="export")
+        self.status_label.setText("[EXPORT] failed")
+
     # ── uninstall ──
     def _get_checked_items(self):
         checked = []
@@ -1365,7 +7561,8 @@ class HackerAppManager(QMainWindow):
             if w:
                 chk = w.findChild(QCheckBox)
                 if chk and chk.isChecked():
-                    checked.append(self.filtered_items[row])
+                    idx = self.table.item(row, 1).data(Qt.ItemDataRole.UserRole)
+                    checked.append(self.all_items[idx])
         return checked
 
     def uninstall_selected(self):
@@ -1377,9 +7574,10 @@ class HackerAppManager(QMainWindow):
             )
             return
 
-        dlg = HackerConfirmDialog(items, self)
+        dlg = HackerConfirmDialog(items, self, extras=self._uninstall_extras(items))
         if dlg.exec() != QDialog.DialogCode.Accepted or not dlg.result_action:
             return
+        items = items + dlg.chosen_extras()
 
         pw_dlg = HackerPasswordDialog(self)
         if pw_dlg.exec() != QDialog.DialogCode.Accepted:
@@ -1387,15 +7585,17 @@ class HackerAppManager(QMainWindow):
 
         self.delete_btn.setEnabled(False)
         self.tabs.setCurrentIndex(2)  # Switch to terminal
-        self._log("root@h4ck3r:~# ═══ UNINSTALL SEQUENCE INITIATED ═══")
+        self._log("root@h4ck3r:~# ═══ UNINSTALL SEQUENCE INITIATED ═══", source="uninstall")
 
-        self.uninst_worker = UninstallWorker(items, pw_dlg.password)
-        self.uninst_worker.log.connect(self._log)
+        self.uninst_worker = (AsyncUninstallJob(self.engine, items, pw_dlg.password) if self.engine
+                              else UninstallWorker(items, pw_dlg.password))
+        self.uninst_worker.log.connect(lambda msg: self._log(msg, source="uninstall"))
         self.uninst_worker.done.connect(self._on_uninst_done)
         self.uninst_worker.start()
 
     def _on_uninst_done(self, ok, fail):
-        self._log(f"\nroot@h4ck3r:~# ═══ COMPLETE: {ok} removed, {fail} failed ═══\n")
+        self._log(f"\nroot@h4ck3r:~# ═══ COMPLETE: {ok} removed, {fail} failed ═══\n",
+                  source="uninstall")
         self.delete_btn.setEnabled(True)
         self.status_label.setText(f"[DONE] {ok} removed, {fail} failed")
         QTimer.singleShot(1000, self.start_scan)
@@ -1404,8 +7604,9 @@ class HackerAppManager(QMainWindow):
     def scan_processes(self):
         self.proc_scan_btn.setEnabled(False)
         self.proc_scan_btn.setText("  [SCANNING...]  ")
-        self._log("root@h4ck3r:~# ps aux ...")
-        self.proc_worker = ProcessWorker()
+        self._log("root@h4ck3r:~# ps aux ...", source="process")
+        self.proc_worker = AsyncProcessJob(self.engine) if self.engine else ProcessWorker()
+        self.proc_worker.warning.connect(lambda msg: self._log(f"  {msg}", source="process"))
         self.proc_worker.finished.connect(self._on_proc_done)
         self.proc_worker.start()
 
@@ -1414,7 +7615,7 @@ class HackerAppManager(QMainWindow):
         self.filter_processes()
         self.proc_scan_btn.setEnabled(True)
         self.proc_scan_btn.setText("  [SCAN PROCESSES]  ")
-        self._log(f"  [DONE] {len(procs)} processes found\n")
+        self._log(f"  [DONE] {len(procs)} processes found\n", source="process")
 
     def filter_processes(self):
         query = self.proc_search.text().lower()
@@ -1472,18 +7673,435 @@ class HackerAppManager(QMainWindow):
         )
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                subprocess.run(["kill", "-9", pid], timeout=5)
-                self._log(f"root@h4ck3r:~# kill -9 {pid}  [OK]")
+                RUNNER.run(["kill", "-9", pid], timeout=5)
+                self._log(f"root@h4ck3r:~# kill -9 {pid}  [OK]", source="process")
                 self.status_label.setText(f"[KILLED] PID {pid}")
                 QTimer.singleShot(500, self.scan_processes)
-            except Exception as e:
-                self._log(f"  [FAIL] {e}")
+            except CommandError as e:
+                self._log(f"  [FAIL] {e}", source="process")
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 #  ENTRY POINT
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+def cmd_scan(args):
+    if args.govern:
+        GOVERNOR.configure()
+    engine = AsyncEngine(max_procs=args.max_procs, deadline=args.deadline,
+                         checkpoints=None if args.fresh else ScanCheckpoints())
+    token = CancelToken()
+
+    def say(*parts):
+        print(*parts, file=sys.stderr)
+
+    t0 = time.perf_counter()
+    try:
+        items = asyncio.run(engine.scan(token, lambda pct, msg: say(f"  [{pct:>3}%] {msg}"), say))
+    except KeyboardInterrupt:
+        token.cancel()
+        say("  [ABORT] scan cancelled; finished sources are checkpointed")
+        return 130
+    finally:
+        engine.close()
+    counts = {}
+    for it in items:
+        counts[it["kind"]] = counts.get(it["kind"], 0) + 1
+    for kind, n in sorted(counts.items()):
+        say(f"  {kind:<14} {n:>7}")
+    partial = sum(1 for it in items if it.get("partial"))
+    say(f"  [DONE] {len(items)} targets in {time.perf_counter() - t0:.1f}s"
+        + (f", {partial} [PARTIAL]" if partial else ""))
+    if GOVERNOR.enabled:
+        gov = GOVERNOR.snapshot()
+        say(f"  [GOVERN] {gov['files']} files, throttled {gov['throttled_s']}s, "
+            f"paused {gov['paused_s']}s ({gov['pauses']} pauses)")
+    if items and not args.no_snapshot:
+        say(f"  [SNAPSHOT] {SnapshotStore().save(items)}")
+    if args.metrics_file:
+        DiskWorker.collect()
+        METRICS.write_textfile(args.metrics_file)
+        say(f"  [METRICS] {args.metrics_file}")
+    if args.out == "-":
+        for item in items:
+            print(json.dumps({"record": "item", **export_row(item)}))
+    elif args.out:
+        export_inventory(items, args.out, args.format, args.out.endswith(".gz"))
+        say(f"  [EXPORT] {args.out}")
+    return 0
+
+
+def cmd_daemon(args):
+    GOVERNOR.configure(not args.no_govern)
+    engine = AsyncEngine(max_procs=args.max_procs, checkpoints=ScanCheckpoints())
+    daemon = InventoryDaemon(engine, watch_interval=args.watch_interval,
+                             log=lambda msg: print(msg, file=sys.stderr, flush=True),
+                             metrics_file=args.metrics_file)
+    try:
+        asyncio.run(daemon.serve(args.address, scan=not args.no_scan))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    except OSError as e:
+        print(f"[ERR] {e}", file=sys.stderr)
+        return 2
+    finally:
+        engine.close()
+    return 0
+
+
+def cmd_query(args):
+    params = {}
+    for arg in args.params:
+        key, sep, value = arg.partition("=")
+        if not sep:
+            print(f"[ERR] expected key=value, got {arg!r}", file=sys.stderr)
+            return 2
+        params[key] = value
+    client = DaemonClient(args.address)
+    try:
+        if args.method == "inventory" and args.all:
+            result = client.inventory(params.get("kind", "All"), params.get("q", ""))
+        else:
+            result = client.call(args.method, **params)
+    except (RpcError, PermissionError) as e:
+        print(f"[ERR] {e}", file=sys.stderr)
+        return 2
+    except OSError as e:
+        print(f"[ERR] no daemon at {client.address}: {e}", file=sys.stderr)
+        return 2
+    json.dump(result, sys.stdout, indent=1)
+    print()
+    return 0
+
+
+def cmd_snapshots(args):
+    for snap in SnapshotStore().list():
+        print(snap.name.replace(".json.gz", ""))
+    return 0
+
+
+def cmd_diff(args):
+    store = SnapshotStore()
+    try:
+        old = load_inventory(store.resolve(args.old))
+        new = load_inventory(store.resolve(args.new))
+    except (OSError, ValueError) as e:
+        print(f"[ERR] {e}", file=sys.stderr)
+        return 2
+    diff = diff_inventories(old, new)
+    if args.json:
+        json.dump(diff, sys.stdout, indent=1)
+        print()
+    else:
+        print("\n".join(format_diff(diff)))
+    return 0
+
+
+def cmd_refresh_index(args):
+    index = PackageIndex().load()
+    try:
+        for path in args.imports or ():
+            index.import_file(path)
+        if not args.imports and not args.no_brew:
+            index.refresh_brew()
+        if not args.imports and not args.no_pypi:
+            snaps = SnapshotStore().list()
+            names = [it["name"] for it in (load_inventory(snaps[-1]) if snaps else [])
+                     if it["kind"] == "pip Package"]
+            index.refresh_pypi(names)
+        index.save()
+    except (OSError, ValueError) as e:
+        print(f"[ERR] {e}", file=sys.stderr)
+        return 2
+    for source, table in sorted(index.sources.items()):
+        print(f"{source:<13} {len(table):>7} packages  (refreshed {index.refreshed.get(source, '?')})")
+    return 0
+
+
+def cmd_outdated(args):
+    try:
+        items = load_inventory(SnapshotStore().resolve(args.snapshot))
+    except (OSError, ValueError) as e:
+        print(f"[ERR] {e}", file=sys.stderr)
+        return 2
+    index = PackageIndex().load()
+    if not index.sources:
+        print("[ERR] no package index; run refresh-index first", file=sys.stderr)
+        return 2
+    outdated = index.outdated(items)
+    rows = sorted(({"kind": items[p]["kind"], "name": items[p]["name"],
+                    "version": items[p]["version"], "latest": latest}
+                   for p, latest in outdated.items()), key=lambda r: (r["kind"], r["name"]))
+    if args.json:
+        json.dump(rows, sys.stdout, indent=1)
+        print()
+    else:
+        for r in rows:
+            print(f"{r['kind']:<13} {r['name']:<32} {r['version']} -> {r['latest']}")
+    return 0
+
+
+def cmd_caches(args):
+    items = ScanWorker()._scan_dev_caches(token=CancelToken())
+    cutoff = time.time() - args.prune * 86400 if args.prune else None
+    for item in sorted(items, key=lambda it: it["size_mb"], reverse=True):
+        newest = max(item.meta.get("newest_mtime", 0), item.meta.get("newest_atime", 0))
+        age = f"{(time.time() - newest) / 86400:.0f}d" if newest else "-"
+        line = f"{item['size_mb']:>10.1f}M  {age:>6}  {item['name']:<22} {item['path']}"
+        if cutoff is not None:
+            removed, freed = prune_cache(item["path"], PRUNE_UNITS[item["name"]], cutoff,
+                                         dry_run=args.dry_run)
+            line += f"  -> {removed} {'would go' if args.dry_run else 'removed'}, {_fmt_bytes(freed)}"
+        print(line)
+    return 0
+
+
+def cmd_usage(args):
+    try:
+        items = load_inventory(SnapshotStore().resolve(args.snapshot))
+    except (OSError, ValueError) as e:
+        print(f"[ERR] {e}", file=sys.stderr)
+        return 2
+    store = UsageStore().load()
+    if args.watch:
+        sampler = UsageSampler(store, interval=args.interval)
+        sampler.set_items(items)
+        print(f"sampling every {args.interval:.0f}s into {store.path}; Ctrl-C stops",
+              file=sys.stderr)
+        try:
+            sampler.run()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            store.save()
+        return 0
+    now, rows = time.time(), []
+    for it in items:
+        idle, never, per_hour = store.stats(it, now)
+        if idle is None or idle < args.days:
+            continue
+        entry = store.items.get(it["path"]) or [0, None, None]
+        rows.append({"kind": it["kind"], "name": it["name"], "size_mb": it["size_mb"],
+                     "unused_days": round(idle, 1), "never_seen": never,
+                     "hours_used": round(entry[0] / 3600, 2),
+                     "mb_per_hour": round(per_hour, 1) if per_hour is not None else None})
+    rows.sort(key=lambda r: (r["never_seen"], r["unused_days"], r["size_mb"]), reverse=True)
+    if args.json:
+        json.dump(rows, sys.stdout, indent=1)
+        print()
+        return 0
+    for r in rows:
+        unused = f"{r['unused_days']:.0f}d{'+' if r['never_seen'] else ''}"
+        per_hour = "never" if r["mb_per_hour"] is None else f"{r['mb_per_hour']:.1f}"
+        print(f"{unused:>6}  {r['hours_used']:>8.1f}h  {per_hour:>9} MB/h  {r['size_mb']:>9.1f}M  "
+              f"{r['kind']:<13} {r['name']}")
+    if store.started:
+        print(f"tracking since {datetime.fromtimestamp(store.started):%Y-%m-%d %H:%M}",
+              file=sys.stderr)
+    return 0
+
+
+def cmd_slim(args):
+    try:
+        items = load_inventory(SnapshotStore().resolve(args.snapshot))
+    except (OSError, ValueError) as e:
+        print(f"[ERR] {e}", file=sys.stderr)
+        return 2
+    analyzer = SlimAnalyzer().load()
+    rows = analyzer.run(slim_roots(items), keep=args.keep, workers=args.workers)
+    analyzer.save()
+    if args.json:
+        json.dump(rows, sys.stdout, indent=1)
+        print()
+        return 0
+    for r in rows:
+        if r["macho_files"]:
+            archs = " ".join(f"{a}={_fmt_bytes(n)}" for a, n in sorted(r["by_arch"].items()))
+            print(f"{_fmt_bytes(r['reclaimable']):>10}  {r['fat_files']:>4}/{r['macho_files']:<4} "
+                  f"{r['path']}  {archs}")
+    print(f"{_fmt_bytes(sum(r['reclaimable'] for r in rows))} reclaimable keeping "
+          f"{args.keep or host_arch()}; {analyzer.parsed} files read", file=sys.stderr)
+    return 0
+
+
+def cmd_receipts(args):
+    try:
+        RECEIPTS.ensure()
+    except CommandError as e:
+        print(f"[ERR] {e}", file=sys.stderr)
+        return 2
+    unknown = [p for p in args.pkgs if p not in RECEIPTS.pkgs]
+    if unknown:
+        print(f"[ERR] no receipt: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    plan = RECEIPTS.plan(args.pkgs)
+    if args.list:
+        print("\n".join(plan["files"] + plan["dirs"]))
+    print(f"{len(plan['files'])} files, {len(plan['dirs'])} dirs, {_fmt_bytes(plan['bytes'])} "
+          f"owned only by {', '.join(args.pkgs)}; {plan['shared']} shared, "
+          f"{plan['missing']} already gone ({RECEIPTS.listed}/{len(RECEIPTS.pkgs)} receipts listed)",
+          file=sys.stderr if args.list else sys.stdout)
+    return 0
+
+
+def cmd_fleet_build(args):
+    paths = []
+    for p in args.inputs:
+        if os.path.isdir(p):
+            paths += sorted(str(c) for c in Path(p).iterdir()
+                            if c.is_file() and not c.name.startswith("."))
+        else:
+            paths.append(p)
+    t0 = time.perf_counter()
+
+    def progress(done, total):
+        if done % 500 == 0 or done == total:
+            print(f"\r  [{done}/{total}] files ingested", end="", file=sys.stderr)
+
+    skipped = []
+
+    def warn(path, reason):
+        skipped.append(path)
+        print(f"\r  [SKIP] {path}: {reason}", file=sys.stderr)
+
+    index = FleetIndex.build(paths, args.jobs, progress, warn)
+    print(file=sys.stderr)
+    index.save(args.index)
+    print(f"  [OK] {len(index.hosts)} hosts, {len(index.kinds)} rows -> {args.index} "
+          f"({time.perf_counter() - t0:.1f}s)" + (f"; {len(skipped)} files skipped" if skipped else ""))
+    return 0
+
+
+def cmd_fleet_query(args):
+    index = FleetIndex.load(args.index)
+    if args.expr:
+        for expr in args.expr:
+            print("\n".join(fleet_query(index, expr)))
+        return 0
+    print(FLEET_HELP)
+    while True:
+        try:
+            line = input("fleet> ")
+        except EOFError:
+            print()
+            return 0
+        if line.strip() in ("quit", "exit"):
+            return 0
+        t0 = time.perf_counter()
+        try:
+            out = fleet_query(index, line)
+        except (ValueError, IndexError) as e:
+            out = [f"[ERR] {e}"]
+        print("\n".join(out))
+        if out:
+            print(f"  ({(time.perf_counter() - t0) * 1000:.1f} ms)")
+
+
+def build_cli():
+    parser = argparse.ArgumentParser(
+        prog="xp_app_manager.py",
+        description="H4CK3R App Manager.  Without a command the GUI starts.",
+    )
+    sub = parser.add_subparsers(dest="command")
+    p = sub.add_parser("scan", help="headless inventory scan on the asyncio engine")
+    p.add_argument("-o", "--out", help="export file (format from -f, gzip if it ends in .gz; "
+                                       "'-' = JSON Lines items on stdout)")
+    p.add_argument("-f", "--format", choices=sorted(EXPORT_WRITERS), default="jsonl")
+    p.add_argument("--deadline", type=float, default=SCAN_DEADLINE_S,
+                   help="seconds per source before its results are kept as partial")
+    p.add_argument("--max-procs", type=int, default=None, help="concurrent commands (default 32)")
+    p.add_argument("--fresh", action="store_true", help="ignore checkpoints of an interrupted scan")
+    p.add_argument("--no-snapshot", action="store_true", help="do not save a snapshot")
+    p.add_argument("--govern", action="store_true",
+                   help="background priority and rate limits (APP_HOME/governor.json)")
+    p.add_argument("--metrics-file", default=METRICS_FILE,
+                   help="write Prometheus metrics here when done (node_exporter textfile)")
+    p.set_defaults(func=cmd_scan)
+    p = sub.add_parser("daemon", help="serve inventory, processes, disk and diffs to the GUI and scripts")
+    p.add_argument("--address", default=DAEMON_ADDRESS,
+                   help="Unix socket path or http://127.0.0.1:PORT (default: %(default)s)")
+    p.add_argument("--watch-interval", type=float, default=60,
+                   help="seconds between source change checks (default: %(default)s)")
+    p.add_argument("--no-scan", action="store_true", help="serve the newest snapshot; scan on request")
+    p.add_argument("--max-procs", type=int, default=None, help="concurrent commands (default 32)")
+    p.add_argument("--no-govern", action="store_true",
+                   help="scan at full speed instead of under the governor")
+    p.add_argument("--metrics-file", default=METRICS_FILE,
+                   help="keep Prometheus metrics in this textfile too (GET /metrics always works)")
+    p.set_defaults(func=cmd_daemon)
+    p = sub.add_parser("query", help="call a daemon method: status, inventory, scan, processes, disk, "
+                                     "diff, snapshots")
+    p.add_argument("method")
+    p.add_argument("params", nargs="*", metavar="KEY=VALUE",
+                   help="e.g. kind='Brew Formula' q=ssl offset=0 limit=100")
+    p.add_argument("--all", action="store_true", help="inventory: fetch every page")
+    p.add_argument("--address", default=DAEMON_ADDRESS, help="daemon socket or URL")
+    p.set_defaults(func=cmd_query)
+    p = sub.add_parser("snapshots", help="list saved scan snapshots")
+    p.set_defaults(func=cmd_snapshots)
+    p = sub.add_parser("diff", help="diff two snapshots or JSONL exports")
+    p.add_argument("old", nargs="?", default="-2",
+                   help="snapshot id, index or file (default: previous)")
+    p.add_argument("new", nargs="?", default="-1",
+                   help="snapshot id, index or file (default: latest)")
+    p.add_argument("--json", action="store_true", help="machine-readable output")
+    p.set_defaults(func=cmd_diff)
+    p = sub.add_parser("refresh-index", help="rebuild the local package index used by 'outdated'")
+    p.add_argument("--import", dest="imports", action="append", metavar="FILE",
+                   help="merge a Homebrew API/info JSON dump or a {name: version} PyPI snapshot "
+                        "instead of fetching")
+    p.add_argument("--no-brew", action="store_true", help="skip Homebrew")
+    p.add_argument("--no-pypi", action="store_true", help="skip PyPI")
+    p.set_defaults(func=cmd_refresh_index)
+    p = sub.add_parser("outdated", help="packages with newer versions in the local index (offline)")
+    p.add_argument("snapshot", nargs="?", default="-1",
+                   help="snapshot id, index or file (default: latest)")
+    p.add_argument("--json", action="store_true", help="machine-readable output")
+    p.set_defaults(func=cmd_outdated)
+    p = sub.add_parser("caches", help="developer caches: size, age, optional age-based prune")
+    p.add_argument("--prune", type=int, metavar="DAYS", help="delete data unused for DAYS days")
+    p.add_argument("--dry-run", action="store_true", help="with --prune: only count")
+    p.set_defaults(func=cmd_caches)
+    p = sub.add_parser("usage", help="unused installs: days since last run and MB per hour of use")
+    p.add_argument("snapshot", nargs="?", default="-1",
+                   help="snapshot id, index or file (default: latest)")
+    p.add_argument("--days", type=float, default=0, help="only items unused for at least DAYS")
+    p.add_argument("--watch", action="store_true",
+                   help="sample running processes into the usage store until interrupted")
+    p.add_argument("--interval", type=float, default=USAGE_INTERVAL or 60,
+                   help="with --watch: seconds between samples")
+    p.add_argument("--json", action="store_true", help="machine-readable output")
+    p.set_defaults(func=cmd_usage)
+    p = sub.add_parser("slim", help="universal-binary report: bytes per architecture per bundle")
+    p.add_argument("snapshot", nargs="?", default="-1",
+                   help="snapshot id, index or file (default: latest)")
+    p.add_argument("--keep", metavar="ARCH", help=f"architecture to keep (default: {host_arch()})")
+    p.add_argument("-j", "--workers", type=int, help="worker processes (default: CPU count)")
+    p.add_argument("--json", action="store_true", help="machine-readable output")
+    p.set_defaults(func=cmd_slim)
+    p = sub.add_parser("receipts", help="files and bytes that removing system packages would free")
+    p.add_argument("pkgs", nargs="+", help="receipt IDs (pkgutil --pkgs)")
+    p.add_argument("-l", "--list", action="store_true", help="print the paths that would be deleted")
+    p.set_defaults(func=cmd_receipts)
+    p = sub.add_parser("fleet-build", help="merge many exports into one fleet index")
+    p.add_argument("index", help="output index file (SQLite)")
+    p.add_argument("inputs", nargs="+", help="export files or directories of them")
+    p.add_argument("-j", "--jobs", type=int, default=None, help="parser processes")
+    p.set_defaults(func=cmd_fleet_build)
+    p = sub.add_parser("fleet", help="query a fleet index (interactive without -e)")
+    p.add_argument("index", help="index built by fleet-build")
+    p.add_argument("-e", "--expr", action="append", help="run one query and exit")
+    p.set_defaults(func=cmd_fleet_query)
+    return parser
+
+
 def main():
+    # Qt's own flags (-platform, -style, ...) start with "-"; commands don't
+    if sys.argv[1:2] and (not sys.argv[1].startswith("-") or sys.argv[1] in ("-h", "--help")):
+        args = build_cli().parse_args()
+        sys.exit(args.func(args))
+
+    boot = StartupProfile()
+    boot.mark("imports")
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
 
@@ -1505,7 +8123,9 @@ def main():
     app.setStyleSheet(HACKER_CSS)
     app.setFont(QFont("Menlo", 12))
 
-    window = HackerAppManager()
+    boot.mark("qapp")
+
+    window = HackerAppManager(boot)
     window.show()
     sys.exit(app.exec())
 